@@ -6,6 +6,7 @@ References
 https://www.cs.cornell.edu/~arb/data/cat-edge-DAWN/
 """
 
+import sys
 from collections import Counter
 from pathlib import Path
 
@@ -13,6 +14,13 @@ import toponetx as tnx
 from more_itertools import first
 from rich.progress import track
 
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    open_atomic,
+    record_run,
+    resume_requested,
+)
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
@@ -33,6 +41,12 @@ dataset_file = root_dir / "public" / "datasets" / "DAWN.txt"
 datasheet_file = root_dir / "src" / "datasets" / "DAWN.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 nodes, hyperedges = tnx.datasets.benson.load_benson_hyperedges(
     root_dir / "data" / "cat-edge-DAWN"
 )
@@ -58,9 +72,15 @@ update_frontmatter(
 )
 
 # write dataset file
-with dataset_file.open("w") as f:
+with open_atomic(dataset_file) as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
     for node in track(nodes, description="Writing nodes"):
         write_node(f, first(node), party=node["label"])
     for hyperedge in track(hyperedges, description="Writing hyperedges"):
         write_edge(f, hyperedge, label=hyperedge["label"])
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
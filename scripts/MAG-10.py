@@ -6,20 +6,26 @@ References
 https://www.cs.cornell.edu/~arb/data/cat-edge-MAG-10/
 """
 
-import gzip
-from collections import Counter, defaultdict
-from itertools import chain
+import os
+import sys
 from pathlib import Path
 
 from more_itertools import first
 from rich.progress import track
 
 from .benson import load_benson_hyperedges
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
+from .utils.dataset_statistics import StatisticsAccumulator
+from .utils.partition import DatasetPartition
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
-    write_edge,
-    write_node,
 )
 from .utils.yaml import patch_dumper
 
@@ -30,50 +36,51 @@ dataset_file = root_dir / "public" / "datasets" / "MAG-10.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / "MAG-10.mdx"
 revision = 1
 
-nodes, hyperedges = load_benson_hyperedges(root_dir / "data" / "cat-edge-MAG-10")
-
-node_degrees = defaultdict(int)
-edge_degree_counts = defaultdict(int)
-
-# write dataset file
-covered_nodes = set(chain.from_iterable(hyperedge.elements for hyperedge in hyperedges))
-with gzip.open(dataset_file, "wt") as f:
-    write_dataset_metadata(f, datasheet_file.stem, revision)
-    for node in track(map(first, nodes), description="Writing nodes"):
-        if node in covered_nodes:
-            continue
-        write_node(f, node)
-
-    for hyperedge in track(hyperedges, description="Writing hyperedges"):
-        write_edge(f, hyperedge, conference=hyperedge["label"])
-
-        for node in hyperedge.elements:
-            node_degrees[node] += 1
-
-        edge_degree_counts[len(hyperedge.elements)] += 1
-
-node_degree_counts = defaultdict(int)
-for d in node_degrees.values():
-    node_degree_counts[d] += 1
-node_degree_histogram = dict(sorted(node_degree_counts.items()))
-
-edge_degree_histogram = dict(sorted(edge_degree_counts.items()))
-
-edge_label_counts = Counter(x["label"] for x in hyperedges)
-
-# write dataset metadata into existing frontmatter
-update_frontmatter(
-    datasheet_file,
-    {
-        "attachments": {
-            f"revision-{revision}": {"ahorn": dataset_file.name},
+# The parse workers import this module, so the script only runs as the main module.
+if __name__ == "__main__":
+    if resume_requested() and is_run_complete(
+        datasheet_file.stem, manifest=default_manifest(dataset_file)
+    ):
+        print(
+            f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged."
+        )
+        sys.exit()
+
+    nodes, hyperedges = load_benson_hyperedges(
+        root_dir / "data" / "cat-edge-MAG-10", workers=os.cpu_count() or 1
+    )
+
+    statistics = StatisticsAccumulator(edge_label_key="conference")
+
+    # write dataset file; the hyperedges are spooled until the isolated nodes are known
+    with DatasetPartition(statistics=statistics) as partition:
+        for hyperedge in track(hyperedges, description="Writing hyperedges"):
+            partition.write_edge(hyperedge, conference=hyperedge["label"])
+
+        with open_gzip(dataset_file, "wt") as f:
+            write_dataset_metadata(f, datasheet_file.stem, revision)
+            partition.write_to(
+                f, (node for node in map(first, nodes) if node not in partition)
+            )
+
+    print(f"Attribute payload cache: {partition.cache_info()}")
+
+    edge_label_counts = statistics.edge_label_counts
+
+    # write dataset metadata into existing frontmatter
+    update_frontmatter(
+        datasheet_file,
+        {
+            "attachments": {
+                f"revision-{revision}": {"ahorn": dataset_file.name},
+            },
+            "statistics": statistics.statistics(),
+            "edge-label-count": dict(edge_label_counts),
         },
-        "statistics": {
-            "num-nodes": len(nodes),
-            "num-interactions": len(hyperedges),
-            "node-degrees": node_degree_histogram,
-            "edge-degrees": edge_degree_histogram,
-        },
-        "edge-label-count": dict(edge_label_counts),
-    },
-)
+    )
+
+    record_run(
+        datasheet_file.stem,
+        [dataset_file, datasheet_file],
+        manifest=default_manifest(dataset_file),
+    )
@@ -9,7 +9,6 @@ References
 https://github.com/machawk1/MANTRA
 """
 
-import gzip
 import json
 from collections import defaultdict
 from pathlib import Path
@@ -17,7 +16,15 @@ from typing import Any
 
 from rich.progress import track
 
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
 from .utils.boxplot import compute_boxplot_stats
+from .utils.compression import open_gzip
+from .utils.network_index import NetworkIndex, index_path_for
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
@@ -32,6 +39,9 @@ patch_dumper()
 root_dir = Path(__file__).parent.parent
 data_dir = root_dir / "data" / "MANTRA"
 revision = 1
+# Number of manifolds per gzip member. Each group can be decompressed on its own, using
+# the offsets in the sidecar index.
+networks_per_member = 16
 
 
 def extract_manifold_metadata(manifold: dict[str, Any]) -> dict[str, Any]:
@@ -56,6 +66,15 @@ for dimension in [2, 3]:
         root_dir / "public" / "datasets" / f"MANTRA-{dimension}-manifolds.txt.gz"
     )
     datasheet_file = root_dir / "src" / "datasets" / f"MANTRA-{dimension}-manifolds.mdx"
+    index_file = index_path_for(dataset_file)
+    manifest_file = default_manifest(dataset_file)
+    if resume_requested() and is_run_complete(
+        datasheet_file.stem, manifest=manifest_file
+    ):
+        print(
+            f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged."
+        )
+        continue
 
     # Load manifolds from JSON
     with json_file.open() as f:
@@ -71,7 +90,8 @@ for dimension in [2, 3]:
     avg_degrees: list[float] = []
     degrees_total: defaultdict[int, int] = defaultdict(int)
 
-    with gzip.open(dataset_file, "wt") as f:
+    index = NetworkIndex(networks_per_member=networks_per_member)
+    with open_gzip(dataset_file, "wt") as f:
         write_dataset_metadata(
             f,
             f"MANTRA-{dimension}-manifolds",
@@ -84,6 +104,7 @@ for dimension in [2, 3]:
         for manifold in track(
             manifolds, description=f"Processing {dimension}-manifolds"
         ):
+            index.start_network(f, manifold["id"])
             write_network_metadata(f, **extract_manifold_metadata(manifold))
 
             degrees: defaultdict[int, int] = defaultdict(int)
@@ -115,6 +136,8 @@ for dimension in [2, 3]:
 
             avg_degrees.append(sum(degrees.values()) / len(degrees))
 
+    index.write(index_file, f)
+
     # Calculate statistics for this dimension
     num_nodes = len(degrees_total)
     num_manifolds = len(manifolds)
@@ -134,7 +157,16 @@ for dimension in [2, 3]:
                 "avg-degree": avg_degrees,
             },
             "attachments": {
-                f"revision-{revision}": {"ahorn": dataset_file.name},
+                f"revision-{revision}": {
+                    "ahorn": dataset_file.name,
+                    "index": index_file.name,
+                },
             },
         },
     )
+
+    record_run(
+        datasheet_file.stem,
+        [dataset_file, index_file, datasheet_file],
+        manifest=manifest_file,
+    )
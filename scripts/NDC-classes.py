@@ -6,15 +6,22 @@ References
 https://www.cs.cornell.edu/~arb/data/NDC-classes/
 """
 
-import gzip
+import sys
 from collections import Counter, defaultdict
-from datetime import date, timedelta
 from pathlib import Path
 
 from more_itertools import first
 from rich.progress import track
 
 from .benson import load_benson_sc_nodes, load_benson_simplices
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
+from .utils.timestamps import format_dates
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
@@ -30,33 +37,37 @@ dataset_file = root_dir / "public" / "datasets" / "NDC-classes.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / "NDC-classes.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 nodes = load_benson_sc_nodes(root_dir / "data" / "NDC-classes-full")
 hyperedges = load_benson_simplices(root_dir / "data" / "NDC-classes-full")
 
+# TODO: The timestamp format is not clear to me. ChatGPT suggested that it could be
+# .NET like timestamp in milliseconds since year 1.
+days = format_dates(
+    [hyperedge["time"] for hyperedge in hyperedges], epoch="dotnet", unit="ms"
+)
+
 # write dataset file
-daily_hyperedges = defaultdict(list)
 degrees = defaultdict(int)
-with gzip.open(dataset_file, "wt") as f:
+with open_gzip(dataset_file, "wt") as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
 
     for node in track(nodes, description="Writing nodes"):
         write_node(f, first(node.elements), category=node["label"])
 
     for hyperedge in track(hyperedges, description="Writing simplices"):
-        # TODO: The timestamp format is not clear to me. ChatGPT suggested that it
-        # could be .NET like timestamp in milliseconds since year 1.
-        ms = int(hyperedge["time"])
-        day = date(1, 1, 1) + timedelta(milliseconds=ms)
-        daily_hyperedges[day].append(hyperedge)
         # update node degrees
         for nid in hyperedge.elements:
             degrees[nid] += 1
         write_edge(f, hyperedge, **hyperedge._attributes)
 
 # calculate shapes for each day
-num_hyperedges = {}
-for day, hyperedges_on_day in daily_hyperedges.items():
-    num_hyperedges[day] = len(hyperedges_on_day)
+num_hyperedges = Counter(days)
 
 # write shape into existing frontmatter
 degree_histogram = Counter(degrees.values())
@@ -71,6 +82,12 @@ update_frontmatter(
         "attachments": {
             f"revision-{revision}": {"ahorn": dataset_file.name},
         },
-        "shape": {str(day): shape for day, shape in num_hyperedges.items()},
+        "shape": dict(num_hyperedges),
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
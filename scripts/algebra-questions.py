@@ -6,20 +6,25 @@ References
 https://www.cs.cornell.edu/~arb/data/cat-edge-algebra-questions/
 """
 
-import gzip
-from collections import Counter, defaultdict
-from itertools import chain
+import sys
 from pathlib import Path
 
 from more_itertools import first
 from rich.progress import track
 
 from .benson import load_benson_hyperedges
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
+from .utils.dataset_statistics import StatisticsAccumulator
+from .utils.partition import DatasetPartition
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
-    write_edge,
-    write_node,
 )
 from .utils.yaml import patch_dumper
 
@@ -30,38 +35,32 @@ dataset_file = root_dir / "public" / "datasets" / "algebra-questions.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / "algebra-questions.mdx"
 revision = 2
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 nodes, hyperedges = load_benson_hyperedges(
     root_dir / "data" / "cat-edge-algebra-questions"
 )
 
-node_degrees = defaultdict(int)
-edge_degree_counts = defaultdict(int)
-
-# write dataset file
-covered_nodes = set(chain.from_iterable(hyperedge.elements for hyperedge in hyperedges))
-with gzip.open(dataset_file, "wt") as f:
-    write_dataset_metadata(f, datasheet_file.stem, revision)
-    for node in track(map(first, nodes), description="Writing nodes"):
-        if node in covered_nodes:
-            continue
-        write_node(f, node)
+statistics = StatisticsAccumulator(edge_label_key="category")
 
+# write dataset file; the hyperedges are spooled until the isolated nodes are known
+with DatasetPartition(statistics=statistics) as partition:
     for hyperedge in track(hyperedges, description="Writing hyperedges"):
-        write_edge(f, hyperedge, category=hyperedge["label"])
-
-        for node in hyperedge.elements:
-            node_degrees[node] += 1
+        partition.write_edge(hyperedge, category=hyperedge["label"])
 
-        edge_degree_counts[len(hyperedge.elements)] += 1
+    with open_gzip(dataset_file, "wt") as f:
+        write_dataset_metadata(f, datasheet_file.stem, revision)
+        partition.write_to(
+            f, (node for node in map(first, nodes) if node not in partition)
+        )
 
-node_degree_counts = defaultdict(int)
-for d in node_degrees.values():
-    node_degree_counts[d] += 1
-node_degree_histogram = dict(sorted(node_degree_counts.items()))
+print(f"Attribute payload cache: {partition.cache_info()}")
 
-edge_degree_histogram = dict(sorted(edge_degree_counts.items()))
-
-edge_label_counts = Counter(x["label"] for x in hyperedges)
+edge_label_counts = statistics.edge_label_counts
 
 update_frontmatter(
     datasheet_file,
@@ -69,12 +68,13 @@ update_frontmatter(
         "attachments": {
             f"revision-{revision}": {"ahorn": dataset_file.name},
         },
-        "statistics": {
-            "num-nodes": len(nodes),
-            "num-interactions": len(hyperedges),
-            "node-degrees": node_degree_histogram,
-            "edge-degrees": edge_degree_histogram,
-        },
+        "statistics": statistics.statistics(),
         "edge-label-count": dict(sorted(edge_label_counts.items())),
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
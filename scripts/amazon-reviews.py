@@ -6,19 +6,27 @@ References
 https://www.cs.cornell.edu/~arb/data/amazon-reviews/
 """
 
-import gzip
-from collections import Counter, defaultdict
+import os
+import sys
 from pathlib import Path
 
 from more_itertools import first
 from rich.progress import track
 
 from .benson import load_benson_hyperedges
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.columnar import ColumnarDataset, columnar_path_for
+from .utils.compression import open_gzip
+from .utils.dataset_statistics import StatisticsAccumulator
 from .utils.write import (
+    DatasetWriter,
     update_frontmatter,
     write_dataset_metadata,
-    write_edge,
-    write_node,
 )
 from .utils.yaml import patch_dumper
 
@@ -26,49 +34,57 @@ patch_dumper()
 
 root_dir = Path(__file__).parent.parent
 dataset_file = root_dir / "public" / "datasets" / "amazon-reviews.txt.gz"
+columns_file = columnar_path_for(dataset_file)
 datasheet_file = root_dir / "src" / "datasets" / "amazon-reviews.mdx"
 revision = 1
 
-nodes, hyperedges = load_benson_hyperedges(root_dir / "data" / "amazon-reviews")
-
-node_degrees = defaultdict(int)
-edge_degree_counts = defaultdict(int)
-
-# write dataset file
-with gzip.open(dataset_file, "wt") as f:
-    write_dataset_metadata(f, datasheet_file.stem, revision)
-    for node in track(nodes, description="Writing nodes"):
-        write_node(f, first(node), category=node["label"])
-    for hyperedge in track(hyperedges, description="Writing hyperedges"):
-        write_edge(f, hyperedge)
+# The parse workers import this module, so the script only runs as the main module.
+if __name__ == "__main__":
+    if resume_requested() and is_run_complete(
+        datasheet_file.stem, manifest=default_manifest(dataset_file)
+    ):
+        print(
+            f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged."
+        )
+        sys.exit()
 
-        for node in hyperedge.elements:
-            node_degrees[node] += 1
+    nodes, hyperedges = load_benson_hyperedges(
+        root_dir / "data" / "amazon-reviews", workers=os.cpu_count() or 1
+    )
 
-        edge_degree_counts[len(hyperedge.elements)] += 1
+    columns = ColumnarDataset()
+    statistics = StatisticsAccumulator(node_label_key="category")
 
-node_degree_counts = defaultdict(int)
-for d in node_degrees.values():
-    node_degree_counts[d] += 1
-node_degree_histogram = dict(sorted(node_degree_counts.items()))
+    # write dataset file
+    with open_gzip(dataset_file, "wt") as f:
+        write_dataset_metadata(f, datasheet_file.stem, revision)
+        with DatasetWriter(f, statistics=statistics, columns=columns) as writer:
+            for node in track(nodes, description="Writing nodes"):
+                writer.write_node(first(node), category=node["label"])
+            for hyperedge in track(hyperedges, description="Writing hyperedges"):
+                writer.write_edge(hyperedge)
 
-edge_degree_histogram = dict(sorted(edge_degree_counts.items()))
+    columns.write(columns_file)
 
-label_counts = Counter(x["label"] for x in nodes)
+    label_counts = statistics.node_label_counts
 
-# write dataset metadata into existing frontmatter
-update_frontmatter(
-    datasheet_file,
-    {
-        "attachments": {
-            f"revision-{revision}": {"ahorn": dataset_file.name},
+    # write dataset metadata into existing frontmatter
+    update_frontmatter(
+        datasheet_file,
+        {
+            "attachments": {
+                f"revision-{revision}": {
+                    "ahorn": dataset_file.name,
+                    "columns": columns_file.name,
+                },
+            },
+            "statistics": statistics.statistics(),
+            "label-count": dict(sorted(label_counts.items())),
         },
-        "statistics": {
-            "num-nodes": len(nodes),
-            "num-interactions": len(hyperedges),
-            "node-degrees": node_degree_histogram,
-            "edge-degrees": edge_degree_histogram,
-        },
-        "label-count": dict(sorted(label_counts.items())),
-    },
-)
+    )
+
+    record_run(
+        datasheet_file.stem,
+        [dataset_file, columns_file, datasheet_file],
+        manifest=default_manifest(dataset_file),
+    )
@@ -17,21 +17,84 @@ Optionally, additional files can be present and are consumed by the functions in
 module:
 
 - ``{name}-times.txt``: Line ``i`` contains the timestamp of the ``i``-th simplex.
+
+Every file may also be stored compressed with a ``.gz``, ``.bz2`` or ``.xz`` suffix, in
+which case it is decompressed transparently while parsing.
 """
 
+import functools
+import hashlib
+import heapq
+import multiprocessing
+import tempfile
 import warnings
-from itertools import chain
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import chain, islice, pairwise
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from more_itertools import spy
 from toponetx.classes.complex import Atom  # noqa: TC002
 from toponetx.classes.simplex import Simplex
 
+from .utils.compression import find_source, is_compressed, open_source
+from .utils.hyperedge_table import DuplicateReport, HyperedgeTable, encode_labels
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from .utils.cache import SourceCache
+
+__all__ = [
+    "iter_benson_simplices",
+    "load_benson_hyperedge_table",
+    "load_benson_hyperedges",
+    "load_benson_simplex_arrays",
+    "load_benson_simplices",
+]
+
+# Maximum size in bytes of a range of a source file that is parsed at once.
+_MAX_RANGE_SIZE = 64 << 20
+# Modules whose code determines the parsed tables.
+_PARSER_MODULES = (
+    Path(__file__),
+    Path(__file__).parent / "utils" / "hyperedge_table.py",
+)
+
 
-__all__ = ["load_benson_hyperedges", "load_benson_simplices"]
+@functools.cache
+def _parser_version() -> str:
+    """Hash the code of the parsers, so that any change invalidates cached tables."""
+    digest = hashlib.blake2b()
+    for path in _PARSER_MODULES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _find_file(folder: Path, *filenames: str) -> str | None:
+    """Find the first of several candidate files that exists in a folder.
+
+    Parameters
+    ----------
+    folder : Path
+        Path to the folder.
+    *filenames : str
+        Candidate filenames, in order of preference. Each candidate may also be
+        stored with a ``.gz``, ``.bz2`` or ``.xz`` suffix.
+
+    Returns
+    -------
+    str | None
+        The name of the first existing (possibly compressed) candidate, or `None` if
+        no candidate exists.
+    """
+    for filename in filenames:
+        if (path := find_source(folder / filename)) is not None:
+            return path.name
+    return None
 
 
 def _validate_folder(folder: Path) -> str:
@@ -58,7 +121,7 @@ def _validate_folder(folder: Path) -> str:
     name = folder.name
 
     mandatory_files = [f"{name}-nverts.txt", f"{name}-simplices.txt"]
-    if not all((folder / file).exists() for file in mandatory_files):
+    if not all(_find_file(folder, file) is not None for file in mandatory_files):
         raise ValueError(f"Folder `{folder}` is not in an expected format.")
 
     return name
@@ -69,6 +132,9 @@ def _infer_hyperedge_filenames(
 ) -> tuple[str | None, str | None, str | None, str, str | None, str | None]:
     """Infer the filenames for hyperedges in the Benson dataset format.
 
+    Each file may also be stored compressed, in which case the returned filename
+    includes the compression suffix.
+
     Parameters
     ----------
     folder : Path
@@ -97,51 +163,28 @@ def _infer_hyperedge_filenames(
     """
     name = folder.name
 
-    if (folder / f"node-names-{name}.txt").exists():
-        node_names_file = f"node-names-{name}.txt"
-    elif (folder / "node-labels.txt").exists():
-        # For the categorical edge datasets, the node names are stored in the
-        # `node-labels.txt` file...
-        node_names_file = "node-labels.txt"
-    else:
-        node_names_file = None
-
-    if (folder / f"node-labels-{name}.txt").exists():
-        node_labels_file = f"node-labels-{name}.txt"
-    else:
-        node_labels_file = None
-
-    if (folder / f"label-names-{name}.txt").exists():
-        node_label_names_file = f"label-names-{name}.txt"
-    elif (folder / "label-names.txt").exists():
-        node_label_names_file = "label-names.txt"
-    else:
-        node_label_names_file = None
+    # For the categorical edge datasets, the node names are stored in the
+    # `node-labels.txt` file...
+    node_names_file = _find_file(folder, f"node-names-{name}.txt", "node-labels.txt")
+    node_labels_file = _find_file(folder, f"node-labels-{name}.txt")
+    node_label_names_file = _find_file(
+        folder, f"label-names-{name}.txt", "label-names.txt"
+    )
 
-    if (folder / f"hyperedges-{name}.txt").exists():
-        hyperedges_file = f"hyperedges-{name}.txt"
-    elif (folder / "hyperedges.txt").exists():
-        hyperedges_file = "hyperedges.txt"
-    else:
+    hyperedges_file = _find_file(folder, f"hyperedges-{name}.txt", "hyperedges.txt")
+    if hyperedges_file is None:
         raise ValueError(f"Folder `{folder}` does not contain hyperedges.")
 
-    if (folder / f"hyperedge-labels-{name}.txt").exists():
-        hyperedge_labels_file = f"hyperedge-labels-{name}.txt"
-    elif (folder / "hyperedge-labels.txt").exists():
-        hyperedge_labels_file = "hyperedge-labels.txt"
-    else:
-        hyperedge_labels_file = None
-
-    if (folder / f"hyperedge-label-names-{name}.txt").exists():
-        hyperedge_label_names_file = f"hyperedge-label-names-{name}.txt"
-    elif (folder / "hyperedge-label-names.txt").exists():
-        hyperedge_label_names_file = "hyperedge-label-names.txt"
-    elif (folder / "hyperedge-label-identities.txt").exists():
-        hyperedge_label_names_file = "hyperedge-label-identities.txt"
-    elif (folder / "hyperedge-labels-identities.txt").exists():
-        hyperedge_label_names_file = "hyperedge-labels-identities.txt"
-    else:
-        hyperedge_label_names_file = None
+    hyperedge_labels_file = _find_file(
+        folder, f"hyperedge-labels-{name}.txt", "hyperedge-labels.txt"
+    )
+    hyperedge_label_names_file = _find_file(
+        folder,
+        f"hyperedge-label-names-{name}.txt",
+        "hyperedge-label-names.txt",
+        "hyperedge-label-identities.txt",
+        "hyperedge-labels-identities.txt",
+    )
 
     return (
         node_names_file,
@@ -153,47 +196,511 @@ def _infer_hyperedge_filenames(
     )
 
 
+def _is_multilabel(raw_labels: Iterable[Any]) -> bool:
+    """Check whether a labels file is multilabel.
+
+    A labels file is multilabel if any of its raw labels contains a comma, so that the
+    same labels are decoded alike whether they are loaded at once or streamed.
+
+    Parameters
+    ----------
+    raw_labels : Iterable[Any]
+        The raw labels, e.g., the lines or the distinct lines of the labels file.
+
+    Returns
+    -------
+    bool
+        Whether any raw label contains a comma.
+    """
+    return any(isinstance(label, str) and "," in label for label in raw_labels)
+
+
+def _decode_label_categories(
+    categories: Sequence[Any], label_list: list[str] | None
+) -> list[Any]:
+    """Decode the distinct raw labels of a labels file.
+
+    Each distinct raw label is decoded only once, no matter how many atoms share it.
+
+    Parameters
+    ----------
+    categories : Sequence[Any]
+        The distinct raw labels, i.e., the distinct lines of the labels file.
+    label_list : list[str] | None
+        A list of label names, if available. If `None`, labels are not mapped.
+
+    Returns
+    -------
+    list[Any]
+        The decoded label of each category. If any category contains a comma, the
+        file is multilabel and every decoded label is a tuple of labels.
+    """
+
+    def label_fn(x: int | str) -> Any:
+        if label_list is not None:
+            return label_list[int(x) - 1]
+        if isinstance(x, str):
+            return x.strip()
+        return x
+
+    if _is_multilabel(categories):
+        return [
+            tuple(label_fn(label) for label in category.strip().split(","))
+            for category in categories
+        ]
+    return [label_fn(category) for category in categories]
+
+
+def _attach_label_codes(
+    label_codes: np.ndarray,
+    label_categories: Sequence[Any],
+    atoms: Iterable[Atom],
+    *,
+    label_name: str = "label",
+) -> None:
+    """Attach categorically encoded labels to atoms.
+
+    Atoms with the same label share the same label object, so the labels take up
+    memory once per distinct label instead of once per atom. Multilabel atoms get
+    their own list of the shared label objects.
+
+    Parameters
+    ----------
+    label_codes : np.ndarray
+        The code of each atom's label.
+    label_categories : Sequence[Any]
+        The decoded labels, indexed by code, as returned by
+        ``_decode_label_categories``.
+    atoms : Iterable[Atom]
+        The atoms to attach the labels to, in the order of ``label_codes``.
+    label_name : str, default="label"
+        The name of the label attribute to attach to the atoms.
+    """
+    if any(isinstance(category, tuple) for category in label_categories):
+        for atom, code in zip(atoms, label_codes.tolist(), strict=True):
+            atom[label_name] = list(label_categories[code])
+    else:
+        for atom, code in zip(atoms, label_codes.tolist(), strict=True):
+            atom[label_name] = label_categories[code]
+
+
 def _attach_labels(
     file: Iterable[str],
     atoms: Iterable[Atom],
     label_list: list[str] | None,
     *,
     label_name: str = "label",
-) -> None:
+) -> tuple[np.ndarray, list[Any]]:
     """Attach labels to atoms from a file.
 
+    The labels are interned: every distinct line is decoded once, and the atoms share
+    the decoded label objects.
+
     Parameters
     ----------
     file : Iterable[str]
         An iterable of lines from the labels file.
-    atoms : dict[int, Atom]
-        A dictionary mapping node IDs to `Atom` instances.
+    atoms : Iterable[Atom]
+        The atoms to attach the labels to, one per line.
     label_list : list[str] | None
         A list of label names, if available. If `None`, labels are not mapped.
-    label_name : str, default="label
+    label_name : str, default="label"
         The name of the label attribute to attach to the atoms.
+
+    Returns
+    -------
+    label_codes : np.ndarray
+        The code of each atom's label, for counting and filtering labels on integer
+        arrays.
+    label_categories : list[Any]
+        The decoded labels, indexed by code. For multilabel files, each decoded label
+        is a tuple of labels.
     """
+    label_codes, raw_categories = encode_labels(file)
+    label_categories = _decode_label_categories(raw_categories, label_list)
+    _attach_label_codes(label_codes, label_categories, atoms, label_name=label_name)
+    return label_codes, label_categories
 
-    def label_fn(x: int | str) -> Any:
-        if label_list is not None:
-            return label_list[int(x) - 1]
-        if isinstance(x, str):
-            return x.strip()
-        return x
 
-    first_lines, file_iter = spy(file, 10)
-    is_multilabel = any(isinstance(line, str) and "," in line for line in first_lines)
+def _simplices_from_table(table: HyperedgeTable) -> list[Simplex]:
+    """Create a `Simplex` for each row of a table, ignoring duplicate vertices.
+
+    If any row contains duplicate vertices, a single warning summarizing all affected
+    rows is issued.
+
+    Parameters
+    ----------
+    table : HyperedgeTable
+        The parsed simplices or hyperedges.
+
+    Returns
+    -------
+    list[Simplex]
+        One `Simplex` per row, without any attributes attached.
+    """
+    table, report = table.deduplicate()
+    if report:
+        warnings.warn(report.message(), UserWarning, stacklevel=3)
+
+    # Slicing Python lists is considerably faster than slicing NumPy arrays and
+    # converting each slice individually.
+    flat_indices = table.indices.tolist()
+    bounds = table.offsets.tolist()
+
+    return [Simplex(flat_indices[start:end]) for start, end in pairwise(bounds)]
+
+
+def _deduplicate_chunks(chunks: Iterable[HyperedgeTable]) -> Iterator[HyperedgeTable]:
+    """Remove duplicate vertices from consecutive chunks of simplices.
+
+    A single warning summarizing all chunks is issued once the chunks are exhausted.
+
+    Parameters
+    ----------
+    chunks : Iterable[HyperedgeTable]
+        Consecutive chunks of simplices.
+
+    Yields
+    ------
+    HyperedgeTable
+        The next chunk, with duplicate vertices removed.
+    """
+    report = DuplicateReport()
+    num_rows = 0
+    for chunk in chunks:
+        deduplicated, chunk_report = chunk.deduplicate()
+        report = report.merge(chunk_report, row_offset=num_rows)
+        num_rows += len(chunk)
+        yield deduplicated
+
+    if report:
+        warnings.warn(report.message(), UserWarning, stacklevel=2)
+
+
+def _line_aligned_ranges(path: Path, num_ranges: int) -> list[tuple[int, int]]:
+    """Split a file into byte ranges that start and end on line boundaries.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file.
+    num_ranges : int
+        Desired number of ranges. Fewer ranges are returned for small files.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Consecutive, non-empty ``(start, end)`` byte ranges covering the file.
+    """
+    size = path.stat().st_size
+    boundaries = [0]
+    with path.open("rb") as file:
+        for i in range(1, num_ranges):
+            file.seek(max(size * i // num_ranges, boundaries[-1]))
+            # Skip the rest of the current line so the range ends after a newline.
+            file.readline()
+            boundaries.append(min(file.tell(), size))
+    boundaries.append(size)
+    return [(start, end) for start, end in pairwise(boundaries) if start < end]
+
+
+def _split_lines(data: bytes) -> list[str]:
+    """Decode a block of complete lines and split it into lines."""
+    lines = data.decode().split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _parse_hyperedge_block(data: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Parse a block of complete lines of a hyperedges file.
+
+    Returns
+    -------
+    sizes : np.ndarray
+        The number of vertices of each hyperedge.
+    indices : np.ndarray
+        The flat vertices of all hyperedges.
+    """
+    sizes: list[int] = []
+    flat_indices: list[int] = []
+    for line in _split_lines(data):
+        elements = line.strip().replace("\t", ",").replace(" ", ",").split(",")
+        sizes.append(len(elements))
+        flat_indices.extend(map(int, elements))
+    return np.asarray(sizes, dtype=np.int64), np.asarray(flat_indices, dtype=np.int64)
+
+
+def _parse_label_block(data: bytes) -> tuple[np.ndarray, list[Any]]:
+    """Parse and encode a block of complete lines of a labels file."""
+    return encode_labels(line.strip() for line in _split_lines(data))
+
+
+def _parse_file_range(
+    parse: Callable[[bytes], Any], path: Path, start: int, end: int
+) -> Any:
+    """Read a line-aligned byte range of a plain file and parse it."""
+    with path.open("rb") as file:
+        file.seek(start)
+        return parse(file.read(end - start))
+
+
+def _iter_line_blocks(path: Path, block_size: int) -> Iterator[bytes]:
+    """Read a plain or compressed file in blocks of complete lines.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file.
+    block_size : int
+        Approximate size of each block in bytes.
+
+    Yields
+    ------
+    bytes
+        The next block, ending after a newline unless it is the last block.
+    """
+    with open_source(path, "rb") as file:
+        remainder = b""
+        while data := file.read(block_size):
+            data = remainder + data
+            cut = data.rfind(b"\n") + 1
+            remainder = data[cut:]
+            if cut:
+                yield data[:cut]
+        if remainder:
+            yield remainder
+
+
+def _worker_pool(workers: int) -> ProcessPoolExecutor:
+    """Start a pool of worker processes that are not forked from the caller.
+
+    Forking a process with several threads, e.g., the decompression thread of a
+    compressed source or the native threads that some extension modules start on
+    import, may deadlock the child on a lock that another thread held. The workers are
+    therefore started by a fork server, or spawned where that is unavailable. Either
+    way, they import the main module of the caller, so a script that parses with
+    several workers must guard its code with ``if __name__ == "__main__"``.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context(method)
+    )
+
+
+def _parallel_parse(
+    parse: Callable[[bytes], Any], path: Path, workers: int
+) -> list[Any]:
+    """Parse consecutive blocks of complete lines of a file, possibly in parallel.
+
+    Plain files are split into line-aligned byte ranges that the workers read
+    themselves. Compressed files are decompressed in this process and the blocks are
+    handed to the workers.
+
+    Parameters
+    ----------
+    parse : Callable[[bytes], Any]
+        Top-level function that parses a single block of lines.
+    path : Path
+        Path to the plain or compressed file.
+    workers : int
+        Number of worker processes, see ``_worker_pool``. With a single worker, the
+        file is parsed in the current process.
+
+    Returns
+    -------
+    list[Any]
+        The results of ``parse`` for each block, in file order.
+    """
+    parallel = workers > 1
+
+    if is_compressed(path):
+        if not parallel:
+            return [
+                parse(block) for block in _iter_line_blocks(path, _MAX_RANGE_SIZE // 4)
+            ]
+
+        with _worker_pool(workers) as executor:
+            # Bound the number of blocks in flight to limit memory usage.
+            results = []
+            pending: deque[Future[Any]] = deque()
+            for block in _iter_line_blocks(path, _MAX_RANGE_SIZE // 4):
+                pending.append(executor.submit(parse, block))
+                if len(pending) >= 2 * workers:
+                    results.append(pending.popleft().result())
+            results.extend(future.result() for future in pending)
+            return results
+
+    # Use several ranges per worker to balance uneven line lengths, and bound the
+    # size of each range to limit the memory held by a single parse.
+    ranges = _line_aligned_ranges(
+        path, max(4 * workers, -(-path.stat().st_size // _MAX_RANGE_SIZE))
+    )
+    if not parallel:
+        return [_parse_file_range(parse, path, start, end) for start, end in ranges]
+
+    with _worker_pool(workers) as executor:
+        return list(
+            executor.map(
+                _parse_file_range,
+                [parse] * len(ranges),
+                [path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+            )
+        )
+
+
+def _parse_hyperedges(
+    hyperedges_path: Path, hyperedge_labels_path: Path | None, *, workers: int = 1
+) -> HyperedgeTable:
+    """Parse a hyperedges file and its optional labels file.
+
+    Both files are split into blocks of complete lines that are parsed in parallel and
+    concatenated in file order.
+
+    Parameters
+    ----------
+    hyperedges_path : Path
+        Path to the file with one comma-, tab- or space-separated hyperedge per line.
+    hyperedge_labels_path : Path, optional
+        Path to the file with one label per hyperedge.
+    workers : int, default=1
+        Number of worker processes.
+
+    Returns
+    -------
+    HyperedgeTable
+        The hyperedges, with the raw label lines as labels.
+    """
+    parts = _parallel_parse(_parse_hyperedge_block, hyperedges_path, workers)
+    empty = np.zeros(0, dtype=np.int64)
+    sizes = np.concatenate([part_sizes for part_sizes, _ in parts] or [empty])
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    indices = np.concatenate([part_indices for _, part_indices in parts] or [empty])
+
+    label_codes, label_categories = None, None
+    if hyperedge_labels_path is not None:
+        # Each range is encoded independently, so the codes of each range are mapped
+        # into a combined category table.
+        code_table: dict[Any, int] = {}
+        remapped_codes = []
+        for codes, categories in _parallel_parse(
+            _parse_label_block, hyperedge_labels_path, workers
+        ):
+            mapping = np.asarray(
+                [code_table.setdefault(label, len(code_table)) for label in categories],
+                dtype=np.int64,
+            )
+            remapped_codes.append(mapping[codes])
+        label_codes = np.concatenate(remapped_codes or [empty])
+        label_categories = list(code_table)
+
+    return HyperedgeTable(
+        offsets,
+        indices,
+        label_codes=label_codes,
+        label_categories=label_categories,
+    )
+
+
+def load_benson_hyperedge_table(
+    folder: Path | str,
+    *,
+    map_hyperedge_label_names: bool = True,
+    cache: SourceCache | None = None,
+    workers: int = 1,
+) -> HyperedgeTable:
+    """Load the hyperedges of a Benson dataset as a `HyperedgeTable`.
+
+    Unlike ``load_benson_hyperedges``, this does not create a `Simplex` per hyperedge
+    and keeps hyperedges with duplicate nodes as they are. Labels are stored as
+    categorical codes, so they can be counted and filtered on integer arrays with
+    ``HyperedgeTable.label_counts`` and ``HyperedgeTable.label_mask``.
+
+    Parameters
+    ----------
+    folder : Path | str
+        Path to the folder containing the dataset.
+    map_hyperedge_label_names : bool, default=True
+        If True, map hyperedge label IDs through the label-name file when present.
+        If False, keep the raw label IDs from the label file.
+    cache : SourceCache, optional
+        If given, the parsed hyperedges are read from and stored in this cache.
+    workers : int, default=1
+        Number of worker processes used to parse the hyperedges and their labels. The
+        workers import the main module, so a calling script must guard its code with
+        ``if __name__ == "__main__"`` to use more than one.
+
+    Returns
+    -------
+    HyperedgeTable
+        The hyperedges in file order. For multilabel datasets, each label category is
+        a tuple of labels.
+
+    Raises
+    ------
+    ValueError
+        If the folder does not exist or is not in the expected format.
+    """
+    if not isinstance(folder, Path):
+        folder = Path(folder)
+
+    if not folder.exists() or not folder.is_dir():
+        raise ValueError(f"Folder `{folder}` does not exist.")
+
+    *_, hyperedges_file, hyperedge_labels_file, hyperedge_label_names_file = (
+        _infer_hyperedge_filenames(folder)
+    )
+
+    hyperedges_path = folder / hyperedges_file
+    hyperedge_labels_path = (
+        folder / hyperedge_labels_file if hyperedge_labels_file is not None else None
+    )
+    sources = [hyperedges_path]
+    if hyperedge_labels_path is not None:
+        sources.append(hyperedge_labels_path)
+
+    def parse() -> HyperedgeTable:
+        return _parse_hyperedges(
+            hyperedges_path, hyperedge_labels_path, workers=workers
+        )
+
+    table = (
+        cache.get_or_parse(
+            f"{folder.name}-hyperedges", sources, parse, parser=_parser_version()
+        )
+        if cache is not None
+        else parse()
+    )
+    if table.label_categories is None:
+        return table
 
-    if is_multilabel:
-        for atom, line in zip(atoms, file_iter, strict=True):
-            atom[label_name] = [label_fn(label) for label in line.strip().split(",")]
+    if map_hyperedge_label_names and hyperedge_label_names_file is not None:
+        with open_source(folder / hyperedge_label_names_file) as file:
+            hyperedge_label_list = [line.strip() for line in file]
     else:
-        for atom, line in zip(atoms, file_iter, strict=True):
-            atom[label_name] = label_fn(line)
+        hyperedge_label_list = None
+
+    return HyperedgeTable(
+        table.offsets,
+        table.indices,
+        label_codes=table.label_codes,
+        label_categories=_decode_label_categories(
+            table.label_categories, hyperedge_label_list
+        ),
+        times=table.times,
+    )
 
 
 def load_benson_hyperedges(
-    folder: Path | str, *, map_hyperedge_label_names: bool = True
+    folder: Path | str,
+    *,
+    map_hyperedge_label_names: bool = True,
+    cache: SourceCache | None = None,
+    workers: int = 1,
 ) -> tuple[list[Simplex], list[Simplex]]:
     """Load hyperedge data from the Benson dataset format.
 
@@ -204,6 +711,12 @@ def load_benson_hyperedges(
     map_hyperedge_label_names : bool, default=True
         If True, map hyperedge label IDs through the label-name file when present.
         If False, attach the raw label IDs from the label file.
+    cache : SourceCache, optional
+        If given, the parsed hyperedges are read from and stored in this cache.
+    workers : int, default=1
+        Number of worker processes used to parse the hyperedges and their labels. The
+        workers import the main module, so a calling script must guard its code with
+        ``if __name__ == "__main__"`` to use more than one.
 
     Returns
     -------
@@ -224,14 +737,9 @@ def load_benson_hyperedges(
     if not folder.exists() or not folder.is_dir():
         raise ValueError(f"Folder `{folder}` does not exist.")
 
-    (
-        node_names_file,
-        node_labels_file,
-        node_label_names_file,
-        hyperedges_file,
-        hyperedge_labels_file,
-        hyperedge_label_names_file,
-    ) = _infer_hyperedge_filenames(folder)
+    node_names_file, node_labels_file, node_label_names_file, *_ = (
+        _infer_hyperedge_filenames(folder)
+    )
 
     # The initialization of the `nodes` list is rather complicated because the nodes
     # can only be inferred indirectly from different places, depending on the dataset:
@@ -244,7 +752,7 @@ def load_benson_hyperedges(
     nodes: list[Simplex] = []
 
     if node_names_file is not None:
-        with (folder / node_names_file).open() as file:
+        with open_source(folder / node_names_file) as file:
             # Read first line to check for a header line. In that case node ids are not
             # consecutive.
             first_lines, file = spy(file, 1)
@@ -263,46 +771,26 @@ def load_benson_hyperedges(
                 ]
 
     if node_label_names_file is not None:
-        with (folder / node_label_names_file).open() as file:
+        with open_source(folder / node_label_names_file) as file:
             node_label_list = [line.strip() for line in file]
     else:
         node_label_list = None
     if node_labels_file is not None:
-        with (folder / node_labels_file).open() as file:
+        with open_source(folder / node_labels_file) as file:
             node_labels = file.readlines()
             if node_names_file is None:
                 nodes = [Simplex([i]) for i in range(1, len(node_labels) + 1)]
             _attach_labels(node_labels, nodes, node_label_list)
 
-    simplices = []
-    with (folder / hyperedges_file).open() as file:
-        for line in file:
-            elements = [
-                int(vertex)
-                for vertex in line.strip()
-                .replace("\t", ",")
-                .replace(" ", ",")
-                .split(",")
-            ]
-
-            seen = set()
-            duplicates = {x for x in elements if x in seen or seen.add(x)}
-            if duplicates:
-                warnings.warn(
-                    f"Hyperedge contains duplicate nodes: {duplicates}. TopoNetX ignores them.",
-                    UserWarning,
-                    stacklevel=2,
-                )
-
-            simplices.append(Simplex(seen))
-    if map_hyperedge_label_names and hyperedge_label_names_file is not None:
-        with (folder / hyperedge_label_names_file).open() as file:
-            hyperedge_label_list = [line.strip() for line in file]
-    else:
-        hyperedge_label_list = None
-    if hyperedge_labels_file is not None:
-        with (folder / hyperedge_labels_file).open() as file:
-            _attach_labels(file, simplices, hyperedge_label_list)
+    table = load_benson_hyperedge_table(
+        folder,
+        map_hyperedge_label_names=map_hyperedge_label_names,
+        cache=cache,
+        workers=workers,
+    )
+    simplices = _simplices_from_table(table)
+    if table.label_codes is not None and table.label_categories is not None:
+        _attach_label_codes(table.label_codes, table.label_categories, simplices)
 
     if node_names_file is None and node_labels_file is None:
         nodes = [Simplex([i]) for i in set(chain.from_iterable(simplices))]
@@ -310,7 +798,182 @@ def load_benson_hyperedges(
     return nodes, simplices
 
 
-def load_benson_simplices(folder: Path | str) -> list[Simplex]:
+def _read_int_column(path: Path, expected: int | None = None) -> np.ndarray:
+    """Read a file with one integer per line into an ``int64`` array.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file.
+    expected : int, optional
+        The number of integers that the file must contain.
+
+    Returns
+    -------
+    np.ndarray
+        The integers in the file, in file order.
+
+    Raises
+    ------
+    ValueError
+        If a line does not hold exactly one integer, or if the file does not contain
+        the expected number of integers.
+    """
+    malformed = (
+        f"`{path.name}` is not in an expected format: every line must hold exactly "
+        "one integer."
+    )
+    blocks = []
+    for block in _iter_line_blocks(path, _MAX_RANGE_SIZE // 4):
+        # Depending on the version, NumPy raises or only warns at the first token that
+        # is not an integer. Blank lines and lines with several integers are caught by
+        # comparing the number of integers with the number of lines.
+        try:
+            with warnings.catch_warnings(action="error", category=DeprecationWarning):
+                values = np.fromstring(block.decode(), dtype=np.int64, sep=" ")
+        except (ValueError, DeprecationWarning) as error:
+            raise ValueError(malformed) from error
+        if len(values) != block.count(b"\n") + (not block.endswith(b"\n")):
+            raise ValueError(malformed)
+        blocks.append(values)
+    column = np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int64)
+
+    if expected is not None and len(column) != expected:
+        raise ValueError(
+            f"`{path.name}` contains {len(column)} integers, but {expected} were "
+            "expected."
+        )
+    return column
+
+
+def _simplex_files(folder: Path, name: str) -> dict[str, Path]:
+    """Find the existing, possibly compressed, simplex files of a Benson dataset.
+
+    Parameters
+    ----------
+    folder : Path
+        Path to the folder containing the dataset.
+    name : str
+        The name of the dataset.
+
+    Returns
+    -------
+    dict[str, Path]
+        Mapping from the file kinds ``nverts``, ``simplices``, ``simplex-labels`` and
+        ``times`` to their paths. Kinds without a file are omitted.
+    """
+    files = {}
+    for kind in ("nverts", "simplices", "simplex-labels", "times"):
+        if (filename := _find_file(folder, f"{name}-{kind}.txt")) is not None:
+            files[kind] = folder / filename
+    return files
+
+
+def _parse_benson_simplices(folder: Path, name: str) -> HyperedgeTable:
+    """Parse the simplex files of a Benson dataset in file order.
+
+    Parameters
+    ----------
+    folder : Path
+        Path to the folder containing the dataset.
+    name : str
+        The name of the dataset.
+
+    Returns
+    -------
+    HyperedgeTable
+        The simplices with their optional label and time columns.
+
+    Raises
+    ------
+    ValueError
+        If the number of vertices and simplices do not match, or if a file is malformed
+        or has a different number of lines than the vertex counts.
+    """
+    files = _simplex_files(folder, name)
+    num_vertices = _read_int_column(files["nverts"])
+    indices = _read_int_column(files["simplices"])
+
+    offsets = np.zeros(len(num_vertices) + 1, dtype=np.int64)
+    np.cumsum(num_vertices, out=offsets[1:])
+    if offsets[-1] != len(indices):
+        raise ValueError(
+            f"Folder `{folder}` is not in an expected format: `{name}-nverts.txt` "
+            f"declares {offsets[-1]} vertices, but `{name}-simplices.txt` contains "
+            f"{len(indices)}."
+        )
+
+    label_codes, label_categories = None, None
+    if "simplex-labels" in files:
+        with open_source(files["simplex-labels"]) as labels_file:
+            label_codes, label_categories = encode_labels(
+                line.strip() for line in labels_file
+            )
+        if len(label_codes) != len(num_vertices):
+            raise ValueError(
+                f"`{files['simplex-labels'].name}` contains {len(label_codes)} "
+                f"labels, but {len(num_vertices)} were expected."
+            )
+
+    times = None
+    if "times" in files:
+        times = _read_int_column(files["times"], expected=len(num_vertices))
+
+    return HyperedgeTable(
+        offsets,
+        indices,
+        label_codes=label_codes,
+        label_categories=label_categories,
+        times=times,
+    )
+
+
+def load_benson_simplex_arrays(
+    folder: Path | str, *, cache: SourceCache | None = None
+) -> HyperedgeTable:
+    """Load simplicial complex data from the Benson dataset format as flat arrays.
+
+    In contrast to ``load_benson_simplices``, no per-simplex Python objects are
+    created, and the simplices are returned in file order.
+
+    Parameters
+    ----------
+    folder : Path | str
+        Path to the folder containing the dataset.
+    cache : SourceCache, optional
+        If given, the parsed simplices are read from and stored in this cache.
+
+    Returns
+    -------
+    HyperedgeTable
+        Offsets and flat vertex indices of the simplices, together with the optional
+        label and time columns. Vertices are stored exactly as they appear in the
+        source files, i.e., duplicate vertices within a simplex are retained.
+
+    Raises
+    ------
+    ValueError
+        If the folder does not exist or is not in the expected format.
+    """
+    if not isinstance(folder, Path):
+        folder = Path(folder)
+
+    name = _validate_folder(folder)
+
+    if cache is None:
+        return _parse_benson_simplices(folder, name)
+
+    return cache.get_or_parse(
+        f"{name}-simplices",
+        _simplex_files(folder, name).values(),
+        lambda: _parse_benson_simplices(folder, name),
+        parser=_parser_version(),
+    )
+
+
+def load_benson_simplices(
+    folder: Path | str, *, cache: SourceCache | None = None
+) -> list[Simplex]:
     """Load simplicial complex data from the Benson dataset format.
 
     If the dataset is temporal (indicated by the presence of a ``{name}-times.txt``
@@ -320,6 +983,8 @@ def load_benson_simplices(folder: Path | str) -> list[Simplex]:
     ----------
     folder : Path | str
         Path to the folder containing the dataset.
+    cache : SourceCache, optional
+        If given, the parsed simplices are read from and stored in this cache.
 
     Returns
     -------
@@ -335,54 +1000,263 @@ def load_benson_simplices(folder: Path | str) -> list[Simplex]:
     -----
     - If the dataset has node labels, simplices have a ``label`` attribute.
     - If the dataset is temporal, simplices have a ``time`` attribute.
+    - Use ``load_benson_simplex_arrays`` to avoid creating a `Simplex` per simplex.
+    """
+    arrays = load_benson_simplex_arrays(folder, cache=cache)
+    simplices = _simplices_from_table(arrays)
+
+    if arrays.label_codes is not None and arrays.label_categories is not None:
+        _attach_label_codes(
+            arrays.label_codes,
+            _decode_label_categories(arrays.label_categories, None),
+            simplices,
+        )
+
+    if arrays.times is not None:
+        times = arrays.times
+        for simplex, time in zip(simplices, times.tolist(), strict=True):
+            simplex["time"] = time
+        # Sort once on the times array instead of comparing `Simplex` attributes. The
+        # stable sort keeps simplices with equal times in file order, and inputs that
+        # are already chronological are detected in linear time and left as they are.
+        if np.any(times[1:] < times[:-1]):
+            order = np.argsort(times, kind="stable")
+            simplices = [simplices[i] for i in order.tolist()]
+
+    return simplices
+
+
+def _iter_benson_simplex_chunks(
+    folder: Path, name: str, chunk_size: int
+) -> Iterator[HyperedgeTable]:
+    """Parse the simplex files of a Benson dataset in consecutive chunks.
+
+    Parameters
+    ----------
+    folder : Path
+        Path to the folder containing the dataset.
+    name : str
+        The name of the dataset.
+    chunk_size : int
+        Maximum number of simplices per chunk.
+
+    Yields
+    ------
+    HyperedgeTable
+        The next chunk of simplices in file order, with the raw label lines and
+        times as columns.
+
+    Raises
+    ------
+    ValueError
+        If the number of vertices and simplices do not match.
+    """
+    files = _simplex_files(folder, name)
+
+    with ExitStack() as stack:
+        num_vertices_file = stack.enter_context(open_source(files["nverts"]))
+        simplices_file = stack.enter_context(open_source(files["simplices"]))
+        labels_file = (
+            stack.enter_context(open_source(files["simplex-labels"]))
+            if "simplex-labels" in files
+            else None
+        )
+        times_file = (
+            stack.enter_context(open_source(files["times"]))
+            if "times" in files
+            else None
+        )
+
+        while sizes := [int(line) for line in islice(num_vertices_file, chunk_size)]:
+            offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+            np.cumsum(sizes, out=offsets[1:])
+            indices = [int(line) for line in islice(simplices_file, int(offsets[-1]))]
+            if len(indices) != offsets[-1]:
+                raise ValueError(
+                    f"Folder `{folder}` is not in an expected format: "
+                    f"`{name}-simplices.txt` contains fewer vertices than declared."
+                )
+
+            label_codes, label_categories = None, None
+            if labels_file is not None:
+                label_codes, label_categories = encode_labels(
+                    line.strip() for line in islice(labels_file, len(sizes))
+                )
+            times = None
+            if times_file is not None:
+                times = [int(line) for line in islice(times_file, len(sizes))]
+
+            yield HyperedgeTable(
+                offsets,
+                np.asarray(indices, dtype=np.int64),
+                label_codes=label_codes,
+                label_categories=label_categories,
+                times=times,
+            )
+
+        if next(simplices_file, None) is not None:
+            raise ValueError(
+                f"Folder `{folder}` is not in an expected format: "
+                f"`{name}-simplices.txt` contains more vertices than declared."
+            )
+
+
+def _is_sorted_file(path: Path) -> bool:
+    """Check in constant memory whether a file of integers is in ascending order."""
+    with open_source(path) as file:
+        return all(a <= b for a, b in pairwise(map(int, file)))
+
+
+def _write_sorted_run(table: HyperedgeTable, run_file: Path) -> None:
+    """Write a chunk of simplices, stably sorted by time, to a run file.
+
+    Each line holds the time, the raw label and the space-separated vertices,
+    separated by tabs. The label may contain tabs itself, since neither the time nor
+    the vertices do.
+    """
+    labels = table.labels
+    rows = list(table)
+    with run_file.open("w", encoding="utf-8") as file:
+        for i in np.argsort(table.times, kind="stable").tolist():
+            label = labels[i] if labels is not None else ""
+            vertices = " ".join(map(str, rows[i].tolist()))
+            file.write(f"{table.times[i]}\t{label}\t{vertices}\n")
+
+
+def _read_sorted_run(run_file: Path) -> Iterator[tuple[int, str, list[int]]]:
+    """Read the time, raw label and vertices of each simplex in a run file."""
+    with run_file.open(encoding="utf-8") as file:
+        for line in file:
+            time, rest = line.rstrip("\n").split("\t", 1)
+            label, vertices = rest.rsplit("\t", 1)
+            yield int(time), label, [int(vertex) for vertex in vertices.split()]
+
+
+def iter_benson_simplices(
+    folder: Path | str, *, chunk_size: int = 1_000_000
+) -> Iterator[Simplex]:
+    """Iterate over the simplices of a Benson dataset with bounded memory.
+
+    This yields the same simplices in the same order as ``load_benson_simplices``,
+    i.e., temporal datasets are yielded in chronological order, but at most
+    ``chunk_size`` simplices are held in memory at once. If the times are already
+    sorted, the simplices are streamed directly from the source files. Otherwise, they
+    are sorted with an external merge sort over temporary runs of ``chunk_size``
+    simplices each.
+
+    Parameters
+    ----------
+    folder : Path | str
+        Path to the folder containing the dataset.
+    chunk_size : int, default=1_000_000
+        Maximum number of simplices that are parsed at once.
+
+    Yields
+    ------
+    Simplex
+        The next simplex, with ``label`` and ``time`` attributes if the dataset has
+        labels and times, respectively.
+
+    Raises
+    ------
+    ValueError
+        If the folder does not exist or is not in the expected format.
     """
     if not isinstance(folder, Path):
         folder = Path(folder)
 
     name = _validate_folder(folder)
 
-    with (
-        (folder / f"{name}-nverts.txt").open() as num_vertices_file,
-        (folder / f"{name}-simplices.txt").open() as simplices_file,
-    ):
-        simplices = []
-        for simplex_size in map(int, num_vertices_file):
-            elements = [
-                int(simplices_file.readline().strip()) for _ in range(simplex_size)
-            ]
-
-            seen = set()
-            duplicates = {x for x in elements if x in seen or seen.add(x)}
-            if duplicates:
-                warnings.warn(
-                    f"Hyperedge contains duplicate nodes: {duplicates}. TopoNetX ignores them.",
-                    UserWarning,
-                    stacklevel=2,
+    files = _simplex_files(folder, name)
+    has_labels = "simplex-labels" in files
+
+    is_multilabel = False
+    if has_labels:
+        with open_source(files["simplex-labels"]) as file:
+            is_multilabel = _is_multilabel(file)
+
+    def make_simplex(
+        elements: list[int], label: str | None, time: int | None
+    ) -> Simplex:
+        simplex = Simplex(elements)
+        if label is not None:
+            simplex["label"] = (
+                [part.strip() for part in label.split(",")] if is_multilabel else label
+            )
+        if time is not None:
+            simplex["time"] = time
+        return simplex
+
+    chunks = _deduplicate_chunks(_iter_benson_simplex_chunks(folder, name, chunk_size))
+
+    if "times" not in files or _is_sorted_file(files["times"]):
+        for table in chunks:
+            labels = table.labels
+            times = table.times.tolist() if table.times is not None else None
+            for i, row in enumerate(table):
+                yield make_simplex(
+                    row.tolist(),
+                    labels[i] if labels is not None else None,
+                    times[i] if times is not None else None,
                 )
+        return
 
-            simplices.append(Simplex(seen))
+    with tempfile.TemporaryDirectory(prefix=f"{name}-runs-") as run_dir:
+        run_files = []
+        for i, table in enumerate(chunks):
+            run_files.append(Path(run_dir) / f"run-{i}.txt")
+            _write_sorted_run(table, run_files[-1])
 
-    if (folder / f"{name}-simplex-labels.txt").exists():
-        with (folder / f"{name}-simplex-labels.txt").open() as labels_file:
-            simplex_labels = labels_file.readlines()
-        _attach_labels(simplex_labels, simplices, None)
+        # `heapq.merge` is stable, i.e., ties are broken by run order.
+        for time, label, elements in heapq.merge(
+            *(_read_sorted_run(run_file) for run_file in run_files),
+            key=lambda entry: entry[0],
+        ):
+            yield make_simplex(elements, label if has_labels else None, time)
 
-    if (folder / f"{name}-times.txt").exists():
-        with (folder / f"{name}-times.txt").open() as times_file:
-            simplex_times = [int(line) for line in times_file]
-        _attach_labels(simplex_times, simplices, None, label_name="time")
-        simplices = sorted(simplices, key=lambda simplex: simplex["time"])
 
-    return simplices
+def _parse_benson_sc_nodes(node_labels_path: Path) -> HyperedgeTable:
+    """Parse the node labels file of a Benson simplicial complex dataset.
+
+    Parameters
+    ----------
+    node_labels_path : Path
+        Path to the file with one label per node.
+
+    Returns
+    -------
+    HyperedgeTable
+        One single-vertex row per node, labelled with the node's label.
+    """
+    with open_source(node_labels_path) as file:
+        node_labels = [line.strip() for line in file]
+
+    # sometimes the lines start with the node id, which is redundant
+    for i, node_label in enumerate(node_labels):
+        parts = node_label.split(maxsplit=1)
+        if len(parts) == 2 and parts[0].isdigit() and parts[0] == str(i + 1):
+            node_labels[i] = parts[1]
+
+    label_codes, label_categories = encode_labels(node_labels)
+    return HyperedgeTable(
+        np.arange(len(node_labels) + 1),
+        np.arange(1, len(node_labels) + 1),
+        label_codes=label_codes,
+        label_categories=label_categories,
+    )
 
 
-def load_benson_sc_nodes(folder: Path | str) -> list[Simplex]:
+def load_benson_sc_nodes(
+    folder: Path | str, *, cache: SourceCache | None = None
+) -> list[Simplex]:
     """Load nodes of a simplicial complex from the Benson dataset format.
 
     Parameters
     ----------
     folder : Path | str
         Path to the folder containing the dataset.
+    cache : SourceCache, optional
+        If given, the parsed node labels are read from and stored in this cache.
 
     Returns
     -------
@@ -398,18 +1272,28 @@ def load_benson_sc_nodes(folder: Path | str) -> list[Simplex]:
     if not isinstance(folder, Path):
         folder = Path(folder)
 
-    node_labels_file = folder / f"{folder.name}-node-labels.txt"
-
-    with (folder / node_labels_file).open() as file:
-        node_labels = file.readlines()
+    node_labels_file = f"{folder.name}-node-labels.txt"
+    node_labels_path = folder / (
+        _find_file(folder, node_labels_file) or node_labels_file
+    )
 
-        # sometimes the lines start with the node id, which is redundant
-        for i, node_label in enumerate(node_labels):
-            parts = node_label.strip().split(maxsplit=1)
-            if len(parts) == 2 and parts[0].isdigit() and parts[0] == str(i + 1):
-                node_labels[i] = parts[1]
+    table = (
+        cache.get_or_parse(
+            f"{folder.name}-sc-nodes",
+            [node_labels_path],
+            lambda: _parse_benson_sc_nodes(node_labels_path),
+            parser=_parser_version(),
+        )
+        if cache is not None
+        else _parse_benson_sc_nodes(node_labels_path)
+    )
 
-        nodes = [Simplex([i]) for i in range(1, len(node_labels) + 1)]
-        _attach_labels(node_labels, nodes, None)
+    nodes = [Simplex([i]) for i in table.indices.tolist()]
+    if table.label_codes is not None and table.label_categories is not None:
+        _attach_label_codes(
+            table.label_codes,
+            _decode_label_categories(table.label_categories, None),
+            nodes,
+        )
 
     return nodes
@@ -6,7 +6,7 @@ References
 https://www.cs.cornell.edu/~arb/data/coauth-MAG-History/
 """
 
-import gzip
+import sys
 from collections import Counter, defaultdict
 from pathlib import Path
 
@@ -14,6 +14,13 @@ from more_itertools import first
 from rich.progress import track
 
 from .benson import load_benson_sc_nodes, load_benson_simplices
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
@@ -29,13 +36,19 @@ dataset_file = root_dir / "public" / "datasets" / "coauth-MAG-History.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / "coauth-MAG-History.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 nodes = load_benson_sc_nodes(root_dir / "data" / "coauth-MAG-History-full")
 hyperedges = load_benson_simplices(root_dir / "data" / "coauth-MAG-History-full")
 
 # write dataset file
 yearly_hyperedges = defaultdict(list)
 degrees = defaultdict(int)
-with gzip.open(dataset_file, "wt") as f:
+with open_gzip(dataset_file, "wt") as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
 
     for node in track(nodes, description="Writing nodes"):
@@ -69,3 +82,9 @@ update_frontmatter(
         "shape": {str(year): shape for year, shape in num_hyperedges.items()},
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
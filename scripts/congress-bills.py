@@ -6,7 +6,7 @@ References
 https://www.cs.cornell.edu/~arb/data/congress-bills/
 """
 
-import gzip
+import sys
 from collections import defaultdict
 from datetime import UTC, datetime
 from pathlib import Path
@@ -14,6 +14,13 @@ from pathlib import Path
 import toponetx as tnx
 from rich.progress import track
 
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
 from .utils.write import update_frontmatter, write_dataset_metadata, write_edge
 from .utils.yaml import patch_dumper
 
@@ -27,10 +34,16 @@ dataset_file = root_dir / "public" / "datasets" / "congress-bills.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / "congress-bills.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 simplices = tnx.datasets.load_benson_simplices(root_dir / "data" / "congress-bills")
 
 # write dataset file
-with gzip.open(dataset_file, "wt") as f:
+with open_gzip(dataset_file, "wt") as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
     for simplex in simplices:
         write_edge(f, simplex, time=datetime.fromtimestamp(simplex["time"], tz=UTC))
@@ -67,3 +80,9 @@ update_frontmatter(
         },
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
@@ -6,6 +6,7 @@ References
 https://www.cs.cornell.edu/~arb/data/contact-high-school/
 """
 
+import sys
 from collections import defaultdict
 from datetime import UTC, datetime
 from itertools import chain
@@ -15,6 +16,13 @@ import toponetx as tnx
 from rich.progress import track
 
 from .benson import load_benson_simplices
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    open_atomic,
+    record_run,
+    resume_requested,
+)
 from .utils.write import update_frontmatter, write_dataset_metadata, write_edge
 from .utils.yaml import patch_dumper
 
@@ -25,12 +33,18 @@ dataset_file = root_dir / "public" / "datasets" / "contact-high-school.txt"
 datasheet_file = root_dir / "src" / "datasets" / "contact-high-school.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 simplices = load_benson_simplices(root_dir / "data" / "contact-high-school")
 nodes = set(chain.from_iterable(simplex.elements for simplex in simplices))
 
 # write dataset file
 num_interactions = 0
-with dataset_file.open("w") as f:
+with open_atomic(dataset_file) as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
     for simplex in track(simplices, description="Writing simplices"):
         write_edge(f, simplex, time=datetime.fromtimestamp(simplex["time"], tz=UTC))
@@ -73,3 +87,9 @@ update_frontmatter(
         },
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
@@ -11,19 +11,26 @@ References
 Original dataset from hypergraph learning benchmarks (DHGNN, HyperGCN, etc.)
 """
 
-import gzip
 import pickle
+import sys
 from collections import Counter, defaultdict
 from pathlib import Path
 
 from rich.progress import track
 from toponetx.classes.simplex import Simplex
 
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
+from .utils.dataset_statistics import StatisticsAccumulator
 from .utils.write import (
+    DatasetWriter,
     update_frontmatter,
     write_dataset_metadata,
-    write_edge,
-    write_node,
 )
 from .utils.yaml import patch_dumper
 
@@ -35,6 +42,12 @@ dataset_file = root_dir / "public" / "datasets" / "cora-coauthorship.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / "cora-coauthorship.mdx"
 revision = 2
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 # Load dataset from pickle files
 with (data_dir / "hypergraph.pickle").open("rb") as f:
     hypergraph_dict = pickle.load(f)  # noqa: S301
@@ -91,35 +104,21 @@ for paper_id in sorted(papers_to_authors.keys()):
     if len(author_list) > 1:  # Only include papers with more than one author
         hyperedges.append(Simplex(author_list))
 
-node_degrees = defaultdict(int)
-edge_degree_counts = defaultdict(int)
+statistics = StatisticsAccumulator(node_label_key="category")
 
 # Write dataset file
-with gzip.open(dataset_file, "wt") as f:
+with open_gzip(dataset_file, "wt") as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
+    with DatasetWriter(f, statistics=statistics) as writer:
+        for i, node in track(
+            enumerate(nodes), description="Writing nodes", total=len(nodes)
+        ):
+            writer.write_node(i + 1, category=node["label"], name=node["name"])
 
-    for i, node in track(
-        enumerate(nodes), description="Writing nodes", total=len(nodes)
-    ):
-        write_node(f, i + 1, category=node["label"], name=node["name"])
-
-    for hyperedge in track(hyperedges, description="Writing hyperedges"):
-        write_edge(f, hyperedge)
-
-        for node_id in hyperedge.elements:
-            node_degrees[node_id] += 1
-
-        edge_degree_counts[len(hyperedge.elements)] += 1
+        for hyperedge in track(hyperedges, description="Writing hyperedges"):
+            writer.write_edge(hyperedge)
 
-# Calculate statistics
-node_degree_counts = defaultdict(int)
-for d in node_degrees.values():
-    node_degree_counts[d] += 1
-node_degree_histogram = dict(sorted(node_degree_counts.items()))
-
-edge_degree_histogram = dict(sorted(edge_degree_counts.items()))
-
-label_counts = Counter(node["label"] for node in nodes)
+label_counts = statistics.node_label_counts
 
 # Write dataset metadata into existing frontmatter
 update_frontmatter(
@@ -128,12 +127,13 @@ update_frontmatter(
         "attachments": {
             f"revision-{revision}": {"ahorn": dataset_file.name},
         },
-        "statistics": {
-            "num-nodes": len(nodes),
-            "num-interactions": len(hyperedges),
-            "node-degrees": node_degree_histogram,
-            "edge-degrees": edge_degree_histogram,
-        },
+        "statistics": statistics.statistics(),
         "label-count": dict(sorted(label_counts.items())),
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
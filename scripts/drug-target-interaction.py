@@ -5,13 +5,20 @@ constructs 0/1/2-cells, writes the compressed dataset output, and updates the
 datasheet frontmatter with attachment and statistics metadata.
 """
 
-import gzip
+import sys
 from pathlib import Path
 
 import numpy as np
 import scipy.io
 from rich.progress import track
 
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
@@ -28,6 +35,12 @@ dataset_file = root_dir / "public" / "datasets" / "drug-target-interaction.txt.g
 datasheet_file = root_dir / "src" / "datasets" / "drug-target-interaction.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 # Load the .mat file
 mat = scipy.io.loadmat(data_dir / "Perlman_Data.mat")
 
@@ -125,7 +138,7 @@ for group in target_groups:
     if len(cell) > 1:
         two_cells.add(tuple(sorted(cell)))
 
-with gzip.open(dataset_file, "wt") as f:
+with open_gzip(dataset_file, "wt") as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
 
     for node in track(zero_cells, description="Adding and writing 0-cells (nodes)"):
@@ -152,3 +165,9 @@ update_frontmatter(
         },
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
-import gzip
-from collections import Counter
-from datetime import UTC, datetime, timedelta
+import sys
 from pathlib import Path
 
 from more_itertools import first
 
 from .benson import load_benson_sc_nodes, load_benson_simplices
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
+from .utils.histogram import Histogram
+from .utils.timestamps import format_timestamps
 from .utils.write import (
+    DatasetWriter,
     update_frontmatter,
     write_dataset_metadata,
-    write_edge,
-    write_node,
 )
 from .utils.yaml import patch_dumper
 
@@ -29,31 +35,36 @@ folder = root_dir / "data" / source_folder_name
 dataset_file = root_dir / "public" / "datasets" / f"{slug}.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / f"{slug}.mdx"
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 nodes = load_benson_sc_nodes(folder)
 simplices = load_benson_simplices(folder)
+times = format_timestamps(
+    [simplex["time"] for simplex in simplices], epoch="dotnet", unit="ms"
+)
 
-node_degrees: Counter[int] = Counter()
-edge_degrees: Counter[int] = Counter()
+node_degrees = Histogram()
+edge_degrees = Histogram()
 written_edges = 0
 
-with gzip.open(dataset_file, "wt") as file:
+with open_gzip(dataset_file, "wt") as file:
     write_dataset_metadata(file, slug, revision)
-    for node in nodes:
-        write_node(file, first(node.elements), email=node["label"])
+    with DatasetWriter(file) as writer:
+        for node in nodes:
+            writer.write_node(first(node.elements), email=node["label"])
 
-    for simplex in simplices:
-        if len(simplex.elements) < 2:
-            continue
+        for simplex, time in zip(simplices, times, strict=True):
+            if len(simplex.elements) < 2:
+                continue
 
-        write_edge(
-            file,
-            simplex,
-            time=datetime(1, 1, 1, tzinfo=UTC)
-            + timedelta(milliseconds=simplex["time"]),
-        )
-        node_degrees.update(simplex.elements)
-        edge_degrees[len(simplex.elements)] += 1
-        written_edges += 1
+            writer.write_edge(simplex, time=time)
+            node_degrees.update(simplex.elements)
+            edge_degrees.add(len(simplex.elements))
+            written_edges += 1
 
 update_frontmatter(
     datasheet_file,
@@ -64,8 +75,14 @@ update_frontmatter(
         "statistics": {
             "num-nodes": len(nodes),
             "num-interactions": written_edges,
-            "node-degrees": dict(sorted(Counter(node_degrees.values()).items())),
-            "edge-degrees": dict(sorted(edge_degrees.items())),
+            "node-degrees": node_degrees.count_histogram().to_dict(),
+            "edge-degrees": edge_degrees.to_dict(),
         },
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
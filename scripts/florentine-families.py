@@ -7,6 +7,7 @@ Ronald L. Breiger and Philippa E. Pattison. Cumulated social roles: The duality
 of persons and their algebras. Social Networks, 8(3):215-256, 1986.
 """
 
+import sys
 from itertools import islice
 from pathlib import Path
 
@@ -14,6 +15,13 @@ import networkx as nx
 import toponetx as tnx
 from rich.progress import track
 
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    open_atomic,
+    record_run,
+    resume_requested,
+)
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
@@ -29,6 +37,12 @@ dataset_file = root_dir / "public" / "datasets" / "florentine-families.txt"
 datasheet_file = root_dir / "src" / "datasets" / "florentine-families.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 G = nx.florentine_families_graph()
 node_degree_histogram = {
     d: count for d, count in enumerate(nx.degree_histogram(G)) if count > 0
@@ -37,7 +51,7 @@ node_degree_histogram = {
 clique_complex = tnx.graph_to_clique_complex(G)
 
 # write dataset file
-with dataset_file.open("w") as f:
+with open_atomic(dataset_file) as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
 
     for node, data in track(G.nodes(data=True), description="Writing nodes"):
@@ -67,3 +81,9 @@ update_frontmatter(
         },
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
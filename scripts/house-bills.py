@@ -6,18 +6,25 @@ References
 https://www.cs.cornell.edu/~arb/data/house-bills/
 """
 
-from collections import Counter, defaultdict
+import sys
 from pathlib import Path
 
 from more_itertools import first
 from rich.progress import track
 
 from .benson import load_benson_hyperedges
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    open_atomic,
+    record_run,
+    resume_requested,
+)
+from .utils.dataset_statistics import StatisticsAccumulator
 from .utils.write import (
+    DatasetWriter,
     update_frontmatter,
     write_dataset_metadata,
-    write_edge,
-    write_node,
 )
 from .utils.yaml import patch_dumper
 
@@ -28,32 +35,26 @@ dataset_file = root_dir / "public" / "datasets" / "house-bills.txt"
 datasheet_file = root_dir / "src" / "datasets" / "house-bills.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 nodes, hyperedges = load_benson_hyperedges(root_dir / "data" / "house-bills")
 
-node_degrees = defaultdict(int)
-edge_degree_counts = defaultdict(int)
+statistics = StatisticsAccumulator(node_label_key="party")
 
 # write dataset file
-with dataset_file.open("w") as f:
+with open_atomic(dataset_file) as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
-    for node in track(nodes, description="Writing nodes"):
-        write_node(f, first(node), party=node["label"], name=node["name"])
-    for hyperedge in track(hyperedges, description="Writing hyperedges"):
-        write_edge(f, hyperedge)
-
-        for node in hyperedge.elements:
-            node_degrees[node] += 1
-
-        edge_degree_counts[len(hyperedge.elements)] += 1
-
-node_degree_counts = defaultdict(int)
-for d in node_degrees.values():
-    node_degree_counts[d] += 1
-node_degree_histogram = dict(sorted(node_degree_counts.items()))
+    with DatasetWriter(f, statistics=statistics) as writer:
+        for node in track(nodes, description="Writing nodes"):
+            writer.write_node(first(node), party=node["label"], name=node["name"])
+        for hyperedge in track(hyperedges, description="Writing hyperedges"):
+            writer.write_edge(hyperedge)
 
-label_counts = Counter(x["label"] for x in nodes)
-
-edge_degree_histogram = dict(sorted(edge_degree_counts.items()))
+label_counts = statistics.node_label_counts
 
 update_frontmatter(
     datasheet_file,
@@ -61,12 +62,13 @@ update_frontmatter(
         "attachments": {
             f"revision-{revision}": {"ahorn": dataset_file.name},
         },
-        "statistics": {
-            "num-nodes": len(nodes),
-            "num-interactions": len(hyperedges),
-            "node-degrees": node_degree_histogram,
-            "edge-degrees": edge_degree_histogram,
-        },
+        "statistics": statistics.statistics(),
         "label-count": dict(label_counts),
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
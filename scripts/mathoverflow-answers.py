@@ -6,20 +6,25 @@ References
 https://www.cs.cornell.edu/~arb/data/mathoverflow-answers/
 """
 
-import gzip
-from collections import Counter, defaultdict
-from itertools import chain
+import sys
 from pathlib import Path
 
 from more_itertools import first
 from rich.progress import track
 
 from .benson import load_benson_hyperedges
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
+from .utils.dataset_statistics import StatisticsAccumulator
 from .utils.write import (
+    DatasetWriter,
     update_frontmatter,
     write_dataset_metadata,
-    write_edge,
-    write_node,
 )
 from .utils.yaml import patch_dumper
 
@@ -30,33 +35,27 @@ dataset_file = root_dir / "public" / "datasets" / "mathoverflow-answers.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / "mathoverflow-answers.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 nodes, hyperedges = load_benson_hyperedges(root_dir / "data" / "mathoverflow-answers")
 
-node_degrees = defaultdict(int)
-edge_degree_counts = defaultdict(int)
+statistics = StatisticsAccumulator(node_label_key="tags")
 
 # write dataset file
-with gzip.open(dataset_file, "wt") as f:
+with open_gzip(dataset_file, "wt") as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
-    for node in track(nodes, description="Writing nodes"):
-        write_node(f, first(node), tags=node["label"])
-
-    for hyperedge in track(hyperedges, description="Writing hyperedges"):
-        write_edge(f, hyperedge)
-
-        for node in hyperedge.elements:
-            node_degrees[node] += 1
-
-        edge_degree_counts[len(hyperedge.elements)] += 1
+    with DatasetWriter(f, statistics=statistics) as writer:
+        for node in track(nodes, description="Writing nodes"):
+            writer.write_node(first(node), tags=node["label"])
 
-node_degree_counts = defaultdict(int)
-for d in node_degrees.values():
-    node_degree_counts[d] += 1
-node_degree_histogram = dict(sorted(node_degree_counts.items()))
+        for hyperedge in track(hyperedges, description="Writing hyperedges"):
+            writer.write_edge(hyperedge)
 
-label_counts = Counter(chain.from_iterable(x["label"] for x in nodes))
-
-edge_degree_histogram = dict(sorted(edge_degree_counts.items()))
+label_counts = statistics.node_label_counts
 
 # write dataset metadata into existing frontmatter
 update_frontmatter(
@@ -65,12 +64,13 @@ update_frontmatter(
         "attachments": {
             f"revision-{revision}": {"ahorn": dataset_file.name},
         },
-        "statistics": {
-            "num-nodes": len(nodes),
-            "num-interactions": len(hyperedges),
-            "node-degrees": node_degree_histogram,
-            "edge-degrees": edge_degree_histogram,
-        },
+        "statistics": statistics.statistics(),
         "label-count": dict(label_counts),
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
@@ -1,6 +1,6 @@
 """Script to process the Semantic Scholar Coauthorship dataset."""
 
-import gzip
+import sys
 from collections import defaultdict
 from pathlib import Path
 
@@ -9,6 +9,13 @@ import toponetx as tnx
 from more_itertools import first
 from rich.progress import track
 
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
@@ -28,6 +35,12 @@ dataset_file = (
 datasheet_file = root_dir / "src" / "datasets" / "semantic-scholar-coauth-sample.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 # Load dataset
 dataset = tnx.SimplicialComplex()
 simplices_data = np.load(data_path / "150250_simplices.npy", allow_pickle=True)
@@ -39,7 +52,7 @@ for simplex_dim, cochain_dim in zip(simplices_data, cochains_data, strict=True):
             dataset.add_simplex(list(simplex), citations=cochain_dim[simplex])
 
 # write dataset file
-with gzip.open(dataset_file, "wt") as f:
+with open_gzip(dataset_file, "wt") as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
 
     for node in track(dataset.nodes, description="Writing nodes"):
@@ -90,3 +103,9 @@ update_frontmatter(
         },
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
@@ -6,7 +6,7 @@ References
 https://www.cs.cornell.edu/~arb/data/stackoverflow-answers/
 """
 
-import gzip
+import sys
 from collections import Counter
 from itertools import chain
 from pathlib import Path
@@ -15,6 +15,13 @@ import toponetx as tnx
 from more_itertools import first
 from rich.progress import track
 
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
+from .utils.compression import open_gzip
 from .utils.write import (
     update_frontmatter,
     write_dataset_metadata,
@@ -33,12 +40,18 @@ dataset_file = root_dir / "public" / "datasets" / "stackoverflow-answers.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / "stackoverflow-answers.mdx"
 revision = 1
 
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
 nodes, hyperedges = tnx.datasets.benson.load_benson_hyperedges(
     root_dir / "data" / "stackoverflow-answers"
 )
 
 # write dataset file
-with gzip.open(dataset_file, "wt") as f:
+with open_gzip(dataset_file, "wt") as f:
     write_dataset_metadata(f, datasheet_file.stem, revision)
     for node in track(nodes, description="Writing nodes"):
         write_node(f, first(node), tags=node["label"])
@@ -64,3 +77,9 @@ update_frontmatter(
         "label-count": dict(label_counts),
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
-import gzip
-from collections import Counter
-from datetime import UTC, datetime, timedelta
+import sys
 from pathlib import Path
 
 from more_itertools import first
 from rich.progress import track
 
 from .benson import load_benson_sc_nodes, load_benson_simplices
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
 from .utils.boxplot import compute_boxplot_stats_from_histogram
+from .utils.cache import SourceCache
+from .utils.compression import open_gzip
+from .utils.histogram import Histogram
+from .utils.timestamps import format_timestamps
 from .utils.write import (
+    DatasetWriter,
     update_frontmatter,
     write_dataset_metadata,
-    write_edge,
-    write_node,
 )
 from .utils.yaml import patch_dumper
 
@@ -31,34 +38,43 @@ folder = root_dir / "data" / source_folder_name
 dataset_file = root_dir / "public" / "datasets" / f"{slug}.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / f"{slug}.mdx"
 
-nodes = load_benson_sc_nodes(folder)
-simplices = load_benson_simplices(folder)
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
+cache = SourceCache(root_dir / "data" / ".cache")
+nodes = load_benson_sc_nodes(folder, cache=cache)
+simplices = load_benson_simplices(folder, cache=cache)
+times = format_timestamps(
+    [simplex["time"] for simplex in simplices], epoch="dotnet", unit="ms"
+)
 
-node_degrees: Counter[int] = Counter()
-edge_degrees: Counter[int] = Counter()
+node_degrees = Histogram()
+edge_degrees = Histogram()
 written_edges = 0
 
-with gzip.open(dataset_file, "wt") as file:
+with open_gzip(dataset_file, "wt") as file:
     write_dataset_metadata(file, slug, revision)
-    for node in track(nodes, description="Writing nodes"):
-        write_node(file, first(node.elements), name=node["label"])
-
-    for simplex in track(simplices, description="Writing hyperedges"):
-        if len(simplex.elements) < 2:
-            continue
-
-        write_edge(
-            file,
-            simplex,
-            post_id=simplex["label"],
-            time=datetime(1, 1, 1, tzinfo=UTC)
-            + timedelta(milliseconds=simplex["time"]),
-        )
-        node_degrees.update(simplex.elements)
-        edge_degrees[len(simplex.elements)] += 1
-        written_edges += 1
-
-node_degree_histogram = Counter(node_degrees.values())
+    with DatasetWriter(file) as writer:
+        for node in track(nodes, description="Writing nodes"):
+            writer.write_node(first(node.elements), name=node["label"])
+
+        for simplex, time in track(
+            zip(simplices, times, strict=True),
+            description="Writing hyperedges",
+            total=len(simplices),
+        ):
+            if len(simplex.elements) < 2:
+                continue
+
+            writer.write_edge(simplex, post_id=simplex["label"], time=time)
+            node_degrees.update(simplex.elements)
+            edge_degrees.add(len(simplex.elements))
+            written_edges += 1
+
+node_degree_histogram = node_degrees.count_histogram()
 
 update_frontmatter(
     datasheet_file,
@@ -76,3 +92,9 @@ update_frontmatter(
         },
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
-import gzip
-from collections import Counter
-from datetime import UTC, datetime, timedelta
+import sys
 from pathlib import Path
 
+from more_itertools import chunked
 from rich.progress import track
 
-from .benson import load_benson_simplices
+from .benson import iter_benson_simplices
+from .utils.artifacts import (
+    default_manifest,
+    is_run_complete,
+    record_run,
+    resume_requested,
+)
 from .utils.boxplot import compute_boxplot_stats_from_histogram
+from .utils.compression import open_gzip
+from .utils.histogram import Histogram
+from .utils.timestamps import format_timestamps
 from .utils.write import (
+    DatasetWriter,
     update_frontmatter,
     write_dataset_metadata,
-    write_edge,
 )
 from .utils.yaml import patch_dumper
 
@@ -29,32 +37,39 @@ folder = root_dir / "data" / source_folder_name
 dataset_file = root_dir / "public" / "datasets" / f"{slug}.txt.gz"
 datasheet_file = root_dir / "src" / "datasets" / f"{slug}.mdx"
 
-simplices = load_benson_simplices(folder)
+if resume_requested() and is_run_complete(
+    datasheet_file.stem, manifest=default_manifest(dataset_file)
+):
+    print(f"Skipping {datasheet_file.stem}, its outputs are complete and unchanged.")
+    sys.exit()
+
+simplices = iter_benson_simplices(folder)
 
-node_degrees: Counter[int] = Counter()
-edge_degrees: Counter[int] = Counter()
+node_degrees = Histogram()
+edge_degrees = Histogram()
 nodes: set[int] = set()
 written_edges = 0
 
-with gzip.open(dataset_file, "wt") as file:
+with open_gzip(dataset_file, "wt") as file:
     write_dataset_metadata(file, slug, revision)
-    for simplex in track(simplices, description="Writing hyperedges"):
-        nodes.update(simplex.elements)
-        if len(simplex.elements) < 2:
-            continue
+    with DatasetWriter(file) as writer:
+        for batch in chunked(
+            track(simplices, description="Writing hyperedges"), 100_000
+        ):
+            times = format_timestamps(
+                [simplex["time"] for simplex in batch], epoch="dotnet", unit="ms"
+            )
+            for simplex, time in zip(batch, times, strict=True):
+                nodes.update(simplex.elements)
+                if len(simplex.elements) < 2:
+                    continue
 
-        write_edge(
-            file,
-            simplex,
-            thread_id=simplex["label"],
-            time=datetime(1, 1, 1, tzinfo=UTC)
-            + timedelta(milliseconds=simplex["time"]),
-        )
-        node_degrees.update(simplex.elements)
-        edge_degrees[len(simplex.elements)] += 1
-        written_edges += 1
+                writer.write_edge(simplex, thread_id=simplex["label"], time=time)
+                node_degrees.update(simplex.elements)
+                edge_degrees.add(len(simplex.elements))
+                written_edges += 1
 
-node_degree_histogram = Counter(node_degrees.values())
+node_degree_histogram = node_degrees.count_histogram()
 
 update_frontmatter(
     datasheet_file,
@@ -72,3 +87,9 @@ update_frontmatter(
         },
     },
 )
+
+record_run(
+    datasheet_file.stem,
+    [dataset_file, datasheet_file],
+    manifest=default_manifest(dataset_file),
+)
@@ -0,0 +1,369 @@
+"""Utilities for writing artifacts atomically and tracking completed ones.
+
+A script that is interrupted while it writes a file must not leave a truncated file
+behind. All artifacts and datasheets are therefore written to a temporary file in the
+same directory, which is flushed to disk and then atomically renamed over the target.
+Readers either see the previous file or the complete new one.
+
+Once an artifact in ``public/datasets`` is in place, its content hash and sizes are
+recorded in the ``manifest.json`` of its directory. The manifest entry doubles as the
+completion marker of the artifact: ``is_complete`` checks that an existing file is the
+one recorded in the manifest, so resumed runs can trust it, and writers skip replacing
+files whose content is unchanged. The entry of an artifact is removed before the
+artifact is replaced and only recorded again afterwards, so an interruption in between
+never leaves an outdated entry next to a new file.
+
+Once a script has written all of its artifacts and datasheets, ``record_run`` stores
+the hash and size of each of these outputs in the manifest as well, together with a
+hash of the code of the scripts. Scripts that are started with ``--resume`` check
+``is_run_complete`` first and skip all of their expensive steps if neither the outputs
+nor the code have changed since. Resuming trusts that the source data is unchanged, so
+runs are only skipped on request.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import gzip
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+# Errors that indicate a missing or corrupted manifest.
+_MANIFEST_ERRORS = (OSError, ValueError)
+# Directory of the scripts whose code is part of the completion marker of a run.
+_CODE_DIRECTORY = Path(__file__).parent.parent
+
+
+def staging_path_for(path: Path) -> Path:
+    """Return the path of the temporary file that ``path`` is written to first."""
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def fsync_directory(path: Path) -> None:
+    """Flush the entries of a directory to disk, e.g., after a rename."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def replace_atomically(staging_path: Path, path: Path) -> None:
+    """Flush a fully written file to disk and rename it over ``path``.
+
+    Parameters
+    ----------
+    staging_path : Path
+        The temporary file, which must be closed and in the same directory.
+    path : Path
+        The target path.
+    """
+    with staging_path.open("rb") as file:
+        os.fsync(file.fileno())
+    staging_path.replace(path)
+    fsync_directory(path.parent)
+
+
+def default_manifest(path: Path) -> Path:
+    """Return the manifest that records an artifact, next to the artifact itself."""
+    return path.parent / MANIFEST_NAME
+
+
+def read_manifest(path: Path) -> dict[str, Any]:
+    """Read an artifact manifest, or return an empty one if it is missing or invalid."""
+    try:
+        manifest = json.loads(path.read_text())
+    except _MANIFEST_ERRORS:
+        manifest = {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        manifest = {"version": MANIFEST_VERSION}
+    manifest.setdefault("artifacts", {})
+    manifest.setdefault("runs", {})
+    return manifest
+
+
+def _update_manifest(
+    manifest_path: Path, section: str, name: str, entry: dict[str, Any] | None
+) -> None:
+    """Set or, if ``entry`` is `None`, remove an entry of a manifest section.
+
+    The manifest is locked while it is updated, so that scripts running concurrently
+    do not lose each other's entries, and replaced atomically.
+    """
+    lock_path = manifest_path.with_name(manifest_path.name + ".lock")
+    with lock_path.open("w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        manifest = read_manifest(manifest_path)
+        if entry is None:
+            manifest[section].pop(name, None)
+        else:
+            manifest[section][name] = entry
+        manifest[section] = dict(sorted(manifest[section].items()))
+        staging_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        staging_path.write_text(json.dumps(manifest, indent=2) + "\n")
+        replace_atomically(staging_path, manifest_path)
+
+
+def record_artifact(
+    manifest_path: Path, name: str, entry: dict[str, Any] | None
+) -> None:
+    """Record the hash and sizes of an artifact in the manifest.
+
+    Parameters
+    ----------
+    manifest_path : Path
+        Path to the manifest.
+    name : str
+        File name of the artifact.
+    entry : dict[str, Any] | None
+        The ``sha256`` hash and ``size`` of the content and the ``compressed-size`` of
+        the file, or `None` to remove the entry of the artifact.
+    """
+    _update_manifest(manifest_path, "artifacts", name, entry)
+
+
+def replace_recorded(
+    staging_path: Path, path: Path, entry: dict[str, Any], manifest: Path | None
+) -> None:
+    """Replace an artifact by a fully written file and record its new entry.
+
+    The previous entry is removed first, so that an interruption before the new entry
+    is recorded leaves the artifact incomplete instead of trusting an outdated entry.
+
+    Parameters
+    ----------
+    staging_path : Path
+        The temporary file, which must be closed and in the same directory.
+    path : Path
+        The target path.
+    entry : dict[str, Any]
+        The entry of the new content, see `record_artifact`.
+    manifest : Path, optional
+        Path to the manifest, or `None` to only replace ``path``.
+    """
+    if manifest is not None and path.name in read_manifest(manifest)["artifacts"]:
+        record_artifact(manifest, path.name, None)
+    replace_atomically(staging_path, path)
+    if manifest is not None:
+        record_artifact(manifest, path.name, entry)
+
+
+def is_recorded(path: Path, entry: dict[str, Any], manifest: Path | None) -> bool:
+    """Check whether ``path`` exists and holds the content described by ``entry``."""
+    if manifest is None or not path.exists():
+        return False
+    recorded = read_manifest(manifest)["artifacts"].get(path.name)
+    return recorded == entry and path.stat().st_size == entry["compressed-size"]
+
+
+def is_complete(
+    path: Path, *, manifest: Path | None = None, verify: bool = False
+) -> bool:
+    """Check whether an artifact was completely written.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the artifact.
+    manifest : Path, optional
+        Path to the artifact manifest. Defaults to ``manifest.json`` in the directory
+        of ``path``.
+    verify : bool, default=False
+        Whether to also hash the content of the artifact, which is decompressed first
+        if it is a ``.gz`` file. Otherwise, only its size is checked.
+
+    Returns
+    -------
+    bool
+        Whether ``path`` exists and matches its completion marker in the manifest.
+    """
+    if manifest is None:
+        manifest = default_manifest(path)
+    entry = read_manifest(manifest)["artifacts"].get(path.name)
+    if entry is None or not path.exists():
+        return False
+    if path.stat().st_size != entry["compressed-size"]:
+        return False
+    if not verify:
+        return True
+
+    digest = hashlib.sha256()
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest() == entry["sha256"]
+
+
+@contextlib.contextmanager
+def open_atomic(
+    path: Path,
+    mode: Literal["w", "wb"] = "w",
+    *,
+    manifest: Path | Literal[False] | None = None,
+    encoding: str | None = None,
+) -> Iterator[IO[Any]]:
+    """Open a file for writing that only replaces ``path`` once it is complete.
+
+    The content is written to a temporary file next to ``path``. When the ``with``
+    block exits normally, the file is flushed to disk and renamed over ``path``, and
+    its completion marker is recorded in the manifest. If the manifest shows that
+    ``path`` already has the same content, ``path`` is left untouched. If the block
+    raises an exception, the temporary file is removed and ``path`` is left untouched
+    as well.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the output file.
+    mode : {"w", "wb"}, default="w"
+        Whether to open the file in text or binary mode.
+    manifest : Path | False, optional
+        Path to the JSON manifest that records completed artifacts. Defaults to
+        ``manifest.json`` in the directory of ``path``. If `False`, no completion
+        marker is recorded and ``path`` is always replaced.
+    encoding : str, optional
+        Passed to ``open`` in text mode.
+
+    Yields
+    ------
+    IO
+        A writable file object.
+    """
+    if manifest is None:
+        manifest = default_manifest(path)
+    staging_path = staging_path_for(path)
+    try:
+        with staging_path.open(mode, encoding=encoding) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+    except BaseException:
+        staging_path.unlink(missing_ok=True)
+        raise
+
+    if manifest is False:
+        staging_path.replace(path)
+        fsync_directory(path.parent)
+        return
+
+    digest = hashlib.sha256()
+    with staging_path.open("rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    size = staging_path.stat().st_size
+    entry = {"sha256": digest.hexdigest(), "size": size, "compressed-size": size}
+    if is_recorded(path, entry, manifest):
+        staging_path.unlink()
+        return
+    replace_recorded(staging_path, path, entry, manifest)
+
+
+def _file_entry(path: Path) -> dict[str, Any]:
+    """Return the hash and size of the raw bytes of a file."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return {"sha256": digest.hexdigest(), "size": path.stat().st_size}
+
+
+def _code_hash() -> str:
+    """Hash the code of all scripts and their utilities.
+
+    Any change to a script or to a shared parser therefore invalidates all runs.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(_CODE_DIRECTORY.rglob("*.py")):
+        digest.update(path.relative_to(_CODE_DIRECTORY).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def resume_requested(argv: Sequence[str] | None = None) -> bool:
+    """Check whether a script was started with ``--resume``.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        The command line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    bool
+        Whether completed runs should be skipped, see `is_run_complete`.
+    """
+    return "--resume" in (sys.argv[1:] if argv is None else argv)
+
+
+def record_run(name: str, outputs: Iterable[Path], *, manifest: Path) -> None:
+    """Record that a run completely wrote its outputs.
+
+    Call this once all artifacts and datasheets of a script are written. The hash of
+    the code and the hash and size of every output are the completion marker of the
+    run, see `is_run_complete`.
+
+    Parameters
+    ----------
+    name : str
+        Name of the run, usually the slug of the datasheet.
+    outputs : Iterable[Path]
+        All files written by the run, e.g., artifacts and datasheets.
+    manifest : Path
+        Path to the manifest, usually the one of the artifacts.
+    """
+    entry = {
+        "code": _code_hash(),
+        "outputs": {
+            os.path.relpath(path, manifest.parent): _file_entry(path)
+            for path in sorted(set(outputs))
+        },
+    }
+    _update_manifest(manifest, "runs", name, entry)
+
+
+def is_run_complete(name: str, *, manifest: Path) -> bool:
+    """Check whether a previous run completely wrote outputs that are unchanged since.
+
+    The source data of the run is not checked, so scripts only skip completed runs if
+    they are started with ``--resume``, see `resume_requested`.
+
+    Parameters
+    ----------
+    name : str
+        Name of the run, as passed to `record_run`.
+    manifest : Path
+        Path to the manifest.
+
+    Returns
+    -------
+    bool
+        Whether the run was recorded with the current code and all of its outputs
+        still exist with the recorded size and hash. Editing a script or a parser, or
+        editing or deleting an output, e.g., a datasheet, therefore causes the run to
+        be repeated.
+    """
+    entry = read_manifest(manifest)["runs"].get(name)
+    if not isinstance(entry, dict) or not entry.get("outputs"):
+        return False
+    if entry.get("code") != _code_hash():
+        return False
+    outputs = entry["outputs"]
+    for relative_path, output in outputs.items():
+        path = manifest.parent / relative_path
+        if not path.is_file() or path.stat().st_size != output["size"]:
+            return False
+    return all(
+        _file_entry(manifest.parent / relative_path) == output
+        for relative_path, output in outputs.items()
+    )
@@ -1,10 +1,31 @@
-"""Utilities for computing box-plot five-number summaries."""
+"""Utilities for computing box-plot five-number summaries.
 
+Quartiles are the medians of the lower and upper halves of the sorted values, where the
+median itself belongs to neither half if the number of values is odd. Every statistic
+is therefore the value at a known rank, or the mean of the values at two adjacent
+ranks, so only these ranks need to be located instead of sorting all values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
 from statistics import median
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
+
+import numpy as np
+
+from .histogram import Histogram
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Iterable
+
+    from numpy.typing import ArrayLike
+
+    from .quantile_sketch import QuantileSketch
+
+
+# Integers up to this magnitude are exactly representable as 64-bit floats.
+_MAX_EXACT_FLOAT_INTEGER = 2**53
 
 
 class BoxPlotStats(TypedDict):
@@ -22,8 +43,97 @@ def _clean(value: int | float) -> int | float:
     return int(value) if float(value).is_integer() else float(value)
 
 
-def compute_boxplot_stats(values: Iterable[int | float]) -> BoxPlotStats:
-    """Compute box-plot statistics from numeric observations."""
+def _median_ranks(start: int, length: int) -> tuple[int, int]:
+    """Return the ranks whose values average to the median of a run of ranks."""
+    midpoint = start + length // 2
+    return (midpoint - 1, midpoint) if length % 2 == 0 else (midpoint, midpoint)
+
+
+def _boxplot_ranks(total_count: int) -> dict[str, tuple[int, int]]:
+    """Return the pair of ranks that determines each statistic of the summary."""
+    half = total_count // 2
+    median_ranks = _median_ranks(0, total_count)
+    return {
+        "min": (0, 0),
+        "q1": _median_ranks(0, half) if half else median_ranks,
+        "median": median_ranks,
+        "q3": _median_ranks(total_count - half, half) if half else median_ranks,
+        "max": (total_count - 1, total_count - 1),
+    }
+
+
+def _summarize(
+    total_count: int, values_at_ranks: Callable[[list[int]], dict[int, int | float]]
+) -> BoxPlotStats:
+    """Compute box-plot statistics from the values at the ranks they depend on.
+
+    Parameters
+    ----------
+    total_count : int
+        The number of observations.
+    values_at_ranks : Callable[[list[int]], dict[int, int | float]]
+        Returns the values at the given sorted ranks of the sorted observations, as
+        Python scalars.
+
+    Returns
+    -------
+    BoxPlotStats
+        The five-number summary.
+    """
+    if total_count == 0:
+        raise ValueError("Cannot compute box-plot statistics from no values.")
+
+    ranks = _boxplot_ranks(total_count)
+    values = values_at_ranks(sorted({rank for pair in ranks.values() for rank in pair}))
+    stats = {}
+    for name, (lower, upper) in ranks.items():
+        value = values[lower] if lower == upper else (values[lower] + values[upper]) / 2
+        stats[name] = _clean(value)
+    return BoxPlotStats(**stats)
+
+
+def compute_boxplot_stats(values: Iterable[int | float] | np.ndarray) -> BoxPlotStats:
+    """Compute box-plot statistics from numeric observations.
+
+    Numeric values are selected with ``np.partition``, which only places the values at
+    the needed ranks instead of sorting all of them.
+
+    Parameters
+    ----------
+    values : Iterable[int | float] | np.ndarray
+        The observations, e.g., a list or a NumPy array of degrees.
+
+    Returns
+    -------
+    BoxPlotStats
+        The five-number summary.
+    """
+    if isinstance(values, np.ndarray):
+        array = values.ravel()
+        exact = array.dtype.kind in "iuf"
+    else:
+        values = list(values)
+        array = np.asarray(values)
+        # Integers beyond 64 bits make an object array, and integers beyond 2**53
+        # lose precision if they are converted to floats along with other values.
+        exact = array.dtype.kind in "iu" or (
+            array.dtype.kind == "f"
+            and not (len(array) and np.abs(array).max() > _MAX_EXACT_FLOAT_INTEGER)
+        )
+    if not exact:
+        return _compute_boxplot_stats_sorted(
+            values if isinstance(values, list) else array.tolist()
+        )
+
+    def values_at_ranks(ranks: list[int]) -> dict[int, int | float]:
+        partitioned = np.partition(array, ranks)
+        return dict(zip(ranks, partitioned[ranks].tolist(), strict=True))
+
+    return _summarize(len(array), values_at_ranks)
+
+
+def _compute_boxplot_stats_sorted(values: list[int | float]) -> BoxPlotStats:
+    """Compute box-plot statistics by sorting arbitrary comparable numbers."""
     sorted_values = sorted(values)
     if not sorted_values:
         raise ValueError("Cannot compute box-plot statistics from no values.")
@@ -47,60 +157,99 @@ def compute_boxplot_stats(values: Iterable[int | float]) -> BoxPlotStats:
 
 
 def compute_boxplot_stats_from_histogram(
-    histogram: Mapping[int, int],
+    histogram: Mapping[int, int] | tuple[ArrayLike, ArrayLike] | Histogram,
 ) -> BoxPlotStats:
-    """Compute box-plot statistics from a value-frequency histogram."""
-    entries = sorted((value, count) for value, count in histogram.items() if count > 0)
-    total_count = sum(count for _, count in entries)
-    if total_count == 0:
-        raise ValueError("Cannot compute box-plot statistics from no values.")
-
-    def value_at_rank(rank: int) -> int:
-        current_count = 0
-        for value, count in entries:
-            current_count += count
-            if current_count > rank:
-                return value
-        return entries[-1][0]
-
-    midpoint = total_count // 2
-    median_value = (
-        (value_at_rank(midpoint - 1) + value_at_rank(midpoint)) / 2
-        if total_count % 2 == 0
-        else value_at_rank(midpoint)
-    )
-
-    lower_length = midpoint
-    if lower_length:
-        lower_midpoint = lower_length // 2
-        q1 = (
-            (value_at_rank(lower_midpoint - 1) + value_at_rank(lower_midpoint)) / 2
-            if lower_length % 2 == 0
-            else value_at_rank(lower_midpoint)
-        )
+    """Compute box-plot statistics from a value-frequency histogram.
+
+    The cumulative counts of the sorted values are computed once, and the value at
+    each needed rank is found by binary search. The minimum and maximum are reported
+    as given, e.g., a float key of ``2.0`` stays a float, while the other statistics
+    are represented as integers if they are integral.
+
+    Parameters
+    ----------
+    histogram : Mapping[int, int] | tuple[ArrayLike, ArrayLike] | Histogram
+        The frequency of each value, either as a mapping, as a pair of arrays of
+        values and their counts, or as a `Histogram`. Values with a count of zero are
+        ignored.
+
+    Returns
+    -------
+    BoxPlotStats
+        The five-number summary.
+    """
+    keys = None
+    if isinstance(histogram, Histogram):
+        values, counts = histogram.values, histogram.counts
+    elif isinstance(histogram, Mapping):
+        keys = list(histogram.keys())
+        values = np.asarray(keys)
+        counts = np.asarray(list(histogram.values()))
     else:
-        q1 = median_value
-
-    upper_start = midpoint + total_count % 2
-    upper_length = total_count - upper_start
-    if upper_length:
-        upper_midpoint = upper_length // 2
-        q3 = (
-            (
-                value_at_rank(upper_start + upper_midpoint - 1)
-                + value_at_rank(upper_start + upper_midpoint)
-            )
-            / 2
-            if upper_length % 2 == 0
-            else value_at_rank(upper_start + upper_midpoint)
-        )
+        values, counts = map(np.asarray, histogram)
+    # The positions of the remaining values in the histogram, to report the extremes
+    # as given.
+    positions = np.flatnonzero(counts > 0)
+    values, counts = values[positions], counts[positions]
+    if len(values) > 1 and not np.all(values[:-1] <= values[1:]):
+        order = np.argsort(values, kind="stable")
+        values, counts, positions = values[order], counts[order], positions[order]
+    cumulative_counts = np.cumsum(counts)
+    total_count = int(cumulative_counts[-1]) if len(cumulative_counts) else 0
+
+    def values_at_ranks(ranks: list[int]) -> dict[int, int | float]:
+        # The value at a rank is the first one whose cumulative count exceeds it.
+        indices = np.searchsorted(cumulative_counts, ranks, side="right")
+        return dict(zip(ranks, values[indices].tolist(), strict=True))
+
+    stats = _summarize(total_count, values_at_ranks)
+    if keys is not None:
+        stats["min"], stats["max"] = keys[positions[0]], keys[positions[-1]]
     else:
-        q3 = median_value
+        stats["min"], stats["max"] = values[0].item(), values[-1].item()
+    return stats
+
 
+def compute_boxplot_stats_from_sketch(sketch: QuantileSketch) -> BoxPlotStats:
+    """Compute approximate box-plot statistics from a quantile sketch.
+
+    The minimum and maximum are exact, while the true rank of every other statistic
+    deviates from the rank it depends on by at most ``sketch.rank_error`` times the
+    number of observations, with high probability.
+
+    Parameters
+    ----------
+    sketch : QuantileSketch
+        The sketch of the observations.
+
+    Returns
+    -------
+    BoxPlotStats
+        The approximate five-number summary.
+    """
+
+    def values_at_ranks(ranks: list[int]) -> dict[int, int | float]:
+        return dict(zip(ranks, sketch.values_at_ranks(ranks).tolist(), strict=True))
+
+    return _summarize(sketch.total, values_at_ranks)
+
+
+def approximate_boxplot_stats(sketch: QuantileSketch) -> dict[str, Any]:
+    """Compute approximate box-plot statistics for the datasheet frontmatter.
+
+    Parameters
+    ----------
+    sketch : QuantileSketch
+        The sketch of the observations.
+
+    Returns
+    -------
+    dict[str, Any]
+        The approximate five-number summary, with ``approximate`` set to true and the
+        normalized ``rank-error`` of the summary.
+    """
     return {
-        "min": entries[0][0],
-        "q1": _clean(q1),
-        "median": _clean(median_value),
-        "q3": _clean(q3),
-        "max": entries[-1][0],
+        **compute_boxplot_stats_from_sketch(sketch),
+        "approximate": True,
+        "rank-error": round(sketch.rank_error, 6),
     }
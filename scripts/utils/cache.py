@@ -0,0 +1,275 @@
+"""Persistent on-disk cache for parsed source files.
+
+Parsing the raw text files of large source datasets is expensive, and many scripts
+parse the same files on every run. This module stores parsed ``HyperedgeTable``
+instances as raw ``.npy`` files that are memory-mapped on later runs.
+
+An entry is valid as long as its source files and the parser are unchanged. Unchanged
+files are detected by their size and modification time; if only the modification time
+differs, the content hash decides. The parser is identified by a version string, e.g., a
+hash of its code, that callers pass along with the sources. The total size of the cache is capped by evicting the least
+recently used entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .artifacts import open_atomic
+from .hyperedge_table import HyperedgeTable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+CACHE_FORMAT_VERSION = 1
+_MANIFEST_NAME = "manifest.json"
+_COLUMNS = ("offsets", "indices", "label_codes", "times")
+# Errors that indicate an unreadable or corrupted cache entry.
+_ENTRY_ERRORS = (OSError, ValueError, KeyError)
+
+
+def _content_hash(path: Path) -> str:
+    """Compute the BLAKE2b hash of a file's content."""
+    digest = hashlib.blake2b()
+    with path.open("rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint(path: Path) -> dict[str, Any]:
+    """Compute the size, modification time and content hash of a file."""
+    stat = path.stat()
+    return {
+        "path": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "hash": _content_hash(path),
+    }
+
+
+def _directory_size(path: Path) -> int:
+    """Return the total size of all files in a directory."""
+    return sum(file.stat().st_size for file in path.iterdir() if file.is_file())
+
+
+class SourceCache:
+    """A size-capped cache of parsed source files.
+
+    Parameters
+    ----------
+    directory : Path | str
+        Directory to store the cache entries in. Created on demand.
+    max_size : int, default=16 GiB
+        Maximum total size of the cache in bytes. When exceeded after storing a new
+        entry, the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: Path | str, *, max_size: int = 16 << 30) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def _sources_unchanged(self, manifest: dict[str, Any], sources: list[Path]) -> bool:
+        """Check whether the source files still match the manifest.
+
+        The content hash is only computed if the size matches but the modification
+        time does not; a matching hash refreshes the recorded modification time.
+        """
+        recorded = manifest["sources"]
+        if [entry["path"] for entry in recorded] != [
+            str(source.resolve()) for source in sources
+        ]:
+            return False
+
+        refreshed = False
+        for entry, source in zip(recorded, sources, strict=True):
+            if not source.exists():
+                return False
+            stat = source.stat()
+            if stat.st_size != entry["size"]:
+                return False
+            if stat.st_mtime_ns != entry["mtime"]:
+                if _content_hash(source) != entry["hash"]:
+                    return False
+                entry["mtime"] = stat.st_mtime_ns
+                refreshed = True
+
+        if refreshed:
+            manifest_path = self.directory / manifest["name"] / _MANIFEST_NAME
+            with open_atomic(manifest_path, manifest=False) as file:
+                json.dump(manifest, file)
+        return True
+
+    def load(
+        self, name: str, sources: Iterable[Path], *, parser: str | None = None
+    ) -> HyperedgeTable | None:
+        """Load a cached table, memory-mapping its columns.
+
+        Parameters
+        ----------
+        name : str
+            Name of the cache entry.
+        sources : Iterable[Path]
+            The source files the entry was parsed from.
+        parser : str, optional
+            Version of the parser. Entries stored by another version are invalid.
+
+        Returns
+        -------
+        HyperedgeTable | None
+            The cached table, or `None` if there is no valid entry. Invalid entries
+            are removed.
+        """
+        entry_dir = self.directory / name
+        manifest_path = entry_dir / _MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+
+        columns = None
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            if (
+                manifest.get("version") == CACHE_FORMAT_VERSION
+                and manifest.get("parser") == parser
+                and self._sources_unchanged(manifest, list(sources))
+            ):
+                # Truncated or corrupted columns fail to load and invalidate the entry.
+                columns = {
+                    column: np.load(entry_dir / f"{column}.npy", mmap_mode="r")
+                    for column in _COLUMNS
+                    if column in manifest["columns"]
+                }
+        except _ENTRY_ERRORS:
+            columns = None
+        if columns is None:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        # Mark the entry as recently used for the eviction policy.
+        manifest_path.touch()
+
+        return HyperedgeTable(
+            columns["offsets"],
+            columns["indices"],
+            label_codes=columns.get("label_codes"),
+            label_categories=manifest.get("label_categories"),
+            times=columns.get("times"),
+        )
+
+    def store(
+        self,
+        name: str,
+        sources: Iterable[Path],
+        table: HyperedgeTable,
+        *,
+        parser: str | None = None,
+    ) -> None:
+        """Store a parsed table in the cache.
+
+        Parameters
+        ----------
+        name : str
+            Name of the cache entry.
+        sources : Iterable[Path]
+            The source files the table was parsed from.
+        table : HyperedgeTable
+            The parsed table.
+        parser : str, optional
+            Version of the parser that parsed the table.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry_dir = self.directory / name
+
+        columns = [column for column in _COLUMNS if getattr(table, column) is not None]
+        manifest = {
+            "version": CACHE_FORMAT_VERSION,
+            "name": name,
+            "parser": parser,
+            "sources": [_fingerprint(source) for source in sources],
+            "columns": columns,
+            "label_categories": table.label_categories,
+        }
+
+        # Write into a temporary directory first so that an interrupted run never
+        # leaves a partial entry behind.
+        staging_dir = Path(tempfile.mkdtemp(dir=self.directory, prefix=".staging-"))
+        try:
+            for column in columns:
+                np.save(staging_dir / f"{column}.npy", getattr(table, column))
+            (staging_dir / _MANIFEST_NAME).write_text(json.dumps(manifest))
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            staging_dir.rename(entry_dir)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        self.evict(keep=name)
+
+    def evict(self, *, keep: str | None = None) -> None:
+        """Evict least recently used entries until the cache fits its size cap.
+
+        Parameters
+        ----------
+        keep : str, optional
+            Name of an entry that must not be evicted.
+        """
+        if not self.directory.exists():
+            return
+
+        entries = [
+            entry
+            for entry in self.directory.iterdir()
+            if entry.is_dir() and (entry / _MANIFEST_NAME).exists()
+        ]
+        sizes = {entry: _directory_size(entry) for entry in entries}
+        total_size = sum(sizes.values())
+
+        for entry in sorted(
+            entries, key=lambda entry: (entry / _MANIFEST_NAME).stat().st_mtime_ns
+        ):
+            if total_size <= self.max_size:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= sizes[entry]
+
+    def get_or_parse(
+        self,
+        name: str,
+        sources: Iterable[Path],
+        parse: Callable[[], HyperedgeTable],
+        *,
+        parser: str | None = None,
+    ) -> HyperedgeTable:
+        """Load a table from the cache, or parse and store it on a miss.
+
+        Parameters
+        ----------
+        name : str
+            Name of the cache entry.
+        sources : Iterable[Path]
+            The source files the table is parsed from.
+        parse : Callable[[], HyperedgeTable]
+            Function that parses the source files.
+        parser : str, optional
+            Version of the parser, e.g., a hash of its code. Entries stored by another
+            version are parsed again.
+
+        Returns
+        -------
+        HyperedgeTable
+            The cached or freshly parsed table.
+        """
+        sources = list(sources)
+        table = self.load(name, sources, parser=parser)
+        if table is None:
+            table = parse()
+            self.store(name, sources, table, parser=parser)
+        return table
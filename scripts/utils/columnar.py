@@ -0,0 +1,354 @@
+"""Utilities for writing dataset files in a columnar binary layout.
+
+Loading a dataset from its text file means parsing a line and a JSON payload per node
+and edge. A ``ColumnarDataset`` that is attached to a `DatasetWriter` collects the same
+nodes and edges as arrays instead, and writes them as a companion file next to the text
+file:
+
+``node-ids``
+    The identifier of every node, in order of first appearance. Nodes that only occur in
+    edges are included; those that first occur in a hyperedge table are added in sorted
+    order.
+``edge-offsets``, ``edge-indices``
+    The edges in compressed sparse row form: edge ``i`` consists of the nodes
+    ``node-ids[edge-indices[edge-offsets[i]:edge-offsets[i + 1]]]``.
+``node/<attribute>``, ``edge/<attribute>``
+    One typed column per attribute. Booleans, integers, floats and datetimes are stored
+    as NumPy arrays of the corresponding type, with a ``<column>/valid`` mask if some
+    rows lack the attribute. Strings and all other values, including integers beyond
+    64 bits, which are encoded as JSON, are stored as ``<column>/codes`` into
+    ``<column>/categories``, with code ``-1`` for rows that lack the attribute.
+
+The companion file is an uncompressed NumPy ``.npz`` archive, so it can be read with
+``np.load``. Because its members are stored uncompressed, ``load_columns`` can also
+memory-map every array without reading the file.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zipfile
+from array import array
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .artifacts import open_atomic
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Hashable, Iterable
+    from pathlib import Path
+
+    from .hyperedge_table import HyperedgeTable
+
+# Fixed modification time of the archive members, so that the output is reproducible.
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+# Size of the fixed part of a local file header in a ZIP archive.
+_LOCAL_HEADER_SIZE = 30
+
+
+def columnar_path_for(dataset_path: Path) -> Path:
+    """Return the path of the columnar companion file of a dataset file.
+
+    Parameters
+    ----------
+    dataset_path : Path
+        Path to the dataset file, e.g., ``walmart-trips.txt.gz``.
+
+    Returns
+    -------
+    Path
+        Path to the companion file, e.g., ``walmart-trips.columns.npz``.
+    """
+    name = dataset_path.name.removesuffix(".gz").removesuffix(".txt")
+    return dataset_path.with_name(f"{name}.columns.npz")
+
+
+def _categorical(values: list[Any]) -> dict[str, np.ndarray]:
+    """Encode values as codes into their distinct values, with -1 for `None`."""
+    code_table: dict[Any, int] = {}
+    codes = [
+        -1 if value is None else code_table.setdefault(value, len(code_table))
+        for value in values
+    ]
+    return {
+        "codes": np.asarray(codes, dtype=np.int32),
+        "categories": np.asarray(list(code_table), dtype=np.str_),
+    }
+
+
+def _typed_column(values: list[Any]) -> dict[str, np.ndarray]:
+    """Store attribute values as a typed column, keyed by the member name suffix."""
+    present = [value for value in values if value is not None]
+    types = {type(value) for value in present}
+    # Integers beyond 64 bits are stored as JSON, since a float column would round them.
+    fits_int64 = all(
+        -(2**63) <= value < 2**63 for value in present if type(value) is int
+    )
+    fill: Any
+    if types <= {bool}:
+        dtype, fill = np.bool_, False
+    elif types <= {int} and fits_int64:
+        dtype, fill = np.int64, 0
+    elif types <= {int, float} and fits_int64:
+        dtype, fill = np.float64, np.nan
+    elif all(isinstance(value, datetime) for value in present):
+        dtype, fill = np.dtype("datetime64[us]"), None
+        values = [
+            value.astimezone(UTC).replace(tzinfo=None)
+            if value is not None and value.tzinfo is not None
+            else value
+            for value in values
+        ]
+    elif types <= {str}:
+        return _categorical(values)
+    else:
+        return _categorical(
+            [None if value is None else json.dumps(value) for value in values]
+        )
+
+    if len(present) == len(values):
+        return {"": np.asarray(values, dtype=dtype)}
+    return {
+        "": np.asarray([fill if value is None else value for value in values], dtype),
+        "valid": np.asarray([value is not None for value in values], dtype=np.bool_),
+    }
+
+
+class _Columns:
+    """Attribute values per name, indexed by row."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, list[Any]] = {}
+
+    def set(self, row: int, attributes: dict[str, Any]) -> None:
+        """Set the attribute values of a row."""
+        for name, value in attributes.items():
+            column = self.values.setdefault(name, [])
+            if len(column) <= row:
+                column.extend([None] * (row + 1 - len(column)))
+            column[row] = value
+
+    def set_range(self, name: str, start: int, values: list[Any]) -> None:
+        """Set the values of an attribute for consecutive rows."""
+        column = self.values.setdefault(name, [])
+        stop = start + len(values)
+        column.extend([None] * (stop - len(column)))
+        column[start:stop] = values
+
+    def arrays(self, prefix: str, num_rows: int) -> dict[str, np.ndarray]:
+        """Return the typed columns, padded to ``num_rows`` rows."""
+        arrays = {}
+        for name, column in self.values.items():
+            column.extend([None] * (num_rows - len(column)))
+            for suffix, values in _typed_column(column).items():
+                arrays[f"{prefix}/{name}/{suffix}".removesuffix("/")] = values
+        return arrays
+
+
+class ColumnarDataset:
+    """Nodes, edges and attributes of a dataset, collected as columns while writing.
+
+    Examples
+    --------
+    >>> columns = ColumnarDataset()
+    >>> with open_gzip(dataset_file, "wt") as file:  # doctest: +SKIP
+    ...     write_dataset_metadata(file, slug, revision)
+    ...     with DatasetWriter(file, columns=columns) as writer:
+    ...         writer.write_nodes(nodes)
+    ...         writer.write_edges(hyperedges, label_key="label")
+    >>> columns.write(columnar_path_for(dataset_file))  # doctest: +SKIP
+    """
+
+    def __init__(self) -> None:
+        self._node_positions: dict[Hashable, int] = {}
+        self._edge_offsets = array("q", [0])
+        self._edge_indices = array("q")
+        self._node_columns = _Columns()
+        self._edge_columns = _Columns()
+
+    @property
+    def num_nodes(self) -> int:
+        """The number of distinct nodes that were written or occur in an edge."""
+        return len(self._node_positions)
+
+    @property
+    def num_edges(self) -> int:
+        """The number of written edges."""
+        return len(self._edge_offsets) - 1
+
+    def _position(self, node: Hashable) -> int:
+        """Return the position of a node in ``node-ids``, adding it if necessary."""
+        return self._node_positions.setdefault(node, len(self._node_positions))
+
+    def add_node(
+        self, node: Hashable, attributes: dict[str, Any] | None = None
+    ) -> None:
+        """Record a node that is written to the dataset.
+
+        Parameters
+        ----------
+        node : Hashable
+            Node identifier.
+        attributes : dict[str, Any], optional
+            Metadata attributes of the node.
+        """
+        position = self._position(node)
+        if attributes:
+            self._node_columns.set(position, attributes)
+
+    def add_edge(
+        self, elements: Collection[Hashable], attributes: dict[str, Any] | None = None
+    ) -> None:
+        """Record an edge that is written to the dataset.
+
+        Parameters
+        ----------
+        elements : Collection[Hashable]
+            Node identifiers that form the edge.
+        attributes : dict[str, Any], optional
+            Metadata attributes of the edge.
+        """
+        row = self.num_edges
+        self._edge_indices.extend(map(self._position, elements))
+        self._edge_offsets.append(len(self._edge_indices))
+        if attributes:
+            self._edge_columns.set(row, attributes)
+
+    def add_table(
+        self,
+        edges: HyperedgeTable,
+        attributes: Iterable[dict[str, Any]] | None = None,
+        *,
+        label_key: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Record all hyperedges of a table at once.
+
+        Parameters
+        ----------
+        edges : HyperedgeTable
+            The hyperedges that are written to the dataset.
+        attributes : Iterable[dict[str, Any]], optional
+            Metadata attributes of each hyperedge.
+        label_key : str, optional
+            If given, the labels of the table are recorded as an attribute with this
+            name.
+        **kwargs
+            Metadata attributes shared by all hyperedges.
+        """
+        start = self.num_edges
+        nodes, inverse = np.unique(edges.indices, return_inverse=True)
+        positions = np.fromiter(
+            map(self._position, nodes.tolist()), dtype=np.int64, count=len(nodes)
+        )
+        self._edge_indices.extend(positions[inverse].tolist())
+        base = self._edge_offsets[-1]
+        self._edge_offsets.extend((edges.offsets[1:].astype(np.int64) + base).tolist())
+        stop = self.num_edges
+
+        for name, value in kwargs.items():
+            self._edge_columns.set_range(name, start, [value] * (stop - start))
+        if attributes is not None:
+            for row, edge_attributes in enumerate(attributes, start):
+                self._edge_columns.set(row, edge_attributes)
+        if label_key is not None:
+            labels = edges.labels
+            if labels is None:
+                raise ValueError("The table has no labels.")
+            self._edge_columns.set_range(
+                label_key,
+                start,
+                [
+                    list(label) if isinstance(label, tuple) else label
+                    for label in labels
+                ],
+            )
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """Return all columns as arrays, keyed by their member names."""
+        node_ids = list(self._node_positions)
+        if all(type(node) is int for node in node_ids):
+            node_id_array = np.asarray(node_ids, dtype=np.int64)
+        else:
+            node_id_array = np.asarray(list(map(str, node_ids)), dtype=np.str_)
+        return {
+            "node-ids": node_id_array,
+            "edge-offsets": np.frombuffer(self._edge_offsets, dtype=np.int64),
+            "edge-indices": np.frombuffer(self._edge_indices, dtype=np.int64),
+            **self._node_columns.arrays("node", self.num_nodes),
+            **self._edge_columns.arrays("edge", self.num_edges),
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the columns to an uncompressed, reproducible ``.npz`` archive.
+
+        The archive replaces ``path`` atomically once it is complete.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the companion file.
+        """
+        with (
+            open_atomic(path, "wb") as file,
+            zipfile.ZipFile(file, "w", zipfile.ZIP_STORED) as archive,
+        ):
+            for name, values in self.arrays().items():
+                info = zipfile.ZipInfo(f"{name}.npy", date_time=_ZIP_DATE_TIME)
+                with archive.open(info, "w", force_zip64=True) as member:
+                    np.lib.format.write_array(member, values, allow_pickle=False)
+
+
+def load_columns(path: Path, *, mmap: bool = True) -> dict[str, np.ndarray]:
+    """Load the columns of a companion file.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the companion file.
+    mmap : bool, default=True
+        Whether to memory-map the arrays read-only instead of reading them.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The columns, keyed by their member names without the ``.npy`` suffix.
+    """
+    if not mmap:
+        with np.load(path, allow_pickle=False) as archive:
+            return {name: archive[name] for name in archive.files}
+
+    columns = {}
+    with zipfile.ZipFile(path) as archive, path.open("rb") as file:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Member `{info.filename}` is compressed.")
+            file.seek(info.header_offset)
+            header = file.read(_LOCAL_HEADER_SIZE)
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            file.seek(
+                info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+            )
+
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+
+            name = info.filename.removesuffix(".npy")
+            if 0 in shape:
+                columns[name] = np.empty(shape, dtype=dtype)
+                continue
+            columns[name] = np.memmap(
+                path,
+                dtype=dtype,
+                mode="r",
+                offset=file.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    return columns
@@ -0,0 +1,532 @@
+"""Utilities for reading and writing compressed files.
+
+Raw source files may be stored compressed with gzip, bzip2 or xz to save disk space and
+bandwidth. ``find_source`` locates the plain or compressed variant of a file, and
+``open_source`` opens either variant transparently. Compressed files are decompressed
+in a background thread, so decompression overlaps with parsing in the caller; the
+decompressors release the GIL while they work.
+
+Dataset files are written with ``open_gzip``, which compresses blocks of the output in
+parallel threads. Its output is reproducible and replaces the target file atomically,
+and the content hash of every written file is recorded in a manifest, so that unchanged
+files are not replaced. Writers can also start a new gzip member at a line boundary and
+report its compressed offset once the file is closed, so that readers can seek directly
+to the member and decompress from there.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import hashlib
+import io
+import lzma
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Literal
+
+from .artifacts import (
+    default_manifest,
+    is_recorded,
+    replace_recorded,
+    staging_path_for,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+COMPRESSED_OPENERS: dict[str, Callable[..., Any]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+
+def find_source(path: Path) -> Path | None:
+    """Find the plain or compressed variant of a source file.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the plain source file.
+
+    Returns
+    -------
+    Path | None
+        ``path`` if it exists, otherwise the first existing variant with a ``.gz``,
+        ``.bz2`` or ``.xz`` suffix, or `None` if no variant exists.
+    """
+    if path.exists():
+        return path
+    for suffix in COMPRESSED_OPENERS:
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def is_compressed(path: Path) -> bool:
+    """Return whether a source file is compressed, judged by its suffix."""
+    return path.suffix in COMPRESSED_OPENERS
+
+
+class _BackgroundDecompressor(io.RawIOBase):
+    """Raw binary stream that decompresses a file in a background thread.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the compressed file.
+    block_size : int
+        Size of the decompressed blocks handed over from the background thread.
+    max_pending_blocks : int
+        Maximum number of decompressed blocks that are buffered ahead of the reader.
+    """
+
+    def __init__(self, path: Path, block_size: int, max_pending_blocks: int) -> None:
+        super().__init__()
+        self._opener = COMPRESSED_OPENERS[path.suffix]
+        self._path = path
+        self._block_size = block_size
+        self._blocks: queue.Queue[bytes | BaseException | None] = queue.Queue(
+            max_pending_blocks
+        )
+        self._stopped = threading.Event()
+        self._current = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(target=self._decompress, daemon=True)
+        self._thread.start()
+
+    def _put(self, item: bytes | BaseException | None) -> bool:
+        """Hand an item to the reader, giving up once the stream is closed."""
+        while not self._stopped.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _decompress(self) -> None:
+        try:
+            with self._opener(self._path, "rb") as file:
+                while block := file.read(self._block_size):
+                    if not self._put(block):
+                        return
+        except Exception as error:  # noqa: BLE001
+            # Errors are re-raised in the reading thread.
+            self._put(error)
+            return
+        self._put(None)
+
+    def readable(self) -> bool:
+        """Return whether the stream is readable, which it always is."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read decompressed bytes into a pre-allocated buffer.
+
+        Parameters
+        ----------
+        buffer : writable bytes-like object
+            The buffer to fill.
+
+        Returns
+        -------
+        int
+            The number of bytes read, or 0 at the end of the stream.
+        """
+        while not self._current and not self._eof:
+            item = self._blocks.get()
+            if item is None:
+                self._eof = True
+            elif isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            else:
+                self._current = memoryview(item)
+
+        size = min(len(buffer), len(self._current))
+        buffer[:size] = self._current[:size]
+        self._current = self._current[size:]
+        return size
+
+    def close(self) -> None:
+        """Stop the background thread and close the stream."""
+        if not self.closed:
+            self._stopped.set()
+            self._thread.join()
+        super().close()
+
+
+def open_source(
+    path: Path,
+    mode: str = "r",
+    *,
+    block_size: int = 1 << 20,
+    max_pending_blocks: int = 16,
+) -> Any:
+    """Open a plain or compressed source file for reading.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file. Files with a ``.gz``, ``.bz2`` or ``.xz`` suffix are
+        decompressed transparently in a background thread.
+    mode : {"r", "rt", "rb"}, default="r"
+        Whether to open the file in text or binary mode.
+    block_size : int, default=1 MiB
+        Size of the decompressed blocks handed over from the background thread.
+    max_pending_blocks : int, default=16
+        Maximum number of decompressed blocks buffered ahead of the reader.
+
+    Returns
+    -------
+    IO
+        A readable file object.
+
+    Raises
+    ------
+    ValueError
+        If ``mode`` is not a read mode.
+    """
+    if mode not in {"r", "rt", "rb"}:
+        raise ValueError(f"Unsupported mode `{mode}`; source files are read-only.")
+    if not is_compressed(path):
+        return path.open(mode)
+
+    stream = io.BufferedReader(
+        _BackgroundDecompressor(path, block_size, max_pending_blocks),
+        buffer_size=block_size,
+    )
+    return stream if mode == "rb" else io.TextIOWrapper(stream)
+
+
+class _ParallelGzipWriter(io.RawIOBase):
+    """Raw binary stream that gzip-compresses blocks in a thread pool.
+
+    Every block is compressed into a separate gzip member. The concatenation of the
+    members is a valid multi-member gzip file that decompresses to the written data.
+    The members carry no file name and a zero modification time, so the output only
+    depends on the data, the compression level and the block size.
+
+    Besides the members that end after every full block, ``start_member`` ends the
+    current member early, so that the next member starts at a known line. The
+    compressed offset of every member is available from ``member_offsets`` once the
+    stream is closed.
+
+    The output is written to a temporary file next to ``path``, which is flushed to
+    disk and atomically replaces ``path`` when the stream is closed, unless the
+    content is unchanged or the stream was aborted.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the output file.
+    compresslevel : int
+        The zlib compression level.
+    block_size : int
+        Size of the uncompressed blocks.
+    workers : int
+        Number of compression threads.
+    manifest : Path | None
+        Path to the artifact manifest, or `None` to always replace ``path``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compresslevel: int,
+        block_size: int,
+        workers: int,
+        manifest: Path | None,
+    ) -> None:
+        super().__init__()
+        self._path = path
+        self._manifest = manifest
+        self._staging_path = staging_path_for(path)
+        self._file = self._staging_path.open("wb")
+        self._compresslevel = compresslevel
+        self._block_size = block_size
+        self._max_pending = 2 * workers
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="gzip")
+        self._pending: deque[Future[bytes]] = deque()
+        self._block = bytearray()
+        self._num_members = 0
+        self._digest = hashlib.sha256()
+        self._size = 0
+        self._num_lines = 0
+        self._member_sizes: list[int] = []
+        self._boundary = (0, 0)
+        self._aborted = False
+
+    def writable(self) -> bool:
+        """Return whether the stream is writable, which it always is."""
+        return True
+
+    def _submit(self, block: bytes) -> None:
+        """Compress a block in the background, writing finished members in order."""
+        while len(self._pending) >= self._max_pending:
+            self._write_member(self._pending.popleft().result())
+        # Hash the uncompressed content while the previous blocks are compressed.
+        self._digest.update(block)
+        self._size += len(block)
+        self._pending.append(
+            self._executor.submit(gzip.compress, block, self._compresslevel, mtime=0)
+        )
+        self._num_members += 1
+
+    def _write_member(self, member: bytes) -> None:
+        """Write a compressed member to the output, recording its size."""
+        self._file.write(member)
+        self._member_sizes.append(len(member))
+
+    def write(self, data: Any) -> int:
+        """Buffer data and submit every full block for compression.
+
+        Parameters
+        ----------
+        data : bytes-like object
+            The data to write.
+
+        Returns
+        -------
+        int
+            The number of bytes written, which is always the full length of ``data``.
+        """
+        start = len(self._block)
+        self._block += data
+        self._num_lines += self._block.count(b"\n", start)
+        while len(self._block) >= self._block_size:
+            self._submit(bytes(self._block[: self._block_size]))
+            del self._block[: self._block_size]
+        return memoryview(data).nbytes
+
+    def start_member(self) -> tuple[int, int]:
+        """End the current gzip member, so that the next data starts a new one.
+
+        Returns
+        -------
+        tuple[int, int]
+            The index of the member that the next data is written to, and the number
+            of lines written so far, i.e., the zero-based line number that the member
+            starts with.
+        """
+        if self._block:
+            self._submit(bytes(self._block))
+            self._block.clear()
+        self._boundary = (self._num_members, self._num_lines)
+        return self._boundary
+
+    def last_member_start(self) -> tuple[int, int]:
+        """Return the member and line number of the last ``start_member`` call.
+
+        Members that end because a block is full may start in the middle of a line.
+        Readers that decompress from the returned member, however, start at a line
+        boundary. Before ``start_member`` is first called, this is the start of the
+        file.
+        """
+        return self._boundary
+
+    def num_lines(self) -> int:
+        """Return the number of lines written so far."""
+        return self._num_lines
+
+    def member_offsets(self) -> list[int]:
+        """Return the compressed byte offset of each member in the closed file.
+
+        Raises
+        ------
+        ValueError
+            If the stream is not closed yet or was aborted.
+        """
+        if not self.closed or self._aborted:
+            raise ValueError("Member offsets are only known after a successful close.")
+        return [0, *accumulate(self._member_sizes)][:-1]
+
+    def abort(self) -> None:
+        """Discard the output when the stream is closed, keeping ``path`` as is."""
+        self._aborted = True
+
+    def close(self) -> None:
+        """Compress the remaining data and replace ``path`` if its content changed."""
+        if self.closed:
+            return
+        try:
+            if not self._aborted:
+                # An empty file still consists of one (empty) member.
+                if self._block or self._num_members == 0:
+                    self._submit(bytes(self._block))
+                    self._block.clear()
+                while self._pending:
+                    self._write_member(self._pending.popleft().result())
+        except BaseException:
+            self._aborted = True
+            raise
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            self._file.close()
+            super().close()
+            self._finish()
+
+    def _finish(self) -> None:
+        """Move the staged output into place, or discard it."""
+        if self._aborted:
+            self._staging_path.unlink(missing_ok=True)
+            return
+
+        entry = {
+            "sha256": self._digest.hexdigest(),
+            "size": self._size,
+            "compressed-size": self._staging_path.stat().st_size,
+        }
+        if is_recorded(self._path, entry, self._manifest):
+            self._staging_path.unlink()
+            return
+
+        replace_recorded(self._staging_path, self._path, entry, self._manifest)
+
+
+class _GzipBinaryWriter(io.BufferedWriter):
+    """Buffered writer that discards the output if its context exits with an error."""
+
+    def start_member(self) -> tuple[int, int]:
+        """Flush the buffer and start a new gzip member, see `_ParallelGzipWriter`."""
+        self.flush()
+        return self.raw.start_member()
+
+    def last_member_start(self) -> tuple[int, int]:
+        """Return the member and line number of the last ``start_member`` call."""
+        return self.raw.last_member_start()
+
+    def num_lines(self) -> int:
+        """Return the number of lines written so far."""
+        self.flush()
+        return self.raw.num_lines()
+
+    def member_offsets(self) -> list[int]:
+        """Return the compressed byte offset of each member in the closed file."""
+        return self.raw.member_offsets()
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        """Abort the output on errors and close the stream."""
+        if exc_type is not None:
+            self.raw.abort()
+        super().__exit__(exc_type, *args)
+
+
+class _GzipTextWriter(io.TextIOWrapper):
+    """Text writer that discards the output if its context exits with an error."""
+
+    def start_member(self) -> tuple[int, int]:
+        """Flush the buffer and start a new gzip member, see `_ParallelGzipWriter`."""
+        self.flush()
+        return self.buffer.start_member()
+
+    def last_member_start(self) -> tuple[int, int]:
+        """Return the member and line number of the last ``start_member`` call."""
+        return self.buffer.last_member_start()
+
+    def num_lines(self) -> int:
+        """Return the number of lines written so far."""
+        self.flush()
+        return self.buffer.num_lines()
+
+    def member_offsets(self) -> list[int]:
+        """Return the compressed byte offset of each member in the closed file."""
+        return self.buffer.member_offsets()
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        """Abort the output on errors and close the stream."""
+        if exc_type is not None:
+            self.buffer.raw.abort()
+        super().__exit__(exc_type, *args)
+
+
+def open_gzip(
+    path: Path,
+    mode: str = "wt",
+    *,
+    compresslevel: int = 9,
+    block_size: int = 4 << 20,
+    workers: int | None = None,
+    manifest: Path | Literal[False] | None = None,
+    encoding: str | None = None,
+    errors: str | None = None,
+    newline: str | None = None,
+) -> Any:
+    """Open a gzip file for writing, compressing blocks in parallel threads.
+
+    This is a drop-in replacement for ``gzip.open`` in write mode. The output is
+    split into blocks of ``block_size`` bytes, which are compressed concurrently and
+    written in order as separate gzip members. Multi-member gzip files can be read by
+    any gzip decompressor, including ``gzip.open``.
+
+    The output is reproducible: the gzip headers contain neither a file name nor a
+    modification time. While writing, the SHA-256 hash of the uncompressed content is
+    computed. When the file is closed, it is flushed to disk and atomically renamed
+    over ``path``, and the hash is recorded in a manifest as the completion marker of
+    the artifact, see `is_complete`. If the manifest shows that ``path`` already has
+    the same content, ``path`` is left untouched, so unchanged artifacts keep their
+    modification time. If the ``with`` block raises an exception, the output is
+    discarded and ``path`` is left untouched as well.
+
+    The returned file object additionally provides ``start_member``, which starts a
+    new gzip member at the current position, ``num_lines`` and ``last_member_start``
+    to locate the current line, and ``member_offsets``, which returns the compressed
+    offset of every member after the file is closed.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the output file.
+    mode : {"wt", "w", "wb"}, default="wt"
+        Whether to open the file in text or binary mode.
+    compresslevel : int, default=9
+        The zlib compression level, as in ``gzip.open``.
+    block_size : int, default=4 MiB
+        Size of the uncompressed blocks. Larger blocks compress slightly better.
+    workers : int, optional
+        Number of compression threads. Defaults to the number of CPUs.
+    manifest : Path | False, optional
+        Path to the JSON manifest that records the content hash of every artifact.
+        Defaults to ``manifest.json`` in the directory of ``path``. If `False`,
+        no manifest is kept and ``path`` is always replaced.
+    encoding, errors, newline : str, optional
+        Passed to the text wrapper in text mode, as in ``gzip.open``.
+
+    Returns
+    -------
+    IO
+        A writable file object.
+
+    Raises
+    ------
+    ValueError
+        If ``mode`` is not a write mode.
+    """
+    if mode not in {"w", "wt", "wb"}:
+        raise ValueError(f"Unsupported mode `{mode}`; use `open_source` to read.")
+    if manifest is None:
+        manifest = default_manifest(path)
+
+    stream = _GzipBinaryWriter(
+        _ParallelGzipWriter(
+            path,
+            compresslevel,
+            block_size,
+            workers or os.cpu_count() or 1,
+            manifest or None,
+        ),
+        buffer_size=block_size,
+    )
+    if mode == "wb":
+        return stream
+    return _GzipTextWriter(
+        stream, io.text_encoding(encoding), errors=errors, newline=newline
+    )
@@ -0,0 +1,210 @@
+"""Utilities for collecting dataset statistics while a dataset file is written.
+
+Each dataset datasheet records the number of nodes and interactions as well as the
+node-degree and edge-degree histograms in its frontmatter. A ``StatisticsAccumulator``
+that is attached to a `DatasetWriter` collects these statistics, and optionally the
+number of nodes and edges per label, from the nodes and edges as they are written, so
+the data does not have to be iterated again afterwards.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Hashable, Iterable, KeysView
+
+    from .hyperedge_table import HyperedgeTable
+
+
+def _count_label(counts: Counter[Any], label: Any, count: int = 1) -> None:
+    """Count a label, or each label of a multilabel list or tuple, ``count`` times."""
+    for part in label if isinstance(label, list | tuple) else (label,):
+        counts[part] += count
+
+
+class StatisticsAccumulator:
+    """Statistics of a dataset, collected node by node and edge by edge.
+
+    Parameters
+    ----------
+    node_label_key : str, optional
+        If given, the values of this node attribute are counted in
+        ``node_label_counts``.
+    edge_label_key : str, optional
+        If given, the values of this edge attribute are counted in
+        ``edge_label_counts``.
+
+    Examples
+    --------
+    >>> statistics = StatisticsAccumulator(edge_label_key="cuisine")
+    >>> with open_gzip(dataset_file, "wt") as file:  # doctest: +SKIP
+    ...     write_dataset_metadata(file, slug, revision)
+    ...     with DatasetWriter(file, statistics=statistics) as writer:
+    ...         writer.write_nodes(nodes)
+    ...         writer.write_edges(hyperedges, label_key="cuisine")
+    >>> update_frontmatter(  # doctest: +SKIP
+    ...     datasheet_file,
+    ...     {
+    ...         "statistics": statistics.statistics(),
+    ...         "edge-label-count": dict(statistics.edge_label_counts),
+    ...     },
+    ... )
+    """
+
+    def __init__(
+        self, *, node_label_key: str | None = None, edge_label_key: str | None = None
+    ) -> None:
+        self.node_label_key = node_label_key
+        self.edge_label_key = edge_label_key
+        self.node_degrees: Counter[Hashable] = Counter()
+        self.edge_degrees: Counter[int] = Counter()
+        self.node_label_counts: Counter[Any] = Counter()
+        self.edge_label_counts: Counter[Any] = Counter()
+        self.num_edges = 0
+        self._nodes: set[Hashable] = set()
+
+    def add_node(
+        self, node: Hashable, attributes: dict[str, Any] | None = None
+    ) -> None:
+        """Record a node that is written to the dataset.
+
+        Parameters
+        ----------
+        node : Hashable
+            Node identifier.
+        attributes : dict[str, Any], optional
+            Metadata attributes of the node.
+        """
+        self._nodes.add(node)
+        if self.node_label_key is not None and attributes is not None:
+            label = attributes.get(self.node_label_key)
+            if label is not None:
+                _count_label(self.node_label_counts, label)
+
+    def add_edge(
+        self, elements: Collection[Hashable], attributes: dict[str, Any] | None = None
+    ) -> None:
+        """Record an edge that is written to the dataset.
+
+        Parameters
+        ----------
+        elements : Collection[Hashable]
+            Distinct node identifiers that form the edge.
+        attributes : dict[str, Any], optional
+            Metadata attributes of the edge.
+        """
+        self.node_degrees.update(elements)
+        self.edge_degrees[len(elements)] += 1
+        self.num_edges += 1
+        if self.edge_label_key is not None and attributes is not None:
+            label = attributes.get(self.edge_label_key)
+            if label is not None:
+                _count_label(self.edge_label_counts, label)
+
+    def add_table(
+        self,
+        edges: HyperedgeTable,
+        attributes: Iterable[dict[str, Any]] | None = None,
+        *,
+        label_key: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Record all hyperedges of a table at once.
+
+        The labels are counted exactly as if each hyperedge were recorded with
+        ``add_edge`` and the attributes that `DatasetWriter` writes for it, i.e.,
+        ``kwargs``, updated by its own attributes, updated by its label.
+
+        Parameters
+        ----------
+        edges : HyperedgeTable
+            The hyperedges that are written to the dataset.
+        attributes : Iterable[dict[str, Any]], optional
+            Metadata attributes of each hyperedge.
+        label_key : str, optional
+            Name of the attribute that the labels of the table are written as, if any.
+        **kwargs
+            Metadata attributes shared by all hyperedges.
+
+        Raises
+        ------
+        ValueError
+            If ``label_key`` is given, but the table has no labels.
+        """
+        nodes, degrees = np.unique(edges.indices, return_counts=True)
+        self.node_degrees.update(
+            dict(zip(nodes.tolist(), degrees.tolist(), strict=True))
+        )
+        sizes, counts = np.unique(edges.sizes, return_counts=True)
+        self.edge_degrees.update(
+            dict(zip(sizes.tolist(), counts.tolist(), strict=True))
+        )
+        self.num_edges += len(edges)
+
+        key = self.edge_label_key
+        if key is None:
+            return
+        if key == label_key:
+            if edges.label_codes is None or edges.label_categories is None:
+                raise ValueError("The table has no labels.")
+            # Count the labels per code instead of per hyperedge.
+            category_counts = np.bincount(
+                edges.label_codes, minlength=len(edges.label_categories)
+            )
+            for label, count in zip(
+                edges.label_categories, category_counts.tolist(), strict=True
+            ):
+                if label is not None and count:
+                    _count_label(self.edge_label_counts, label, count)
+        elif attributes is not None:
+            shared_label = kwargs.get(key)
+            for edge_attributes in attributes:
+                label = edge_attributes.get(key, shared_label)
+                if label is not None:
+                    _count_label(self.edge_label_counts, label)
+        elif kwargs.get(key) is not None and len(edges):
+            _count_label(self.edge_label_counts, kwargs[key], len(edges))
+
+    def __contains__(self, node: object) -> bool:
+        """Return whether a node participates in any recorded edge."""
+        return node in self.node_degrees
+
+    @property
+    def participating_nodes(self) -> KeysView[Hashable]:
+        """The nodes that participate in at least one recorded edge."""
+        return self.node_degrees.keys()
+
+    @property
+    def num_nodes(self) -> int:
+        """The number of distinct nodes that were written or participate in an edge."""
+        return len(self.node_degrees) + sum(
+            1 for node in self._nodes if node not in self.node_degrees
+        )
+
+    def node_degree_histogram(self) -> dict[int, int]:
+        """Return the number of participating nodes per node degree, sorted by degree."""
+        return dict(sorted(Counter(self.node_degrees.values()).items()))
+
+    def edge_degree_histogram(self) -> dict[int, int]:
+        """Return the number of edges per edge size, sorted by size."""
+        return dict(sorted(self.edge_degrees.items()))
+
+    def statistics(self) -> dict[str, Any]:
+        """Return the ``statistics`` mapping of the datasheet frontmatter.
+
+        Returns
+        -------
+        dict[str, Any]
+            The number of nodes and interactions, and the node-degree and
+            edge-degree histograms, as expected by ``update_frontmatter``.
+        """
+        return {
+            "num-nodes": self.num_nodes,
+            "num-interactions": self.num_edges,
+            "node-degrees": self.node_degree_histogram(),
+            "edge-degrees": self.edge_degree_histogram(),
+        }
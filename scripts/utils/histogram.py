@@ -0,0 +1,232 @@
+"""Mergeable integer histograms for computing dataset statistics in shards.
+
+A ``Histogram`` counts how often each integer value occurs, e.g., the size of every
+hyperedge, or the identifier of every node in every hyperedge, which yields the node
+degrees. The counts are kept as sorted NumPy arrays, and values that are added one at a
+time are buffered and folded in batch-wise.
+
+Histograms of disjoint parts of a dataset can be computed independently, e.g., by
+parallel workers, and combined with ``merge``, which is associative and commutative.
+A histogram serializes to the ``node-degrees`` and ``edge-degrees`` format of the
+datasheet frontmatter with ``to_dict``, and can be passed to
+`compute_boxplot_stats_from_histogram` directly.
+
+Examples
+--------
+>>> shards = [[(1, 2), (2, 3, 4)], [(1, 2, 3)]]
+>>> partials = []
+>>> for shard in shards:
+...     node_occurrences, edge_sizes = Histogram(), Histogram()
+...     for edge in shard:
+...         node_occurrences.update(edge)
+...         edge_sizes.add(len(edge))
+...     partials.append((node_occurrences, edge_sizes))
+>>> node_occurrences = Histogram().merge(*(partial[0] for partial in partials))
+>>> node_occurrences.count_histogram().to_dict()
+{1: 1, 2: 2, 3: 1}
+>>> Histogram().merge(*(partial[1] for partial in partials)).to_dict()
+{2: 1, 3: 2}
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from numpy.typing import ArrayLike
+
+# Number of buffered values that are folded into the arrays at once.
+_BUFFER_SIZE = 1 << 20
+
+
+def _combine(values: np.ndarray, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sum the counts of equal values, keeping sorted distinct values with counts."""
+    order = np.argsort(values, kind="stable")
+    values, counts = values[order], counts[order]
+    if not len(values):
+        return values, counts
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    values, counts = values[starts], np.add.reduceat(counts, starts)
+    nonzero = counts != 0
+    return (values, counts) if nonzero.all() else (values[nonzero], counts[nonzero])
+
+
+class Histogram:
+    """Counts of integer values, backed by sorted arrays.
+
+    Parameters
+    ----------
+    values : ArrayLike, optional
+        Initial values, which may repeat.
+    counts : ArrayLike, optional
+        The count of each of ``values``. Defaults to one each.
+    """
+
+    def __init__(
+        self, values: ArrayLike | None = None, counts: ArrayLike | None = None
+    ) -> None:
+        self._values = np.empty(0, dtype=np.int64)
+        self._counts = np.empty(0, dtype=np.int64)
+        self._buffer = array("q")
+        if values is not None:
+            self.update(values, counts)
+
+    @classmethod
+    def from_dict(cls, histogram: Mapping[int, int]) -> Histogram:
+        """Create a histogram from a mapping of values to counts.
+
+        Parameters
+        ----------
+        histogram : Mapping[int, int]
+            The count of each value, e.g., the ``node-degrees`` of a datasheet.
+
+        Returns
+        -------
+        Histogram
+            The histogram.
+        """
+        return cls(
+            np.fromiter(histogram.keys(), dtype=np.int64, count=len(histogram)),
+            np.fromiter(histogram.values(), dtype=np.int64, count=len(histogram)),
+        )
+
+    def _add_arrays(self, values: np.ndarray, counts: np.ndarray) -> None:
+        """Fold counted values into the arrays."""
+        self._values, self._counts = _combine(
+            np.concatenate([self._values, values]),
+            np.concatenate([self._counts, counts]),
+        )
+
+    def _flush(self) -> None:
+        """Fold the buffered values into the arrays."""
+        if self._buffer:
+            values, counts = np.unique(
+                np.frombuffer(self._buffer, dtype=np.int64), return_counts=True
+            )
+            self._buffer = array("q")
+            self._add_arrays(values, counts.astype(np.int64))
+
+    def add(self, value: int, count: int = 1) -> None:
+        """Count a value.
+
+        Parameters
+        ----------
+        value : int
+            The value.
+        count : int, default=1
+            How often to count the value.
+        """
+        if count == 1:
+            self._buffer.append(value)
+            if len(self._buffer) >= _BUFFER_SIZE:
+                self._flush()
+        else:
+            self._add_arrays(
+                np.array([value], dtype=np.int64), np.array([count], dtype=np.int64)
+            )
+
+    def update(
+        self, values: Iterable[int] | ArrayLike, counts: ArrayLike | None = None
+    ) -> None:
+        """Count several values, e.g., the nodes of an edge.
+
+        Parameters
+        ----------
+        values : Iterable[int] | ArrayLike
+            The values, which may repeat.
+        counts : ArrayLike, optional
+            The count of each of ``values``. Defaults to one each.
+        """
+        if counts is not None or isinstance(values, np.ndarray):
+            values = np.asarray(values, dtype=np.int64).ravel()
+            counts = (
+                np.ones(len(values), dtype=np.int64)
+                if counts is None
+                else np.asarray(counts, dtype=np.int64).ravel()
+            )
+            if len(values) != len(counts):
+                raise ValueError("Each value needs exactly one count.")
+            self._add_arrays(values, counts)
+            return
+
+        self._buffer.extend(values)
+        if len(self._buffer) >= _BUFFER_SIZE:
+            self._flush()
+
+    def merge(self, *others: Histogram) -> Histogram:
+        """Combine this histogram with others into a new histogram.
+
+        Parameters
+        ----------
+        *others : Histogram
+            Histograms of other parts of the data.
+
+        Returns
+        -------
+        Histogram
+            The histogram of all parts. The merged histograms are left unchanged.
+        """
+        histograms = [self, *others]
+        for histogram in histograms:
+            histogram._flush()
+        merged = Histogram()
+        merged._values, merged._counts = _combine(
+            np.concatenate([histogram._values for histogram in histograms]),
+            np.concatenate([histogram._counts for histogram in histograms]),
+        )
+        return merged
+
+    @property
+    def values(self) -> np.ndarray:
+        """The distinct values with a nonzero count, in ascending order."""
+        self._flush()
+        return self._values
+
+    @property
+    def counts(self) -> np.ndarray:
+        """The count of each of ``values``."""
+        self._flush()
+        return self._counts
+
+    @property
+    def total(self) -> int:
+        """The sum of all counts."""
+        self._flush()
+        return int(self._counts.sum())
+
+    def __len__(self) -> int:
+        """Return the number of distinct values with a nonzero count."""
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        """Return a representation with the counts of all values."""
+        return f"Histogram.from_dict({self.to_dict()})"
+
+    def count_histogram(self) -> Histogram:
+        """Return how many values have each count.
+
+        If the histogram counts node occurrences in edges, this is the node-degree
+        histogram.
+
+        Returns
+        -------
+        Histogram
+            The number of values per count.
+        """
+        return Histogram(self.counts)
+
+    def to_dict(self) -> dict[int, int]:
+        """Return the counts as a mapping sorted by value.
+
+        Returns
+        -------
+        dict[int, int]
+            The count of each value, in the format of the ``node-degrees`` and
+            ``edge-degrees`` statistics of the datasheet frontmatter.
+        """
+        return dict(zip(self.values.tolist(), self.counts.tolist(), strict=True))
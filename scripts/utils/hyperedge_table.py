@@ -0,0 +1,425 @@
+"""Compact, array-backed storage for hyperedges.
+
+A ``HyperedgeTable`` stores hyperedges in compressed sparse row (CSR) form: row ``i``
+consists of the nodes ``indices[offsets[i]:offsets[i + 1]]``. Optional edge labels are
+stored as categorical codes into a table of distinct labels, and optional timestamps as
+an ``int64`` column.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator, Sequence
+
+# Number of affected rows that are listed in a `DuplicateReport`.
+_MAX_DUPLICATE_SAMPLES = 5
+
+
+def _index_dtype(max_value: int) -> type[np.signedinteger[Any]]:
+    """Return the smallest signed integer type that can hold ``max_value``."""
+    return np.int32 if max_value <= np.iinfo(np.int32).max else np.int64
+
+
+def encode_labels(labels: Iterable[Hashable]) -> tuple[np.ndarray, list[Any]]:
+    """Encode labels as categorical codes in order of first appearance.
+
+    Parameters
+    ----------
+    labels : Iterable[Hashable]
+        The label of each row.
+
+    Returns
+    -------
+    codes : np.ndarray
+        The code of each row's label.
+    categories : list
+        The distinct labels, indexed by code.
+    """
+    code_table: dict[Hashable, int] = {}
+    codes = [code_table.setdefault(label, len(code_table)) for label in labels]
+    return (
+        np.asarray(codes, dtype=_index_dtype(len(code_table))),
+        list(code_table),
+    )
+
+
+@dataclass(frozen=True)
+class DuplicateReport:
+    """Summary of hyperedges that contain the same node more than once.
+
+    Attributes
+    ----------
+    num_edges : int
+        Number of affected hyperedges.
+    by_size : dict[int, int]
+        Number of affected hyperedges per (original) hyperedge size.
+    samples : list[tuple[int, list[int]]]
+        Row number and duplicated nodes of the first few affected hyperedges.
+    """
+
+    num_edges: int = 0
+    by_size: dict[int, int] = field(default_factory=dict)
+    samples: list[tuple[int, list[int]]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return whether any hyperedge contains duplicate nodes."""
+        return self.num_edges > 0
+
+    def merge(self, other: DuplicateReport, *, row_offset: int = 0) -> DuplicateReport:
+        """Combine this report with the report of a subsequent chunk of rows.
+
+        Parameters
+        ----------
+        other : DuplicateReport
+            The report to merge into this one.
+        row_offset : int, default=0
+            Number of rows preceding the rows of ``other``, used to shift its sample
+            row numbers.
+
+        Returns
+        -------
+        DuplicateReport
+            The combined report.
+        """
+        by_size = dict(self.by_size)
+        for size, count in other.by_size.items():
+            by_size[size] = by_size.get(size, 0) + count
+        samples = self.samples + [
+            (row + row_offset, nodes) for row, nodes in other.samples
+        ]
+        return DuplicateReport(
+            self.num_edges + other.num_edges,
+            dict(sorted(by_size.items())),
+            samples[:_MAX_DUPLICATE_SAMPLES],
+        )
+
+    def message(self) -> str:
+        """Return a human-readable summary of the report."""
+        by_size = ", ".join(
+            f"{count} of size {size}" for size, count in self.by_size.items()
+        )
+        samples = "; ".join(f"row {row}: {set(nodes)}" for row, nodes in self.samples)
+        return (
+            f"{self.num_edges} hyperedges contain duplicate nodes ({by_size}), "
+            f"e.g., {samples}. TopoNetX ignores them."
+        )
+
+
+class HyperedgeTable:
+    """Hyperedges stored as offsets and flat node indices.
+
+    Parameters
+    ----------
+    offsets : array_like
+        Row boundaries, of length ``len(table) + 1`` and starting at zero.
+    indices : array_like
+        Flat node identifiers of all rows.
+    label_codes : array_like, optional
+        Categorical code of each row's label.
+    label_categories : Sequence, optional
+        The distinct labels, indexed by code. Required if ``label_codes`` is given.
+    times : array_like, optional
+        Timestamp of each row.
+
+    Raises
+    ------
+    ValueError
+        If the columns are inconsistent with each other.
+    """
+
+    __slots__ = ("indices", "label_categories", "label_codes", "offsets", "times")
+
+    offsets: np.ndarray
+    indices: np.ndarray
+    label_codes: np.ndarray | None
+    label_categories: list[Any] | None
+    times: np.ndarray | None
+
+    def __init__(
+        self,
+        offsets: Any,
+        indices: Any,
+        *,
+        label_codes: Any | None = None,
+        label_categories: Sequence[Any] | None = None,
+        times: Any | None = None,
+    ) -> None:
+        offsets = np.asarray(offsets)
+        indices = np.asarray(indices)
+        if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0:
+            raise ValueError("Offsets must be a one-dimensional array starting at 0.")
+        if offsets[-1] != len(indices):
+            raise ValueError(
+                f"Offsets describe {offsets[-1]} indices, but {len(indices)} were given."
+            )
+        num_rows = len(offsets) - 1
+
+        self.offsets = offsets.astype(_index_dtype(len(indices)), copy=False)
+        self.indices = indices.astype(
+            _index_dtype(int(indices.max(initial=0))), copy=False
+        )
+
+        if (label_codes is None) != (label_categories is None):
+            raise ValueError("Label codes and categories must be given together.")
+        if label_codes is not None:
+            label_codes = np.asarray(label_codes)
+            if len(label_codes) != num_rows:
+                raise ValueError("There must be exactly one label per row.")
+        self.label_codes = label_codes
+        self.label_categories = (
+            list(label_categories) if label_categories is not None else None
+        )
+
+        if times is not None:
+            times = np.asarray(times, dtype=np.int64)
+            if len(times) != num_rows:
+                raise ValueError("There must be exactly one time per row.")
+        self.times = times
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Iterable[int]],
+        *,
+        labels: Iterable[Hashable] | None = None,
+        times: Iterable[int] | None = None,
+    ) -> HyperedgeTable:
+        """Build a table from an iterable of rows.
+
+        Parameters
+        ----------
+        rows : Iterable[Iterable[int]]
+            The node identifiers of each hyperedge.
+        labels : Iterable[Hashable], optional
+            The label of each hyperedge.
+        times : Iterable[int], optional
+            The timestamp of each hyperedge.
+
+        Returns
+        -------
+        HyperedgeTable
+            The table holding the given rows.
+        """
+        flat_indices: list[int] = []
+        bounds = [0]
+        for row in rows:
+            flat_indices.extend(row)
+            bounds.append(len(flat_indices))
+
+        label_codes, label_categories = (
+            encode_labels(labels) if labels is not None else (None, None)
+        )
+        return cls(
+            np.asarray(bounds, dtype=np.int64),
+            np.asarray(flat_indices, dtype=np.int64),
+            label_codes=label_codes,
+            label_categories=label_categories,
+            times=np.fromiter(times, dtype=np.int64) if times is not None else None,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of hyperedges."""
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        """Iterate over zero-copy views of the rows."""
+        indices = self.indices
+        bounds = self.offsets.tolist()
+        for i in range(len(bounds) - 1):
+            yield indices[bounds[i] : bounds[i + 1]]
+
+    def __getitem__(self, key: int | np.ndarray) -> Any:
+        """Return a single row as a zero-copy view, or a filtered table.
+
+        Parameters
+        ----------
+        key : int | np.ndarray
+            Either a row number, or a boolean mask with one entry per row.
+
+        Returns
+        -------
+        np.ndarray | HyperedgeTable
+            The view of the row if ``key`` is an integer, otherwise a new table with
+            the selected rows.
+        """
+        if isinstance(key, int | np.integer):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError("Hyperedge index out of range.")
+            return self.indices[self.offsets[key] : self.offsets[key + 1]]
+        return self.filter(key)
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """The number of nodes in each row."""
+        return np.diff(self.offsets)
+
+    @property
+    def labels(self) -> list[Any] | None:
+        """The label of each row, decoded from the categorical codes."""
+        if self.label_codes is None or self.label_categories is None:
+            return None
+        categories = self.label_categories
+        return [categories[code] for code in self.label_codes.tolist()]
+
+    def label(self, row: int) -> Any:
+        """Return the decoded label of a single row."""
+        if self.label_codes is None or self.label_categories is None:
+            raise ValueError("The table has no labels.")
+        return self.label_categories[self.label_codes[row]]
+
+    def label_counts(self) -> dict[Any, int]:
+        """Return the number of rows per label, in order of the label categories.
+
+        The rows are counted per code on the integer code array. Categories that are
+        tuples of labels, as used for multilabel rows, count towards each of their
+        labels.
+        """
+        if self.label_codes is None or self.label_categories is None:
+            raise ValueError("The table has no labels.")
+        category_counts = np.bincount(
+            self.label_codes, minlength=len(self.label_categories)
+        )
+        counts: dict[Any, int] = {}
+        for category, count in zip(
+            self.label_categories, category_counts.tolist(), strict=True
+        ):
+            if count == 0:
+                continue
+            for label in category if isinstance(category, tuple) else (category,):
+                counts[label] = counts.get(label, 0) + count
+        return counts
+
+    def label_mask(self, label: Any) -> np.ndarray:
+        """Return a boolean mask of the rows that carry a label.
+
+        Parameters
+        ----------
+        label : Any
+            The label to select. Rows with a tuple of labels are selected if the
+            tuple contains ``label``.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask with one entry per row, e.g., for ``filter``.
+        """
+        if self.label_codes is None or self.label_categories is None:
+            raise ValueError("The table has no labels.")
+        category_mask = np.fromiter(
+            (
+                label in category if isinstance(category, tuple) else label == category
+                for category in self.label_categories
+            ),
+            dtype=bool,
+            count=len(self.label_categories),
+        )
+        return category_mask[self.label_codes]
+
+    def filter(self, mask: Any) -> HyperedgeTable:
+        """Return a new table with only the rows selected by a boolean mask.
+
+        Parameters
+        ----------
+        mask : array_like
+            Boolean mask with one entry per row.
+
+        Returns
+        -------
+        HyperedgeTable
+            A table with the selected rows, sharing the label categories.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if len(mask) != len(self):
+            raise ValueError("The mask must have exactly one entry per row.")
+
+        sizes = self.sizes
+        offsets = np.zeros(np.count_nonzero(mask) + 1, dtype=np.int64)
+        np.cumsum(sizes[mask], out=offsets[1:])
+
+        return HyperedgeTable(
+            offsets,
+            self.indices[np.repeat(mask, sizes)],
+            label_codes=(
+                self.label_codes[mask] if self.label_codes is not None else None
+            ),
+            label_categories=self.label_categories,
+            times=self.times[mask] if self.times is not None else None,
+        )
+
+    def deduplicate(self) -> tuple[HyperedgeTable, DuplicateReport]:
+        """Remove repeated nodes within each row.
+
+        Duplicates are found in a single vectorized pass by sorting the nodes within
+        each row and comparing neighbours. The first occurrence of each node is kept,
+        so the order of the remaining nodes is unchanged.
+
+        Returns
+        -------
+        table : HyperedgeTable
+            The deduplicated table, or this table if there are no duplicates.
+        report : DuplicateReport
+            Summary of the affected rows.
+        """
+        sizes = self.sizes
+        row_ids = np.repeat(np.arange(len(self)), sizes)
+        order = np.lexsort((self.indices, row_ids))
+        sorted_indices = self.indices[order]
+        sorted_rows = row_ids[order]
+
+        is_repeat = np.zeros(len(order), dtype=bool)
+        is_repeat[1:] = (sorted_indices[1:] == sorted_indices[:-1]) & (
+            sorted_rows[1:] == sorted_rows[:-1]
+        )
+        if not is_repeat.any():
+            return self, DuplicateReport()
+
+        affected_rows = np.unique(sorted_rows[is_repeat])
+        size_values, size_counts = np.unique(sizes[affected_rows], return_counts=True)
+        samples = [
+            (row, np.unique(sorted_indices[is_repeat & (sorted_rows == row)]).tolist())
+            for row in affected_rows[:_MAX_DUPLICATE_SAMPLES].tolist()
+        ]
+        report = DuplicateReport(
+            len(affected_rows),
+            dict(zip(size_values.tolist(), size_counts.tolist(), strict=True)),
+            samples,
+        )
+
+        keep = np.empty(len(order), dtype=bool)
+        keep[order] = ~is_repeat
+        offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_ids[keep], minlength=len(self)), out=offsets[1:])
+
+        table = HyperedgeTable(
+            offsets,
+            self.indices[keep],
+            label_codes=self.label_codes,
+            label_categories=self.label_categories,
+            times=self.times,
+        )
+        return table, report
+
+    def participating_nodes(self) -> np.ndarray:
+        """Return the sorted distinct node identifiers that occur in any row."""
+        return np.unique(self.indices)
+
+    def node_degree_histogram(self) -> dict[int, int]:
+        """Return the number of nodes per node degree, sorted by degree.
+
+        Only nodes that occur in at least one row are counted.
+        """
+        _, degrees = np.unique(self.indices, return_counts=True)
+        values, counts = np.unique(degrees, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist(), strict=True))
+
+    def edge_degree_histogram(self) -> dict[int, int]:
+        """Return the number of rows per row size, sorted by size."""
+        values, counts = np.unique(self.sizes, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist(), strict=True))
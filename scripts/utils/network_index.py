@@ -0,0 +1,205 @@
+"""Utilities for seeking to single networks in multi-network dataset files.
+
+Multi-network dataset files list many networks one after another, each starting with a
+network metadata line. To read one of them from a plain gzip stream, everything before
+it has to be decompressed. ``NetworkIndex`` therefore starts a new gzip member at the
+first network of every group of networks while the file is written with
+`open_gzip`, and records for each network the compressed offset of its member and the
+line number of its metadata line. The index is written to a JSON sidecar file next to
+the dataset file, and ``read_network`` uses it to decompress only the member that
+contains a network.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from .artifacts import open_atomic
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+INDEX_VERSION = 1
+
+
+def index_path_for(dataset_path: Path) -> Path:
+    """Return the path of the sidecar index of a dataset file.
+
+    Parameters
+    ----------
+    dataset_path : Path
+        Path to the dataset file, e.g., ``MANTRA-2-manifolds.txt.gz``.
+
+    Returns
+    -------
+    Path
+        Path to the index file, e.g., ``MANTRA-2-manifolds.index.json``.
+    """
+    name = dataset_path.name.removesuffix(".gz").removesuffix(".txt")
+    return dataset_path.with_name(f"{name}.index.json")
+
+
+class NetworkIndex:
+    """Index of the networks in a multi-network dataset file, built while writing.
+
+    Parameters
+    ----------
+    networks_per_member : int, default=1
+        Number of consecutive networks that share a gzip member. Larger groups
+        compress better, while smaller groups decompress less data to read a network.
+
+    Examples
+    --------
+    >>> index = NetworkIndex(networks_per_member=16)
+    >>> with open_gzip(dataset_file, "wt") as file:  # doctest: +SKIP
+    ...     write_dataset_metadata(file, slug, revision, _num_networks=len(networks))
+    ...     for network in networks:
+    ...         index.start_network(file, network["id"])
+    ...         write_network_metadata(file, **network)
+    ...         ...
+    >>> index.write(index_path_for(dataset_file), file)  # doctest: +SKIP
+    """
+
+    def __init__(self, *, networks_per_member: int = 1) -> None:
+        if networks_per_member < 1:
+            raise ValueError("Each gzip member must contain at least one network.")
+        self.networks_per_member = networks_per_member
+        self._entries: list[tuple[Any, int, int, int]] = []
+
+    def __len__(self) -> int:
+        """Return the number of indexed networks."""
+        return len(self._entries)
+
+    def start_network(self, file: Any, network_id: Any) -> None:
+        """Record the start of a network, starting a new gzip member if necessary.
+
+        Call this right before the network metadata line is written.
+
+        Parameters
+        ----------
+        file : IO
+            The dataset file, as returned by `open_gzip`.
+        network_id : Any
+            JSON-serializable identifier of the network.
+        """
+        if len(self._entries) % self.networks_per_member == 0:
+            member, member_line = file.start_member()
+            line = member_line
+        else:
+            member, member_line = file.last_member_start()
+            line = file.num_lines()
+        self._entries.append((network_id, member, member_line, line))
+
+    def entries(self, file: Any) -> list[dict[str, Any]]:
+        """Return the index entries, once the dataset file is closed.
+
+        Parameters
+        ----------
+        file : IO
+            The closed dataset file, as returned by `open_gzip`.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            For each network, in order, its ``id``, the compressed ``offset`` of the
+            gzip member to start decompressing from, the zero-based ``line`` number of
+            its metadata line in the decompressed file, and the number of lines to
+            ``skip`` after the start of the member to reach it.
+        """
+        offsets = file.member_offsets()
+        return [
+            {
+                "id": network_id,
+                "offset": offsets[member],
+                "line": line,
+                "skip": line - member_line,
+            }
+            for network_id, member, member_line, line in self._entries
+        ]
+
+    def write(self, path: Path, file: Any) -> None:
+        """Write the index to a JSON sidecar file, once the dataset file is closed.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the index file.
+        file : IO
+            The closed dataset file, as returned by `open_gzip`.
+        """
+        index = {"version": INDEX_VERSION, "networks": self.entries(file)}
+        with open_atomic(path) as index_file:
+            json.dump(index, index_file, separators=(",", ":"))
+            index_file.write("\n")
+
+
+def read_index(path: Path) -> dict[Any, dict[str, Any]]:
+    """Read a sidecar index into a mapping from network identifiers to entries.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the index file.
+
+    Returns
+    -------
+    dict[Any, dict[str, Any]]
+        The entries written by `NetworkIndex`, keyed by network identifier. Each entry
+        additionally contains the ``num-lines`` of the network, or `None` for the
+        last network.
+
+    Raises
+    ------
+    ValueError
+        If the index has an unsupported version.
+    """
+    with path.open() as file:
+        index = json.load(file)
+    if index.get("version") != INDEX_VERSION:
+        raise ValueError(f"Unsupported network index version in `{path}`.")
+    networks = index["networks"]
+    for entry, following in zip(networks, [*networks[1:], None], strict=True):
+        entry["num-lines"] = (
+            None if following is None else following["line"] - entry["line"]
+        )
+    return {entry["id"]: entry for entry in networks}
+
+
+def read_network(
+    dataset_path: Path, network_id: Any, index: dict[Any, dict[str, Any]] | None = None
+) -> list[str]:
+    """Read the lines of a single network from an indexed multi-network dataset file.
+
+    Only the gzip members from the one that contains the network onwards are
+    decompressed, and only until the network ends.
+
+    Parameters
+    ----------
+    dataset_path : Path
+        Path to the dataset file.
+    network_id : Any
+        Identifier of the network, as recorded in the index.
+    index : dict[Any, dict[str, Any]], optional
+        The index as returned by ``read_index``. Read from the sidecar file of
+        ``dataset_path`` if not given.
+
+    Returns
+    -------
+    list[str]
+        The network metadata line followed by the node and edge lines of the network.
+    """
+    if index is None:
+        index = read_index(index_path_for(dataset_path))
+    entry = index[network_id]
+
+    with dataset_path.open("rb") as raw:
+        raw.seek(entry["offset"])
+        with io.TextIOWrapper(gzip.GzipFile(fileobj=raw, mode="rb")) as file:
+            lines = islice(file, entry["skip"], None)
+            if entry["num-lines"] is None:
+                return list(lines)
+            return list(islice(lines, entry["num-lines"]))
@@ -0,0 +1,221 @@
+"""Utilities for writing several dataset files in a single pass over the hyperedges.
+
+Some datasets are published both as a whole and split into one sub-dataset per
+hyperedge label. Instead of filtering all hyperedges once per label, the hyperedges are
+streamed once and each one is written to every partition it belongs to. A
+``DatasetPartition`` spools its edge lines to a temporary file and records them in its
+own `StatisticsAccumulator`, which also keeps the participating nodes of the partition
+in the order in which they first occur. Once all hyperedges have been seen, each
+partition is written as a dataset file with its nodes followed by the spooled edges.
+
+The partitions of a ``DatasetPartitions`` collection share a single spool file, in
+which each partition records the segments that it appended, so that the number of open
+files does not grow with the number of labels.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from typing import TYPE_CHECKING, Any, TextIO
+
+from .dataset_statistics import StatisticsAccumulator
+from .write import DatasetWriter, PayloadCacheInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator, KeysView
+
+
+class _Spool:
+    """Temporary file to which several partitions append segments of edge lines."""
+
+    def __init__(self) -> None:
+        # The file lives as long as the spool and is closed in `close`.
+        self._file = tempfile.TemporaryFile()  # noqa: SIM115
+        self._size = 0
+
+    def append(self, data: bytes) -> tuple[int, int]:
+        """Append data and return its offset and length in the spool."""
+        self._file.seek(self._size)
+        self._file.write(data)
+        offset, self._size = self._size, self._size + len(data)
+        return offset, len(data)
+
+    def copy_to(self, file: TextIO, segments: Iterable[tuple[int, int]]) -> None:
+        """Write segments of the spool, given as offsets and lengths, to a file."""
+        self._file.flush()
+        for offset, length in segments:
+            self._file.seek(offset)
+            file.write(self._file.read(length).decode("utf-8"))
+
+    def close(self) -> None:
+        """Remove the spooled data."""
+        self._file.close()
+
+
+class _SpoolSegments:
+    """Text sink that appends to a shared spool and remembers the appended segments."""
+
+    def __init__(self, spool: _Spool) -> None:
+        self.spool = spool
+        self.segments: list[tuple[int, int]] = []
+
+    def write(self, text: str) -> int:
+        """Append text to the spool."""
+        if text:
+            self.segments.append(self.spool.append(text.encode("utf-8")))
+        return len(text)
+
+
+class DatasetPartition:
+    """Edges and statistics of one dataset file, collected edge by edge.
+
+    Parameters
+    ----------
+    chunk_size : int, default=1 MiB
+        Number of characters that are buffered before they are written to the spool.
+    statistics : StatisticsAccumulator, optional
+        Accumulator that records the edges of the partition and the nodes written by
+        ``write_to``. By default, a new accumulator without label counts is used.
+    spool : _Spool, optional
+        Spool shared with other partitions, which is closed by its owner. By default,
+        the partition spools to a temporary file of its own.
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_size: int = 1 << 20,
+        statistics: StatisticsAccumulator | None = None,
+        spool: _Spool | None = None,
+    ) -> None:
+        self.statistics = (
+            statistics if statistics is not None else StatisticsAccumulator()
+        )
+        self._owns_spool = spool is None
+        self._segments = _SpoolSegments(spool if spool is not None else _Spool())
+        self._writer = DatasetWriter(
+            self._segments, chunk_size=chunk_size, statistics=self.statistics
+        )
+
+    def __enter__(self) -> DatasetPartition:
+        """Return the partition itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Remove the spooled edges."""
+        self.close()
+
+    def close(self) -> None:
+        """Remove the spooled edges."""
+        if self._owns_spool:
+            self._segments.spool.close()
+
+    def write_edge(self, elements: Iterable[int | str], **kwargs: Any) -> None:
+        """Add an edge with metadata to the partition.
+
+        Parameters
+        ----------
+        elements : Iterable[int | str]
+            Distinct node identifiers that form the edge.
+        **kwargs
+            Additional metadata attributes for the edge.
+        """
+        self._writer.write_edge(elements, **kwargs)
+
+    def __contains__(self, node: object) -> bool:
+        """Return whether a node participates in any edge of the partition."""
+        return node in self.statistics
+
+    @property
+    def participating_nodes(self) -> KeysView[Hashable]:
+        """The nodes that participate in an edge, in the order of first occurrence."""
+        return self.statistics.participating_nodes
+
+    def cache_info(self) -> PayloadCacheInfo:
+        """Return usage statistics of the attribute payload cache."""
+        return self._writer.cache_info()
+
+    def write_to(
+        self,
+        file: TextIO,
+        nodes: Iterable[int | str] = (),
+        attributes: Iterable[dict[str, Any]] | None = None,
+    ) -> None:
+        """Write nodes followed by the edges of the partition to a dataset file.
+
+        Parameters
+        ----------
+        file : TextIO
+            File object to write to, usually after the dataset metadata.
+        nodes : Iterable[int | str], optional
+            Identifiers of the nodes to write before the edges.
+        attributes : Iterable[dict[str, Any]], optional
+            Metadata attributes of each node, in the order of ``nodes``.
+        """
+        with DatasetWriter(file, statistics=self.statistics) as writer:
+            writer.write_nodes(nodes, attributes)
+
+        self._writer.flush()
+        self._segments.spool.copy_to(file, self._segments.segments)
+
+
+class DatasetPartitions:
+    """A collection of partitions, created on first access by key.
+
+    Partitions are kept in the order in which their keys were first accessed. All
+    partitions spool their edges to one shared temporary file.
+
+    Examples
+    --------
+    >>> with DatasetPartitions() as partitions:  # doctest: +SKIP
+    ...     for hyperedge in hyperedges:
+    ...         partitions[hyperedge["label"]].write_edge(hyperedge)
+    ...     for label, partition in partitions.items():
+    ...         with open_gzip(target_dir / f"{label}.txt.gz") as file:
+    ...             write_dataset_metadata(file, label, revision)
+    ...             partition.write_to(file)
+    """
+
+    def __init__(self, *, chunk_size: int = 1 << 20) -> None:
+        self.chunk_size = chunk_size
+        self._partitions: dict[Hashable, DatasetPartition] = {}
+        self._spool = _Spool()
+
+    def __enter__(self) -> DatasetPartitions:
+        """Return the collection itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Remove the spooled edges of all partitions."""
+        self.close()
+
+    def close(self) -> None:
+        """Remove the spooled edges of all partitions."""
+        for partition in self._partitions.values():
+            partition.close()
+        self._spool.close()
+
+    def __getitem__(self, key: Hashable) -> DatasetPartition:
+        """Return the partition for a key, creating it if necessary."""
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = self._partitions[key] = DatasetPartition(
+                chunk_size=self.chunk_size, spool=self._spool
+            )
+        return partition
+
+    def __len__(self) -> int:
+        """Return the number of partitions."""
+        return len(self._partitions)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the partition keys in order of first access."""
+        return iter(self._partitions)
+
+    def items(self) -> Iterator[tuple[Hashable, DatasetPartition]]:
+        """Iterate over the keys and partitions in order of first access."""
+        return iter(self._partitions.items())
+
+    def edge_counts(self) -> dict[Hashable, int]:
+        """Return the number of edges per partition key, in order of first access."""
+        return {key: partition.statistics.num_edges for key, partition in self.items()}
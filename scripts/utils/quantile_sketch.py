@@ -0,0 +1,298 @@
+"""Mergeable quantile sketches for approximate statistics of very large datasets.
+
+A ``QuantileSketch`` summarizes a stream of numbers in a small, bounded amount of memory
+with the KLL algorithm [1]_. Values are kept in compactors of increasing weight: once a
+compactor exceeds its capacity, its values are sorted and every other value, starting at
+a random offset, is promoted to the next compactor with twice the weight. The capacities
+decrease geometrically from ``k`` at the top level, so the sketch retains only about
+``3 * k`` values plus a few per level, irrespective of the number of observations.
+
+The value that the sketch reports at a rank has a true rank within ``rank_error`` times
+the number of observations of it, with a probability of about 99 %. The minimum and
+maximum are tracked exactly. The random offsets are drawn from a seeded generator, so
+the same values added in the same order always yield the same sketch.
+
+Sketches of disjoint parts of a dataset can be computed independently, e.g., by
+parallel workers, and combined with ``merge`` without losing accuracy guarantees. Use
+`compute_boxplot_stats_from_sketch` to compute box-plot statistics from a sketch.
+
+References
+----------
+.. [1] Z. Karnin, K. Lang, and E. Liberty, "Optimal Quantile Approximation in
+   Streams," 2016 IEEE 57th Annual Symposium on Foundations of Computer Science
+   (FOCS), pp. 71-78, 2016.
+
+Examples
+--------
+>>> sketches = [QuantileSketch(rank_error=0.05) for _ in range(2)]
+>>> sketches[0].update(range(0, 10_000, 2))
+>>> sketches[1].update(range(1, 10_000, 2))
+>>> sketch = sketches[0].merge(sketches[1])
+>>> sketch.total, sketch.min, sketch.max
+(10000, 0, 9999)
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import ArrayLike
+
+# Number of buffered values that are folded into the compactors at once.
+_BUFFER_SIZE = 1 << 16
+# Ratio of the capacities of adjacent compactors.
+_CAPACITY_RATIO = 2 / 3
+# Smallest capacity of a compactor, so that every compaction promotes a value.
+_MIN_CAPACITY = 2
+# Smallest supported ``k``.
+_MIN_K = 8
+# Empirical fit of the normalized rank error of KLL sketches at 99 % confidence as
+# ``_ERROR_FACTOR / k**_ERROR_EXPONENT``, see the Apache DataSketches documentation.
+_ERROR_FACTOR = 2.296
+_ERROR_EXPONENT = 0.9723
+
+
+def _k_for_rank_error(rank_error: float) -> int:
+    """Return the smallest ``k`` whose rank error is at most the given one."""
+    k = math.ceil((_ERROR_FACTOR / rank_error) ** (1 / _ERROR_EXPONENT))
+    return max(k, _MIN_K)
+
+
+def _rank_error_for_k(k: int) -> float:
+    """Return the normalized rank error of a sketch with the given ``k``."""
+    return _ERROR_FACTOR / k**_ERROR_EXPONENT
+
+
+def _clean(value: float) -> int | float:
+    """Represent integral floating-point values as integers."""
+    return int(value) if float(value).is_integer() else float(value)
+
+
+class QuantileSketch:
+    """Approximate distribution of a stream of numbers in bounded memory.
+
+    Parameters
+    ----------
+    rank_error : float, default=0.01
+        Upper bound of the normalized rank error of the reported values, which
+        determines the size of the sketch. Halving it roughly doubles the memory.
+    seed : int, default=0
+        Seed of the random offsets of the compactions.
+
+    Raises
+    ------
+    ValueError
+        If ``rank_error`` is not between zero and one.
+
+    Notes
+    -----
+    All values, including the minimum and maximum, are stored as 64-bit floats.
+    Integers beyond ``2**53`` in magnitude are therefore rounded to the nearest
+    representable float, and the reported values may differ from the observed ones.
+    Use `compute_boxplot_stats` for exact statistics of such values. Integral
+    values are reported as integers.
+    """
+
+    def __init__(self, rank_error: float = 0.01, *, seed: int = 0) -> None:
+        if not 0 < rank_error < 1:
+            raise ValueError("The rank error must be between zero and one.")
+        self.k = _k_for_rank_error(rank_error)
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        self._levels: list[np.ndarray] = [np.empty(0)]
+        self._buffer = array("d")
+        self._total = 0
+        self._min: int | float | None = None
+        self._max: int | float | None = None
+
+    @property
+    def rank_error(self) -> float:
+        """The normalized rank error of the reported values at 99 % confidence."""
+        return _rank_error_for_k(self.k)
+
+    def _capacity(self, level: int) -> int:
+        """Return the number of values that a compactor holds before it is compacted."""
+        depth = len(self._levels) - 1 - level
+        return max(math.ceil(self.k * _CAPACITY_RATIO**depth), _MIN_CAPACITY)
+
+    def _compress(self) -> None:
+        """Compact all compactors that exceed their capacity, from the bottom up."""
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if len(values) <= self._capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            values = np.sort(values)
+            # An odd value out stays behind, so that the total weight is preserved.
+            kept, paired = values[: len(values) % 2], values[len(values) % 2 :]
+            promoted = paired[int(self._rng.integers(2)) :: 2]
+            self._levels[level] = kept
+            self._levels[level + 1] = np.concatenate(
+                [self._levels[level + 1], promoted]
+            )
+            # Adding a level shrinks the capacities of all lower compactors.
+            level = 0
+
+    def _add_array(self, values: np.ndarray) -> None:
+        """Fold an array of values into the bottom compactor."""
+        if not len(values):
+            return
+        low, high = values.min().item(), values.max().item()
+        self._min = low if self._min is None else min(self._min, low)
+        self._max = high if self._max is None else max(self._max, high)
+        self._total += len(values)
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def _flush(self) -> None:
+        """Fold the buffered values into the compactors."""
+        if self._buffer:
+            values = np.frombuffer(self._buffer, dtype=np.float64).copy()
+            self._buffer = array("d")
+            self._add_array(values)
+
+    def add(self, value: int | float) -> None:
+        """Add an observation.
+
+        Parameters
+        ----------
+        value : int | float
+            The observation.
+        """
+        self._buffer.append(value)
+        if len(self._buffer) >= _BUFFER_SIZE:
+            self._flush()
+
+    def update(self, values: Iterable[int | float] | ArrayLike) -> None:
+        """Add several observations.
+
+        Parameters
+        ----------
+        values : Iterable[int | float] | ArrayLike
+            The observations, e.g., a chunk of degrees.
+        """
+        if isinstance(values, np.ndarray):
+            self._flush()
+            self._add_array(values.astype(np.float64).ravel())
+            return
+
+        self._buffer.extend(values)
+        if len(self._buffer) >= _BUFFER_SIZE:
+            self._flush()
+
+    def merge(self, *others: QuantileSketch) -> QuantileSketch:
+        """Combine this sketch with others into a new sketch.
+
+        Parameters
+        ----------
+        *others : QuantileSketch
+            Sketches of other parts of the data.
+
+        Returns
+        -------
+        QuantileSketch
+            The sketch of all parts, with the smallest ``k`` and the seed of this
+            sketch. The merged sketches are left unchanged.
+        """
+        sketches = [self, *others]
+        for sketch in sketches:
+            sketch._flush()
+        merged = QuantileSketch(seed=self.seed)
+        merged.k = min(sketch.k for sketch in sketches)
+        num_levels = max(len(sketch._levels) for sketch in sketches)
+        merged._levels = [
+            np.concatenate(
+                [
+                    sketch._levels[level]
+                    for sketch in sketches
+                    if level < len(sketch._levels)
+                ]
+            )
+            for level in range(num_levels)
+        ]
+        merged._total = sum(sketch._total for sketch in sketches)
+        minima = [sketch._min for sketch in sketches if sketch._min is not None]
+        maxima = [sketch._max for sketch in sketches if sketch._max is not None]
+        merged._min = min(minima) if minima else None
+        merged._max = max(maxima) if maxima else None
+        merged._compress()
+        return merged
+
+    @property
+    def total(self) -> int:
+        """The number of observations."""
+        self._flush()
+        return self._total
+
+    @property
+    def min(self) -> int | float | None:
+        """The exact minimum, or `None` if there are no observations."""
+        self._flush()
+        return None if self._min is None else _clean(self._min)
+
+    @property
+    def max(self) -> int | float | None:
+        """The exact maximum, or `None` if there are no observations."""
+        self._flush()
+        return None if self._max is None else _clean(self._max)
+
+    def __len__(self) -> int:
+        """Return the number of values that the sketch retains."""
+        self._flush()
+        return sum(len(values) for values in self._levels)
+
+    def __repr__(self) -> str:
+        """Return a representation with the size and accuracy of the sketch."""
+        return (
+            f"QuantileSketch(k={self.k}, total={self.total}, retained={len(self)}, "
+            f"rank_error={self.rank_error:.4g})"
+        )
+
+    def values_at_ranks(self, ranks: ArrayLike) -> np.ndarray:
+        """Return the approximate values at the given ranks of the sorted observations.
+
+        Parameters
+        ----------
+        ranks : ArrayLike
+            Zero-based ranks between zero and ``total - 1``. The first and last rank
+            yield the exact minimum and maximum.
+
+        Returns
+        -------
+        np.ndarray
+            The value at each rank.
+
+        Raises
+        ------
+        ValueError
+            If a rank is out of range.
+        """
+        ranks = np.asarray(ranks, dtype=np.int64)
+        total = self.total
+        if len(ranks) and (ranks.min() < 0 or ranks.max() >= total):
+            raise ValueError(f"Ranks must be between 0 and {total - 1}.")
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level), 1 << height)
+                for height, level in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        values, cumulative_weights = values[order], np.cumsum(weights[order])
+        # The value at a rank is the first one whose cumulative weight exceeds it.
+        result = values[np.searchsorted(cumulative_weights, ranks, side="right")]
+        result[ranks == 0] = self._min
+        result[ranks == total - 1] = self._max
+        return result
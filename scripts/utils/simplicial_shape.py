@@ -22,8 +22,15 @@ class SimplicialClosureShape:
 
 
 def _maximal_facets(facets: Iterable[frozenset[int]]) -> list[frozenset[int]]:
-    """Return unique facets that are not contained in another facet."""
+    """Return unique facets that are not contained in another facet.
+
+    Facets are visited from largest to smallest, so every superset of a facet is
+    visited before it. An inverted index maps each vertex to the maximal facets found
+    so far that contain it, and a facet is only compared against the maximal facets of
+    its rarest vertex, as every superset must contain that vertex.
+    """
     maximal: list[frozenset[int]] = []
+    facets_by_vertex: defaultdict[int, list[frozenset[int]]] = defaultdict(list)
 
     for facet in sorted(
         set(facets),
@@ -32,8 +39,13 @@ def _maximal_facets(facets: Iterable[frozenset[int]]) -> list[frozenset[int]]:
     ):
         if len(facet) == 0:
             continue
-        if not any(facet <= existing_facet for existing_facet in maximal):
+        candidates = min(
+            (facets_by_vertex.get(vertex, []) for vertex in facet), key=len
+        )
+        if not any(facet <= existing_facet for existing_facet in candidates):
             maximal.append(facet)
+            for vertex in facet:
+                facets_by_vertex[vertex].append(facet)
 
     return maximal
 
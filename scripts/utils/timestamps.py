@@ -0,0 +1,125 @@
+"""Utilities for converting integer timestamp columns.
+
+Source datasets store timestamps as integers, either relative to the Unix epoch
+(1970-01-01) or, like .NET ``DateTime`` ticks, relative to 0001-01-01. The functions in
+this module convert whole columns of such timestamps at once instead of creating a
+`datetime` per value. Every distinct timestamp is formatted only once, and repeated
+timestamps reuse the formatted string.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+Epoch = Literal["unix", "dotnet"]
+Unit = Literal["s", "ms"]
+
+# Number of seconds from 0001-01-01 (the .NET epoch) to 1970-01-01 (the Unix epoch).
+_DOTNET_EPOCH_OFFSET_SECONDS = 62_135_596_800
+_UNITS_PER_SECOND = {"s": 1, "ms": 1_000}
+
+
+def to_datetime64(
+    times: Iterable[int] | np.ndarray, *, epoch: Epoch = "unix", unit: Unit = "s"
+) -> np.ndarray:
+    """Convert integer timestamps to a NumPy ``datetime64`` array.
+
+    Parameters
+    ----------
+    times : Iterable[int] | np.ndarray
+        The timestamps.
+    epoch : {"unix", "dotnet"}, default="unix"
+        Whether the timestamps count from 1970-01-01 or from 0001-01-01.
+    unit : {"s", "ms"}, default="s"
+        Whether the timestamps count seconds or milliseconds.
+
+    Returns
+    -------
+    np.ndarray
+        The timestamps as UTC ``datetime64`` values in the given unit.
+
+    Raises
+    ------
+    ValueError
+        If ``epoch`` or ``unit`` is not supported.
+    """
+    if epoch not in {"unix", "dotnet"}:
+        raise ValueError(f"Unsupported epoch `{epoch}`.")
+    if unit not in _UNITS_PER_SECOND:
+        raise ValueError(f"Unsupported unit `{unit}`.")
+
+    times = np.asarray(
+        times if isinstance(times, np.ndarray) else list(times), dtype=np.int64
+    )
+    if epoch == "dotnet":
+        times = times - _DOTNET_EPOCH_OFFSET_SECONDS * _UNITS_PER_SECOND[unit]
+    return times.astype(f"datetime64[{unit}]")
+
+
+def format_timestamps(
+    times: Iterable[int] | np.ndarray, *, epoch: Epoch = "unix", unit: Unit = "s"
+) -> list[str]:
+    """Format integer timestamps as ISO 8601 strings in UTC.
+
+    The strings are identical to ``datetime.isoformat()`` of the corresponding
+    timezone-aware `datetime` objects, e.g., ``2010-05-03T12:34:56+00:00``, with
+    microseconds only if they are non-zero.
+
+    Parameters
+    ----------
+    times : Iterable[int] | np.ndarray
+        The timestamps.
+    epoch : {"unix", "dotnet"}, default="unix"
+        Whether the timestamps count from 1970-01-01 or from 0001-01-01.
+    unit : {"s", "ms"}, default="s"
+        Whether the timestamps count seconds or milliseconds.
+
+    Returns
+    -------
+    list[str]
+        The formatted timestamps. Equal timestamps share the same string object.
+    """
+    values, inverse = np.unique(
+        to_datetime64(times, epoch=epoch, unit=unit), return_inverse=True
+    )
+    formatted = np.datetime_as_string(values, unit="s").astype(object)
+    fractional = values != values.astype("datetime64[s]")
+    if fractional.any():
+        formatted[fractional] = np.datetime_as_string(values[fractional], unit="us")
+    formatted = [f"{value}+00:00" for value in formatted.tolist()]
+    return [formatted[i] for i in inverse.tolist()]
+
+
+def format_dates(
+    times: Iterable[int] | np.ndarray, *, epoch: Epoch = "unix", unit: Unit = "s"
+) -> list[str]:
+    """Format integer timestamps as ISO 8601 dates in UTC.
+
+    The strings are identical to ``str(date)`` of the day each timestamp falls on,
+    e.g., ``2010-05-03``.
+
+    Parameters
+    ----------
+    times : Iterable[int] | np.ndarray
+        The timestamps.
+    epoch : {"unix", "dotnet"}, default="unix"
+        Whether the timestamps count from 1970-01-01 or from 0001-01-01.
+    unit : {"s", "ms"}, default="s"
+        Whether the timestamps count seconds or milliseconds.
+
+    Returns
+    -------
+    list[str]
+        The formatted dates. Equal dates share the same string object.
+    """
+    values, inverse = np.unique(
+        to_datetime64(times, epoch=epoch, unit=unit).astype("datetime64[D]"),
+        return_inverse=True,
+    )
+    formatted = np.datetime_as_string(values).tolist()
+    return [formatted[i] for i in inverse.tolist()]
@@ -6,17 +6,30 @@ information in various formats.
 
 import json
 import re
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TextIO
 
-import yaml
+import numpy as np
 
-from .yaml import Dumper, read_frontmatter
+from .artifacts import open_atomic
+from .hyperedge_table import HyperedgeTable
+from .yaml import dump_frontmatter, read_frontmatter
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from .columnar import ColumnarDataset
+    from .dataset_statistics import StatisticsAccumulator
+
+
+# Types of attribute values whose JSON encoding only depends on their type and value.
+# Floats and datetimes are excluded because equal values can be encoded differently,
+# e.g., `0.0` and `-0.0`, or the same instant in different time zones.
+_CACHEABLE_TYPES = frozenset({str, int, bool, type(None)})
+
 
 def _format_attributes(attributes: dict[Any, Any]) -> dict[Any, Any]:
     for key, value in attributes.items():
@@ -25,6 +38,22 @@ def _format_attributes(attributes: dict[Any, Any]) -> dict[Any, Any]:
     return attributes
 
 
+def _apply_frontmatter_update(
+    frontmatter: dict[Any, Any], update: dict[Any, Any]
+) -> None:
+    """Apply an update to frontmatter in place, merging the attachments."""
+    if "attachments" in update:
+        existing_attachments = frontmatter.get("attachments", {})
+        incoming_attachments = update.get("attachments")
+        merged_attachments = {**existing_attachments, **incoming_attachments}
+        frontmatter["attachments"] = merged_attachments
+
+    merged_update = {
+        key: value for key, value in update.items() if key != "attachments"
+    }
+    frontmatter.update(merged_update)
+
+
 def update_frontmatter(path: Path | str, update: dict[Any, Any]) -> None:
     """Update the frontmatter of a markdown file.
 
@@ -35,25 +64,35 @@ def update_frontmatter(path: Path | str, update: dict[Any, Any]) -> None:
     update : dict[Any, Any]
         Dictionary containing the updates to apply to the frontmatter.
     """
-    if isinstance(path, str):
-        path = Path(path)
+    update_frontmatter_many([(path, update)])
 
-    with path.open("r") as file:
-        content = file.read()
 
-    frontmatter, body = read_frontmatter(content)
-    if "attachments" in update:
-        existing_attachments = frontmatter.get("attachments", {})
-        incoming_attachments = update.get("attachments")
-        merged_attachments = {**existing_attachments, **incoming_attachments}
-        frontmatter["attachments"] = merged_attachments
+def update_frontmatter_many(
+    updates: Iterable[tuple[Path | str, dict[Any, Any]]],
+) -> None:
+    """Update the frontmatter of several markdown files.
 
-    merged_update = {
-        key: value for key, value in update.items() if key != "attachments"
-    }
-    frontmatter.update(merged_update)
+    Each file is read and written once, no matter how many updates apply to it.
+
+    Parameters
+    ----------
+    updates : Iterable[tuple[Path | str, dict[Any, Any]]]
+        Pairs of a path to a markdown file and an update to apply to its frontmatter,
+        as in `update_frontmatter`. Updates of the same file are applied in order.
+    """
+    updates_by_path: dict[Path, list[dict[Any, Any]]] = {}
+    for path, update in updates:
+        updates_by_path.setdefault(Path(path), []).append(update)
+
+    for path, file_updates in updates_by_path.items():
+        with path.open("r") as file:
+            content = file.read()
+
+        frontmatter, body = read_frontmatter(content)
+        for update in file_updates:
+            _apply_frontmatter_update(frontmatter, update)
 
-    write_markdown(path, frontmatter, body)
+        write_markdown(path, frontmatter, body)
 
 
 def write_edge(file: TextIO, elements: Iterable[int | str], **kwargs: Any) -> None:
@@ -73,6 +112,346 @@ def write_edge(file: TextIO, elements: Iterable[int | str], **kwargs: Any) -> No
     )
 
 
+def write_edges(
+    file: TextIO,
+    edges: HyperedgeTable,
+    *,
+    label_key: str | None = None,
+    **kwargs: Any,
+) -> None:
+    """Write all hyperedges of a table with metadata to a file in JSON format.
+
+    Parameters
+    ----------
+    file : TextIO
+        File object to write the edges to.
+    edges : HyperedgeTable
+        The hyperedges to write.
+    label_key : str, optional
+        If given, the label of each hyperedge is written as an attribute with this
+        name.
+    **kwargs
+        Additional metadata attributes shared by all edges.
+    """
+    with DatasetWriter(file) as writer:
+        writer.write_edges(edges, label_key=label_key, **kwargs)
+
+
+@dataclass(frozen=True)
+class PayloadCacheInfo:
+    """Usage statistics of the attribute payload cache of a `DatasetWriter`.
+
+    Attributes
+    ----------
+    hits : int
+        Number of attribute payloads that were served from the cache.
+    misses : int
+        Number of cacheable attribute payloads that had to be encoded.
+    size : int
+        Number of payloads currently held in the cache.
+    max_size : int
+        Maximum number of payloads held in the cache.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of cacheable payloads that were served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        """Return a human-readable summary of the cache usage."""
+        return (
+            f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.1%} hit rate), "
+            f"{self.size}/{self.max_size} entries"
+        )
+
+
+class DatasetWriter:
+    """Buffered writer for the nodes and edges of a dataset file.
+
+    Lines are collected in memory and written to the underlying file in chunks, which
+    avoids a separate ``file.write`` per line. The lines are byte-for-byte identical to
+    those of ``write_node`` and ``write_edge``. Use the writer as a context manager,
+    or call ``flush`` before closing the file.
+
+    Attribute payloads are usually repeated, e.g., a label with a few distinct values
+    on every edge. The writer therefore caches the JSON encoding of attribute payloads
+    whose values are strings, integers, booleans or `None`, keyed by their names,
+    types and values. The cache is
+    bounded and evicts the least recently used payloads, so high-cardinality
+    attributes cannot exhaust the memory. Use ``cache_info`` to check its hit rate.
+
+    If a `StatisticsAccumulator` is attached, every written node and edge is also
+    recorded in it, so the statistics of the datasheet are available once the dataset
+    file is written. Likewise, an attached `ColumnarDataset` collects the nodes, edges
+    and attributes for a columnar companion file.
+
+    Parameters
+    ----------
+    file : TextIO
+        File object to write to.
+    chunk_size : int, default=1 MiB
+        Number of characters that are buffered before they are written to ``file``.
+    payload_cache_size : int, default=4096
+        Maximum number of encoded attribute payloads that are cached. Use 0 to
+        disable the cache.
+    statistics : StatisticsAccumulator, optional
+        Accumulator that records the written nodes and edges.
+    columns : ColumnarDataset, optional
+        Columnar copy of the written nodes and edges.
+
+    Examples
+    --------
+    >>> with open_gzip(dataset_file, "wt") as file:  # doctest: +SKIP
+    ...     write_dataset_metadata(file, slug, revision)
+    ...     with DatasetWriter(file) as writer:
+    ...         writer.write_nodes(nodes)
+    ...         writer.write_edges(hyperedges, label_key="label")
+    """
+
+    def __init__(
+        self,
+        file: TextIO,
+        *,
+        chunk_size: int = 1 << 20,
+        payload_cache_size: int = 4096,
+        statistics: StatisticsAccumulator | None = None,
+        columns: ColumnarDataset | None = None,
+    ) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.payload_cache_size = payload_cache_size
+        self.statistics = statistics
+        self.columns = columns
+        # Everything that records the written nodes and edges one by one.
+        self._recorders = tuple(
+            recorder for recorder in (statistics, columns) if recorder is not None
+        )
+        self._buffer: list[str] = []
+        self._buffered_size = 0
+        self._payloads: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+        self._payload_hits = 0
+        self._payload_misses = 0
+
+    def __enter__(self) -> DatasetWriter:
+        """Return the writer itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Flush the remaining buffered lines."""
+        self.flush()
+
+    def _append(self, line: str) -> None:
+        self._buffer.append(line)
+        self._buffered_size += len(line)
+        if self._buffered_size >= self.chunk_size:
+            self.flush()
+
+    def _encode(self, attributes: dict[str, Any]) -> str:
+        """Encode attributes as JSON, reusing cached encodings of equal payloads."""
+        # The type is part of the key because, e.g., `1`, `1.0` and `True` are equal
+        # but encoded differently.
+        key = tuple((name, type(value), value) for name, value in attributes.items())
+        if self.payload_cache_size <= 0 or not all(
+            value_type in _CACHEABLE_TYPES for _, value_type, _ in key
+        ):
+            return json.dumps(_format_attributes(attributes))
+
+        payload = self._payloads.get(key)
+        if payload is not None:
+            self._payload_hits += 1
+            self._payloads.move_to_end(key)
+            return payload
+
+        self._payload_misses += 1
+        payload = self._payloads[key] = json.dumps(_format_attributes(attributes))
+        if len(self._payloads) > self.payload_cache_size:
+            self._payloads.popitem(last=False)
+        return payload
+
+    def cache_info(self) -> PayloadCacheInfo:
+        """Return usage statistics of the attribute payload cache."""
+        return PayloadCacheInfo(
+            self._payload_hits,
+            self._payload_misses,
+            len(self._payloads),
+            self.payload_cache_size,
+        )
+
+    def flush(self) -> None:
+        """Write all buffered lines to the underlying file."""
+        if self._buffer:
+            self.file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered_size = 0
+
+    def write_node(self, node: int | str, **kwargs: Any) -> None:
+        """Write a node with metadata, like ``write_node``.
+
+        Parameters
+        ----------
+        node : int | str
+            Node identifier.
+        **kwargs
+            Additional metadata attributes for the node.
+        """
+        for recorder in self._recorders:
+            recorder.add_node(node, kwargs)
+        self._append(f"{node} {self._encode(kwargs)}\n")
+
+    def write_edge(self, elements: Iterable[int | str], **kwargs: Any) -> None:
+        """Write an edge with metadata, like ``write_edge``.
+
+        Parameters
+        ----------
+        elements : Iterable[int | str]
+            Node identifiers that form the edge.
+        **kwargs
+            Additional metadata attributes for the edge.
+        """
+        if self._recorders:
+            elements = list(elements)
+            for recorder in self._recorders:
+                recorder.add_edge(elements, kwargs)
+        self._append(f"{','.join(map(str, elements))} {self._encode(kwargs)}\n")
+
+    def write_nodes(
+        self,
+        nodes: Iterable[int | str] | np.ndarray,
+        attributes: Iterable[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Write a batch of nodes with metadata.
+
+        Parameters
+        ----------
+        nodes : Iterable[int | str] | np.ndarray
+            Node identifiers.
+        attributes : Iterable[dict[str, Any]], optional
+            Metadata attributes of each node, in the order of ``nodes``.
+        **kwargs
+            Additional metadata attributes shared by all nodes, written before the
+            per-node attributes.
+        """
+        if isinstance(nodes, np.ndarray):
+            nodes = nodes.tolist()
+        recorders = self._recorders
+        if attributes is None:
+            payload = json.dumps(_format_attributes(dict(kwargs)))
+            for node in nodes:
+                for recorder in recorders:
+                    recorder.add_node(node, kwargs)
+                self._append(f"{node} {payload}\n")
+            return
+
+        for node, node_attributes in zip(nodes, attributes, strict=True):
+            merged = {**kwargs, **node_attributes}
+            for recorder in recorders:
+                recorder.add_node(node, merged)
+            self._append(f"{node} {self._encode(merged)}\n")
+
+    def write_edges(
+        self,
+        edges: Iterable[Iterable[int | str]] | HyperedgeTable,
+        attributes: Iterable[dict[str, Any]] | None = None,
+        *,
+        label_key: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Write a batch of edges with metadata.
+
+        Parameters
+        ----------
+        edges : Iterable[Iterable[int | str]] | HyperedgeTable
+            Node identifiers of each edge, or a table of hyperedges.
+        attributes : Iterable[dict[str, Any]], optional
+            Metadata attributes of each edge, in the order of ``edges``.
+        label_key : str, optional
+            If given and ``edges`` is a table, the label of each hyperedge is written
+            as an attribute with this name.
+        **kwargs
+            Additional metadata attributes shared by all edges, written before the
+            per-edge attributes and labels.
+        """
+        if isinstance(edges, HyperedgeTable):
+            self._write_table(edges, attributes, label_key=label_key, **kwargs)
+            return
+        if label_key is not None:
+            raise ValueError("Labels can only be written for hyperedge tables.")
+
+        recorders = self._recorders
+        if attributes is None:
+            payload = json.dumps(_format_attributes(dict(kwargs)))
+            for elements in edges:
+                if recorders:
+                    elements = list(elements)
+                    for recorder in recorders:
+                        recorder.add_edge(elements, kwargs)
+                self._append(f"{','.join(map(str, elements))} {payload}\n")
+            return
+
+        for elements, edge_attributes in zip(edges, attributes, strict=True):
+            merged = {**kwargs, **edge_attributes}
+            if recorders:
+                elements = list(elements)
+                for recorder in recorders:
+                    recorder.add_edge(elements, merged)
+            self._append(f"{','.join(map(str, elements))} {self._encode(merged)}\n")
+
+    def _write_table(
+        self,
+        edges: HyperedgeTable,
+        attributes: Iterable[dict[str, Any]] | None,
+        *,
+        label_key: str | None,
+        **kwargs: Any,
+    ) -> None:
+        """Write the hyperedges of a table, formatting each node identifier once."""
+        if self._recorders and attributes is not None:
+            attributes = list(attributes)
+        for recorder in self._recorders:
+            recorder.add_table(edges, attributes, label_key=label_key, **kwargs)
+        node_names = list(map(str, edges.indices.tolist()))
+        bounds = edges.offsets.tolist()
+        rows = (
+            ",".join(node_names[bounds[i] : bounds[i + 1]]) for i in range(len(edges))
+        )
+
+        if label_key is not None:
+            if edges.label_codes is None or edges.label_categories is None:
+                raise ValueError("The table has no labels.")
+            labels = edges.label_categories
+            label_attributes = (
+                {label_key: labels[code]} for code in edges.label_codes.tolist()
+            )
+            attributes = (
+                label_attributes
+                if attributes is None
+                else (
+                    {**edge_attributes, **label_attribute}
+                    for edge_attributes, label_attribute in zip(
+                        attributes, label_attributes, strict=True
+                    )
+                )
+            )
+
+        if attributes is None:
+            payload = json.dumps(_format_attributes(kwargs))
+            for row in rows:
+                self._append(f"{row} {payload}\n")
+            return
+
+        for row, edge_attributes in zip(rows, attributes, strict=True):
+            payload = self._encode({**kwargs, **edge_attributes})
+            self._append(f"{row} {payload}\n")
+
+
 def write_dataset_metadata(
     file: TextIO, name: str, revision: int, format_version: str = "0.3", **kwargs: Any
 ) -> None:
@@ -129,6 +508,9 @@ def write_network_metadata(file: TextIO, **kwargs: Any) -> None:
 def write_markdown(path: Path | str, frontmatter: dict[Any, Any], body: str) -> None:
     """Write a markdown file with YAML frontmatter.
 
+    The file is replaced atomically, so an interrupted write never leaves a truncated
+    file behind.
+
     Parameters
     ----------
     path : Path | str
@@ -141,9 +523,9 @@ def write_markdown(path: Path | str, frontmatter: dict[Any, Any], body: str) ->
     if isinstance(path, str):
         path = Path(path)
 
-    with path.open("w") as file:
+    with open_atomic(path, manifest=False) as file:
         file.write("---\n")
-        yaml.dump(frontmatter, file, sort_keys=False, Dumper=Dumper)
+        file.write(dump_frontmatter(frontmatter))
         file.write("---\n")
         file.write(body)
 
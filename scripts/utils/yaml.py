@@ -1,10 +1,22 @@
-"""Utility scripts for handling YAML data."""
+"""Utility scripts for handling YAML data.
+
+Frontmatter is loaded with libyaml when PyYAML was built with it, which is much faster
+for large datasheets. Frontmatter is always dumped with the pure-Python ``Dumper``: the
+libyaml emitter ignores its indentation of block sequences and differs in the details
+of scalar styles, explicit keys and document markers, so its output would change the
+datasheets.
+"""
 
 import re
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML without libyaml
+    from yaml import SafeLoader
+
 
 class Dumper(yaml.Dumper):
     """Custom YAML dumper that fixes indentation of lists.
@@ -30,6 +42,22 @@ def patch_dumper() -> None:
     yaml.add_representer(str, repr_str, Dumper=Dumper)
 
 
+def dump_frontmatter(frontmatter: dict[Any, Any]) -> str:
+    """Dump frontmatter to YAML with ``Dumper``.
+
+    Parameters
+    ----------
+    frontmatter : dict[Any, Any]
+        Frontmatter data as a dictionary.
+
+    Returns
+    -------
+    str
+        The YAML document, without document markers.
+    """
+    return yaml.dump(frontmatter, sort_keys=False, Dumper=Dumper)
+
+
 def read_frontmatter(markdown: str) -> tuple[dict[str, Any], str]:
     """Read the frontmatter from a markdown string.
 
@@ -47,7 +75,7 @@ def read_frontmatter(markdown: str) -> tuple[dict[str, Any], str]:
     """
     frontmatter_match = re.match(r"---\n(.*?)\n---\n(.*)", markdown, re.DOTALL)
     if frontmatter_match:
-        frontmatter = yaml.safe_load(frontmatter_match.group(1))
+        frontmatter = yaml.load(frontmatter_match.group(1), Loader=SafeLoader)
         body = frontmatter_match.group(2)
 
         if not isinstance(body, str):
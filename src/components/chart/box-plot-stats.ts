@@ -4,6 +4,9 @@ export type BoxPlotStats = {
   median: number;
   q3: number;
   max: number;
+  // Set for summaries estimated from a quantile sketch of very large datasets.
+  approximate?: boolean;
+  "rank-error"?: number;
 };
 
 export function computeBox(values: number[]): BoxPlotStats | null {
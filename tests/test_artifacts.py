@@ -0,0 +1,185 @@
+"""Tests for the atomic artifact writers."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+from scripts.utils import artifacts
+from scripts.utils.artifacts import (
+    default_manifest,
+    is_complete,
+    is_run_complete,
+    open_atomic,
+    record_artifact,
+    record_run,
+    resume_requested,
+)
+from scripts.utils.compression import open_gzip
+from scripts.utils.write import write_markdown
+
+
+class _Unrepresentable:
+    """Value that fails to be dumped to YAML halfway through a datasheet."""
+
+    def __reduce_ex__(self, protocol: object) -> tuple[object, ...]:
+        raise RuntimeError
+
+
+class OpenAtomicTests(unittest.TestCase):
+    """Replace artifacts only once they are completely written."""
+
+    def setUp(self) -> None:
+        """Create a temporary output directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+        self.path = self.directory / "dataset.txt"
+
+    def tearDown(self) -> None:
+        """Remove the temporary files."""
+        self._tmp.cleanup()
+
+    def test_interrupted_write_keeps_the_previous_file(self) -> None:
+        """Remove the temporary file and keep the target if the block raises."""
+        with open_atomic(self.path) as file:
+            file.write("1 {}\n")
+
+        with self.assertRaises(KeyboardInterrupt), open_atomic(self.path) as file:
+            file.write("2 {}\n")
+            raise KeyboardInterrupt
+
+        self.assertEqual(self.path.read_text(), "1 {}\n")
+        self.assertFalse(any(self.directory.glob(".*.tmp")))
+        self.assertTrue(is_complete(self.path, verify=True))
+
+    def test_unchanged_content_is_not_replaced(self) -> None:
+        """Keep a file whose completion marker matches the new content."""
+        with open_atomic(self.path) as file:
+            file.write("1 {}\n")
+        os.utime(self.path, ns=(0, 0))
+
+        with open_atomic(self.path) as file:
+            file.write("1 {}\n")
+        self.assertEqual(self.path.stat().st_mtime_ns, 0)
+
+        with open_atomic(self.path) as file:
+            file.write("2 {}\n")
+        self.assertNotEqual(self.path.stat().st_mtime_ns, 0)
+
+    def test_completion_markers(self) -> None:
+        """Only trust artifacts that match their recorded size and hash."""
+        gzip_path = self.directory / "dataset.txt.gz"
+        self.assertFalse(is_complete(gzip_path))
+        with open_gzip(gzip_path) as file:
+            file.write("1,2 {}\n")
+        self.assertTrue(is_complete(gzip_path, verify=True))
+
+        with gzip_path.open("r+b") as file:
+            file.truncate(gzip_path.stat().st_size - 1)
+        self.assertFalse(is_complete(gzip_path))
+
+        with open_atomic(self.path) as file:
+            file.write("1 {}\n")
+        self.path.write_text("2 {}\n")
+        self.assertTrue(is_complete(self.path))
+        self.assertFalse(is_complete(self.path, verify=True))
+
+    def test_outdated_entries_are_not_trusted(self) -> None:
+        """Treat artifacts as incomplete if their entry was not updated with them."""
+        with open_atomic(self.path) as file:
+            file.write("1 {}\n")
+
+        record = artifacts.record_artifact
+        calls = []
+
+        def interrupted_record(*args: object) -> None:
+            calls.append(args)
+            if len(calls) > 1:
+                raise KeyboardInterrupt
+            record(*args)
+
+        with (
+            unittest.mock.patch.object(
+                artifacts, "record_artifact", interrupted_record
+            ),
+            self.assertRaises(KeyboardInterrupt),
+            open_atomic(self.path) as file,
+        ):
+            file.write("22 {}\n")
+        self.assertEqual(self.path.read_text(), "22 {}\n")
+        self.assertFalse(is_complete(self.path))
+
+        manifest = default_manifest(self.path)
+        entry = {"sha256": "0" * 64, "size": 6, "compressed-size": 6}
+        record_artifact(manifest, self.path.name, {**entry, "compressed-size": 5})
+        self.assertFalse(is_complete(self.path))
+        record_artifact(manifest, self.path.name, entry)
+        self.assertTrue(is_complete(self.path))
+        self.assertFalse(is_complete(self.path, verify=True))
+
+    def test_completed_runs_are_skipped(self) -> None:
+        """Skip a resumed run until its outputs or the code change."""
+        dataset = self.directory / "dataset.txt.gz"
+        datasheet = self.directory / "datasheet" / "dataset.mdx"
+        datasheet.parent.mkdir()
+        manifest = default_manifest(dataset)
+        code_directory = self.directory / "code"
+        code_directory.mkdir()
+        (code_directory / "dataset.py").write_text("revision = 1\n")
+        writes = []
+
+        def run(*, resume: bool = True, interrupt: bool = False) -> None:
+            if resume_requested(["--resume"] if resume else []) and is_run_complete(
+                "dataset", manifest=manifest
+            ):
+                return
+            writes.append(dataset)
+            with open_gzip(dataset) as file:
+                file.write("1,2 {}\n")
+            if interrupt:
+                raise KeyboardInterrupt
+            write_markdown(datasheet, {"title": "Dataset"}, "body\n")
+            record_run("dataset", [dataset, datasheet], manifest=manifest)
+
+        with unittest.mock.patch.object(artifacts, "_CODE_DIRECTORY", code_directory):
+            with self.assertRaises(KeyboardInterrupt):
+                run(interrupt=True)
+            self.assertFalse(is_run_complete("dataset", manifest=manifest))
+            run()
+            self.assertTrue(is_run_complete("dataset", manifest=manifest))
+            run()
+            self.assertEqual(len(writes), 2)
+            run(resume=False)
+            self.assertEqual(len(writes), 3)
+
+            datasheet.write_text("---\ntitle: Edited\n---\n")
+            run()
+            self.assertEqual(len(writes), 4)
+            dataset.unlink()
+            run()
+            self.assertEqual(len(writes), 5)
+            (code_directory / "dataset.py").write_text("revision = 2\n")
+            run()
+            self.assertEqual(len(writes), 6)
+            run()
+            self.assertEqual(len(writes), 6)
+
+    def test_markdown_is_written_atomically(self) -> None:
+        """Keep the previous datasheet if the frontmatter cannot be dumped."""
+        path = self.directory / "dataset.mdx"
+        write_markdown(path, {"title": "Dataset"}, "body\n")
+
+        with self.assertRaises(RuntimeError):
+            write_markdown(path, {"title": _Unrepresentable()}, "body\n")
+
+        self.assertEqual(path.read_text(), "---\ntitle: Dataset\n---\nbody\n")
+        self.assertEqual(
+            sorted(path.name for path in self.directory.iterdir()), ["dataset.mdx"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
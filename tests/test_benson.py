@@ -0,0 +1,281 @@
+"""Tests for the Benson dataset loaders."""
+
+from __future__ import annotations
+
+import gzip
+import lzma
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+from scripts.benson import (
+    iter_benson_simplices,
+    load_benson_hyperedge_table,
+    load_benson_hyperedges,
+    load_benson_simplex_arrays,
+    load_benson_simplices,
+)
+
+
+def _write_lines(path: Path, lines: list[object]) -> None:
+    path.write_text("".join(f"{line}\n" for line in lines))
+
+
+class BensonSimplicesTests(unittest.TestCase):
+    """Exercise the array and `Simplex` views of a Benson simplex dataset."""
+
+    def setUp(self) -> None:
+        """Create a small temporal dataset with labels and a duplicate vertex."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self._tmp.name) / "toy"
+        self.folder.mkdir()
+
+        _write_lines(self.folder / "toy-nverts.txt", [2, 3, 1, 2])
+        _write_lines(self.folder / "toy-simplices.txt", [1, 2, 2, 3, 4, 5, 6, 6])
+        _write_lines(self.folder / "toy-simplex-labels.txt", ["a", "b", "c", "d"])
+        _write_lines(self.folder / "toy-times.txt", [30, 10, 20, 10])
+
+    def tearDown(self) -> None:
+        """Remove the temporary dataset."""
+        self._tmp.cleanup()
+
+    def test_arrays_are_in_file_order(self) -> None:
+        """Expose offsets, flat indices and parallel columns without reordering."""
+        arrays = load_benson_simplex_arrays(self.folder)
+
+        self.assertEqual(len(arrays), 4)
+        self.assertEqual(arrays.offsets.tolist(), [0, 2, 5, 6, 8])
+        self.assertEqual(arrays.indices.tolist(), [1, 2, 2, 3, 4, 5, 6, 6])
+        self.assertEqual(arrays.labels, ["a", "b", "c", "d"])
+        self.assertEqual(arrays.times.tolist(), [30, 10, 20, 10])
+
+    def test_simplices_are_deduplicated_and_chronological(self) -> None:
+        """Build deduplicated simplices and sort them stably by time."""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            simplices = load_benson_simplices(self.folder)
+
+        self.assertEqual(len(caught), 1)
+        self.assertIn("1 hyperedges contain duplicate nodes", str(caught[0].message))
+
+        self.assertEqual(
+            [(set(simplex.elements), simplex["label"]) for simplex in simplices],
+            [({2, 3, 4}, "b"), ({6}, "d"), ({5}, "c"), ({1, 2}, "a")],
+        )
+        self.assertEqual([simplex["time"] for simplex in simplices], [10, 10, 20, 30])
+
+    def test_streaming_matches_loading(self) -> None:
+        """Stream the same chronological simplices through sorted spill runs."""
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            expected = [
+                (set(simplex.elements), simplex["label"], simplex["time"])
+                for simplex in load_benson_simplices(self.folder)
+            ]
+            for chunk_size in (1, 3, 10):
+                actual = [
+                    (set(simplex.elements), simplex["label"], simplex["time"])
+                    for simplex in iter_benson_simplices(
+                        self.folder, chunk_size=chunk_size
+                    )
+                ]
+                self.assertEqual(actual, expected)
+
+    def test_streaming_labels_with_tabs(self) -> None:
+        """Sort simplices whose labels contain tabs and non-ASCII characters."""
+        _write_lines(
+            self.folder / "toy-simplex-labels.txt", ["a\tb", "ö\t ü", "c", "d"]
+        )
+
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            expected = [
+                simplex["label"] for simplex in load_benson_simplices(self.folder)
+            ]
+            streamed = [
+                simplex["label"]
+                for simplex in iter_benson_simplices(self.folder, chunk_size=1)
+            ]
+
+        self.assertEqual(streamed, expected)
+        self.assertEqual(streamed, ["ö\t ü", "d", "c", "a\tb"])
+
+    def test_streaming_sorted_input_keeps_file_order(self) -> None:
+        """Stream already chronological datasets directly in file order."""
+        _write_lines(self.folder / "toy-times.txt", [1, 2, 2, 3])
+
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            simplices = list(iter_benson_simplices(self.folder, chunk_size=2))
+
+        self.assertEqual([simplex["label"] for simplex in simplices], list("abcd"))
+
+    def test_inconsistent_vertex_counts_are_rejected(self) -> None:
+        """Reject datasets whose vertex counts do not match the simplices file."""
+        _write_lines(self.folder / "toy-nverts.txt", [2, 3, 1, 3])
+
+        with self.assertRaisesRegex(ValueError, "expected format"):
+            load_benson_simplex_arrays(self.folder)
+
+    def test_streaming_detects_late_multilabels(self) -> None:
+        """Split the labels of a file whose first comma is far from the start."""
+        num_simplices = 20
+        _write_lines(self.folder / "toy-nverts.txt", [1] * num_simplices)
+        _write_lines(self.folder / "toy-simplices.txt", range(num_simplices))
+        _write_lines(
+            self.folder / "toy-simplex-labels.txt",
+            ["a"] * (num_simplices - 1) + ["a, b"],
+        )
+        _write_lines(self.folder / "toy-times.txt", range(num_simplices))
+
+        expected = [simplex["label"] for simplex in load_benson_simplices(self.folder)]
+        streamed = [simplex["label"] for simplex in iter_benson_simplices(self.folder)]
+
+        self.assertEqual(streamed, expected)
+        self.assertEqual(streamed[0], ["a"])
+        self.assertEqual(streamed[-1], ["a", "b"])
+
+    def test_streaming_rejects_undeclared_vertices(self) -> None:
+        """Reject trailing vertices that no simplex declares, like the loader."""
+        _write_lines(self.folder / "toy-nverts.txt", [2, 3, 1, 1])
+
+        with self.assertRaisesRegex(ValueError, "expected format"):
+            load_benson_simplex_arrays(self.folder)
+        for chunk_size in (1, 10):
+            with (
+                self.subTest(chunk_size=chunk_size),
+                self.assertRaisesRegex(ValueError, "more vertices than declared"),
+            ):
+                list(iter_benson_simplices(self.folder, chunk_size=chunk_size))
+
+    def test_malformed_lines_are_rejected(self) -> None:
+        """Reject malformed lines instead of silently truncating a column."""
+        for kind, lines in (
+            ("nverts", [2, 3, "x", 2]),
+            ("simplices", [1, 2, 2, 3, "4.5", 5, 6, 6]),
+            ("times", [30, 10, "20 10"]),
+            ("times", [30, 10, 20]),
+            ("simplex-labels", ["a", "b", "c"]),
+        ):
+            path = self.folder / f"toy-{kind}.txt"
+            original = path.read_text()
+            _write_lines(path, lines)
+            with (
+                self.subTest(kind=kind, lines=lines),
+                self.assertRaisesRegex(ValueError, path.name),
+            ):
+                load_benson_simplex_arrays(self.folder)
+            path.write_text(original)
+
+    def test_compressed_files_are_read_transparently(self) -> None:
+        """Find and decompress gzip and xz variants of the expected files."""
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            expected = load_benson_simplex_arrays(self.folder)
+
+            for opener, suffix, kind in (
+                (gzip.open, ".gz", "simplices"),
+                (lzma.open, ".xz", "times"),
+            ):
+                path = self.folder / f"toy-{kind}.txt"
+                with opener(path.with_name(path.name + suffix), "wb") as file:
+                    file.write(path.read_bytes())
+                path.unlink()
+
+            actual = load_benson_simplex_arrays(self.folder)
+            streamed = list(iter_benson_simplices(self.folder))
+
+        self.assertEqual(actual.indices.tolist(), expected.indices.tolist())
+        self.assertEqual(actual.times.tolist(), expected.times.tolist())
+        self.assertEqual([simplex["time"] for simplex in streamed], [10, 10, 20, 30])
+
+
+class BensonHyperedgesTests(unittest.TestCase):
+    """Exercise the serial and parallel parsing of hyperedge files."""
+
+    def setUp(self) -> None:
+        """Create a labelled hyperedge dataset with mixed separators."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self._tmp.name) / "toy"
+        self.folder.mkdir()
+
+        self.hyperedges = [[i, i + 1, i + 2][: 1 + i % 3] for i in range(1, 200)]
+        separators = [",", " ", "\t"]
+        _write_lines(
+            self.folder / "hyperedges-toy.txt",
+            [
+                separators[i % 3].join(map(str, hyperedge))
+                for i, hyperedge in enumerate(self.hyperedges)
+            ],
+        )
+        _write_lines(
+            self.folder / "hyperedge-labels-toy.txt",
+            [1 + i % 2 for i in range(len(self.hyperedges))],
+        )
+        _write_lines(self.folder / "hyperedge-label-names-toy.txt", ["even", "odd"])
+
+    def tearDown(self) -> None:
+        """Remove the temporary dataset."""
+        self._tmp.cleanup()
+
+    def test_parallel_parsing_matches_serial_parsing(self) -> None:
+        """Concatenate line-aligned ranges parsed in worker processes in order."""
+        for workers in (1, 3):
+            nodes, simplices = load_benson_hyperedges(self.folder, workers=workers)
+
+            self.assertEqual(
+                [sorted(simplex.elements) for simplex in simplices], self.hyperedges
+            )
+            self.assertEqual(
+                [simplex["label"] for simplex in simplices],
+                ["even", "odd"] * 99 + ["even"],
+            )
+            self.assertEqual(len(nodes), 200)
+
+    def test_workers_are_not_forked(self) -> None:
+        """Parse compressed sources in workers without the warning about forking."""
+        for name in ("hyperedges-toy.txt", "hyperedge-labels-toy.txt"):
+            path = self.folder / name
+            path.with_name(name + ".gz").write_bytes(gzip.compress(path.read_bytes()))
+            path.unlink()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            _, simplices = load_benson_hyperedges(self.folder, workers=3)
+
+        self.assertEqual(
+            [sorted(simplex.elements) for simplex in simplices], self.hyperedges
+        )
+        self.assertFalse(
+            [warning for warning in caught if "fork" in str(warning.message)]
+        )
+
+    def test_labels_are_interned(self) -> None:
+        """Share one label object per distinct label and count labels by code."""
+        _, simplices = load_benson_hyperedges(self.folder)
+        self.assertIs(simplices[0]["label"], simplices[2]["label"])
+
+        table = load_benson_hyperedge_table(self.folder)
+        self.assertEqual(table.label_categories, ["even", "odd"])
+        self.assertEqual(table.label_counts(), {"even": 100, "odd": 99})
+        self.assertEqual(len(table[table.label_mask("odd")]), 99)
+
+    def test_multilabel_labels_are_lists(self) -> None:
+        """Attach a list of label names to hyperedges with several labels."""
+        _write_lines(
+            self.folder / "hyperedge-labels-toy.txt",
+            ["1,2" if i % 2 else "1" for i in range(len(self.hyperedges))],
+        )
+
+        _, simplices = load_benson_hyperedges(self.folder)
+        table = load_benson_hyperedge_table(self.folder)
+
+        self.assertEqual(simplices[0]["label"], ["even"])
+        self.assertEqual(simplices[1]["label"], ["even", "odd"])
+        self.assertEqual(table.label_counts(), {"even": 199, "odd": 99})
+        self.assertEqual(int(table.label_mask("odd").sum()), 99)
+
+
+if __name__ == "__main__":
+    unittest.main()
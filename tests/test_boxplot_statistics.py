@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import unittest
 
+import numpy as np
+
 from scripts.utils.boxplot import (
+    _compute_boxplot_stats_sorted,
     compute_boxplot_stats,
     compute_boxplot_stats_from_histogram,
 )
@@ -37,6 +40,42 @@ class BoxPlotStatisticsTests(unittest.TestCase):
             compute_boxplot_stats(values),
         )
 
+    def test_array_histograms_match_mappings(self) -> None:
+        """Accept unsorted arrays of values and counts, including zero counts."""
+        rng = np.random.default_rng(0)
+        for size in [1, 2, 5, 50, 500]:
+            values = rng.permutation(size * 3)[:size]
+            counts = rng.integers(0, 4, size=size)
+            counts[0] = 1
+            histogram = dict(zip(values.tolist(), counts.tolist(), strict=True))
+            expected = compute_boxplot_stats(np.repeat(values, counts))
+            with self.subTest(size=size):
+                self.assertEqual(
+                    compute_boxplot_stats_from_histogram(histogram), expected
+                )
+                self.assertEqual(
+                    compute_boxplot_stats_from_histogram((values, counts)), expected
+                )
+
+    def test_histogram_extremes_are_reported_as_given(self) -> None:
+        """Keep float keys of the extremes, but clean the other statistics."""
+        stats = compute_boxplot_stats_from_histogram({5.0: 1, 2.0: 2, 3.5: 1, 9.0: 0})
+        self.assertEqual(
+            stats, {"min": 2, "q1": 2, "median": 2.75, "q3": 4.25, "max": 5}
+        )
+        self.assertIsInstance(stats["min"], float)
+        self.assertIsInstance(stats["max"], float)
+        self.assertIsInstance(stats["q1"], int)
+
+        stats = compute_boxplot_stats_from_histogram({1: 1, 2.5: 1, 4: 1})
+        self.assertEqual(stats, {"min": 1, "q1": 1, "median": 2.5, "q3": 4, "max": 4})
+        self.assertIsInstance(stats["min"], int)
+        self.assertIsInstance(stats["max"], int)
+
+        stats = compute_boxplot_stats_from_histogram((np.array([2.0, 1.0]), [1, 1]))
+        self.assertEqual(stats["min"], 1)
+        self.assertIsInstance(stats["min"], float)
+
     def test_single_value_uses_same_statistic_everywhere(self) -> None:
         """Handle a single observation without empty-half failures."""
         expected = {"min": 7, "q1": 7, "median": 7, "q3": 7, "max": 7}
@@ -44,12 +83,45 @@ class BoxPlotStatisticsTests(unittest.TestCase):
         self.assertEqual(compute_boxplot_stats([7]), expected)
         self.assertEqual(compute_boxplot_stats_from_histogram({7: 1}), expected)
 
+    def test_selection_matches_sorting(self) -> None:
+        """Select the same ranks from lists and arrays as a full sort would."""
+        rng = np.random.default_rng(0)
+        for length in [*range(1, 12), 100, 1001]:
+            values = rng.integers(-5, 50, size=length).tolist()
+            floats = [value / 4 for value in values]
+            expected = _compute_boxplot_stats_sorted(values)
+            with self.subTest(length=length):
+                self.assertEqual(compute_boxplot_stats(values), expected)
+                self.assertEqual(compute_boxplot_stats(iter(values)), expected)
+                self.assertEqual(compute_boxplot_stats(np.array(values)), expected)
+                self.assertEqual(
+                    compute_boxplot_stats((np.array(values) + 5).astype(np.uint8)),
+                    _compute_boxplot_stats_sorted([value + 5 for value in values]),
+                )
+                self.assertEqual(
+                    compute_boxplot_stats(floats),
+                    _compute_boxplot_stats_sorted(floats),
+                )
+
+    def test_large_integers_are_exact(self) -> None:
+        """Keep integers exact that do not fit into 64-bit integers or floats."""
+        for values in [[2**53 + 1, 0.5, 2**53 + 3], [2**64, 1, 2], [2**70 + 1, 3]]:
+            with self.subTest(values=values):
+                self.assertEqual(
+                    compute_boxplot_stats(values), _compute_boxplot_stats_sorted(values)
+                )
+        self.assertEqual(compute_boxplot_stats([2**64, 1, 2])["max"], 2**64)
+
     def test_empty_inputs_are_rejected(self) -> None:
         """Reject summaries with no positive-frequency observations."""
         with self.assertRaisesRegex(ValueError, "no values"):
             compute_boxplot_stats([])
+        with self.assertRaisesRegex(ValueError, "no values"):
+            compute_boxplot_stats(np.array([], dtype=np.int64))
         with self.assertRaisesRegex(ValueError, "no values"):
             compute_boxplot_stats_from_histogram({1: 0})
+        with self.assertRaisesRegex(ValueError, "no values"):
+            compute_boxplot_stats_from_histogram(([], []))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,102 @@
+"""Tests for the persistent parsed-source cache."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from scripts.utils.cache import SourceCache
+from scripts.utils.hyperedge_table import HyperedgeTable
+
+
+class SourceCacheTests(unittest.TestCase):
+    """Exercise cache hits, invalidation and eviction."""
+
+    def setUp(self) -> None:
+        """Create a source file and an empty cache directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.source = self.root / "source.txt"
+        self.source.write_text("1,2\n3\n")
+        self.cache = SourceCache(self.root / "cache")
+        self.parse_calls = 0
+
+    def tearDown(self) -> None:
+        """Remove the temporary files."""
+        self._tmp.cleanup()
+
+    def _parse(self) -> HyperedgeTable:
+        self.parse_calls += 1
+        return HyperedgeTable.from_rows([[1, 2], [3]], labels=["a", "b"])
+
+    def test_hit_memory_maps_columns(self) -> None:
+        """Parse once and memory-map the stored columns afterwards."""
+        self.cache.get_or_parse("toy", [self.source], self._parse)
+        table = self.cache.get_or_parse("toy", [self.source], self._parse)
+
+        self.assertEqual(self.parse_calls, 1)
+        self.assertIsInstance(table.indices.base, np.memmap)
+        self.assertEqual([row.tolist() for row in table], [[1, 2], [3]])
+        self.assertEqual(table.labels, ["a", "b"])
+
+    def test_touched_but_unchanged_source_is_a_hit(self) -> None:
+        """Fall back to the content hash if only the modification time changed."""
+        self.cache.get_or_parse("toy", [self.source], self._parse)
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.cache.get_or_parse("toy", [self.source], self._parse)
+
+        self.assertEqual(self.parse_calls, 1)
+
+    def test_changed_source_invalidates_entry(self) -> None:
+        """Reparse sources whose content changed."""
+        self.cache.get_or_parse("toy", [self.source], self._parse)
+        self.source.write_text("1,2\n4\n")
+
+        self.assertIsNone(self.cache.load("toy", [self.source]))
+        self.assertFalse((self.root / "cache" / "toy").exists())
+
+    def test_changed_parser_invalidates_entry(self) -> None:
+        """Reparse sources whose entry was stored by another parser version."""
+        self.cache.get_or_parse("toy", [self.source], self._parse, parser="1")
+        self.cache.get_or_parse("toy", [self.source], self._parse, parser="1")
+        self.assertEqual(self.parse_calls, 1)
+
+        self.cache.get_or_parse("toy", [self.source], self._parse, parser="2")
+        self.assertEqual(self.parse_calls, 2)
+        self.assertIsNone(self.cache.load("toy", [self.source]))
+
+    def test_corrupted_column_invalidates_entry(self) -> None:
+        """Remove entries whose columns are truncated instead of raising."""
+        self.cache.get_or_parse("toy", [self.source], self._parse)
+        column = self.root / "cache" / "toy" / "indices.npy"
+        column.write_bytes(column.read_bytes()[:-8])
+
+        self.assertIsNone(self.cache.load("toy", [self.source]))
+        self.assertFalse((self.root / "cache" / "toy").exists())
+        table = self.cache.get_or_parse("toy", [self.source], self._parse)
+        self.assertEqual(self.parse_calls, 2)
+        self.assertEqual([row.tolist() for row in table], [[1, 2], [3]])
+
+    def test_eviction_keeps_cache_below_cap(self) -> None:
+        """Evict the least recently used entries once the size cap is exceeded."""
+        self.cache.get_or_parse("first", [self.source], self._parse)
+        entry_size = sum(
+            file.stat().st_size for file in (self.root / "cache" / "first").iterdir()
+        )
+        self.cache.max_size = entry_size
+        os.utime(self.root / "cache" / "first" / "manifest.json", ns=(0, 0))
+
+        self.cache.get_or_parse("second", [self.source], self._parse)
+
+        self.assertFalse((self.root / "cache" / "first").exists())
+        self.assertTrue((self.root / "cache" / "second").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for the columnar companion files."""
+
+from __future__ import annotations
+
+import io
+import tempfile
+import unittest
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+from scripts.utils.columnar import ColumnarDataset, load_columns
+from scripts.utils.hyperedge_table import HyperedgeTable
+from scripts.utils.write import DatasetWriter
+
+
+class ColumnarDatasetTests(unittest.TestCase):
+    """Collect nodes, edges and attributes as columns while writing."""
+
+    def setUp(self) -> None:
+        """Create a temporary output directory and write a small dataset."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "dataset.columns.npz"
+
+        self.columns = ColumnarDataset()
+        with DatasetWriter(io.StringIO(), columns=self.columns) as writer:
+            writer.write_node(1, name="a", weight=2)
+            writer.write_node(2, name="b", weight=0.5, active=True)
+            writer.write_edge([1, 2], time=datetime(2020, 1, 2, tzinfo=UTC))
+            writer.write_edges(
+                HyperedgeTable.from_rows([[2, 3], [3, 1, 4]], labels=["x", ("x", "y")]),
+                label_key="group",
+                kind="table",
+            )
+
+    def tearDown(self) -> None:
+        """Remove the temporary files."""
+        self._tmp.cleanup()
+
+    def test_incidence_columns(self) -> None:
+        """Store the nodes in order of appearance and the edges in CSR form."""
+        arrays = self.columns.arrays()
+
+        np.testing.assert_array_equal(arrays["node-ids"], [1, 2, 3, 4])
+        np.testing.assert_array_equal(arrays["edge-offsets"], [0, 2, 4, 7])
+        np.testing.assert_array_equal(arrays["edge-indices"], [0, 1, 1, 2, 2, 0, 3])
+
+    def test_typed_attribute_columns(self) -> None:
+        """Store attributes with their types, masks and categories."""
+        arrays = self.columns.arrays()
+
+        np.testing.assert_array_equal(arrays["node/name/codes"], [0, 1, -1, -1])
+        np.testing.assert_array_equal(arrays["node/name/categories"], ["a", "b"])
+        self.assertEqual(arrays["node/weight"].dtype, np.float64)
+        np.testing.assert_array_equal(arrays["node/weight/valid"], [1, 1, 0, 0])
+        self.assertEqual(arrays["node/active"].dtype, np.bool_)
+        self.assertEqual(arrays["edge/time"][0], np.datetime64("2020-01-02T00:00"))
+        self.assertTrue(np.isnat(arrays["edge/time"][1]))
+        np.testing.assert_array_equal(arrays["edge/kind/codes"], [-1, 0, 0])
+        np.testing.assert_array_equal(
+            arrays["edge/group/categories"], ['"x"', '["x", "y"]']
+        )
+
+    def test_large_integers_are_stored_exactly(self) -> None:
+        """Encode integers beyond 64 bits as JSON instead of rounding them."""
+        columns = ColumnarDataset()
+        with DatasetWriter(io.StringIO(), columns=columns) as writer:
+            writer.write_node(1, count=2**70, size=2**70)
+            writer.write_node(2, count=1, size=0.5)
+            writer.write_node(3, count=2**63 - 1)
+        arrays = columns.arrays()
+
+        np.testing.assert_array_equal(arrays["node/count/codes"], [0, 1, 2])
+        np.testing.assert_array_equal(
+            arrays["node/count/categories"], [str(2**70), "1", str(2**63 - 1)]
+        )
+        np.testing.assert_array_equal(arrays["node/size/codes"], [0, 1, -1])
+        np.testing.assert_array_equal(
+            arrays["node/size/categories"], [str(2**70), "0.5"]
+        )
+
+    def test_file_can_be_loaded_and_memory_mapped(self) -> None:
+        """Write a reproducible archive that loads with and without memory maps."""
+        self.columns.write(self.path)
+        first = self.path.read_bytes()
+        self.columns.write(self.path)
+        self.assertEqual(self.path.read_bytes(), first)
+
+        expected = self.columns.arrays()
+        for mmap in [False, True]:
+            loaded = load_columns(self.path, mmap=mmap)
+            self.assertEqual(loaded.keys(), expected.keys())
+            for name, values in expected.items():
+                np.testing.assert_array_equal(loaded[name], values)
+        self.assertIsInstance(load_columns(self.path)["edge-indices"], np.memmap)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for the compressed file utilities."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.utils.compression import open_gzip, open_source
+
+
+class ParallelGzipTests(unittest.TestCase):
+    """Exercise the block-parallel gzip writer."""
+
+    def setUp(self) -> None:
+        """Create a temporary output directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "dataset.txt.gz"
+
+    def tearDown(self) -> None:
+        """Remove the temporary files."""
+        self._tmp.cleanup()
+
+    def test_multi_member_output_round_trips(self) -> None:
+        """Write several members that decompress to the written text in order."""
+        lines = [f"{i},{i + 1} {{}}\n" for i in range(5_000)]
+        with open_gzip(self.path, "wt", block_size=4096, workers=3) as file:
+            for line in lines:
+                file.write(line)
+
+        data = self.path.read_bytes()
+        self.assertGreater(data.count(b"\x1f\x8b\x08"), 10)
+        with gzip.open(self.path, "rt") as file:
+            self.assertEqual(file.read(), "".join(lines))
+        with open_source(self.path) as file:
+            self.assertEqual(file.readlines(), lines)
+
+    def test_empty_file_is_a_valid_gzip_file(self) -> None:
+        """Write one empty member if nothing was written."""
+        with open_gzip(self.path, "wb"):
+            pass
+
+        self.assertEqual(gzip.decompress(self.path.read_bytes()), b"")
+        self.assertGreater(self.path.stat().st_size, 0)
+
+    def test_output_is_reproducible(self) -> None:
+        """Write gzip members without a file name and modification time."""
+        with open_gzip(self.path, manifest=False) as file:
+            file.write("1,2 {}\n")
+        first = self.path.read_bytes()
+        with open_gzip(self.path, manifest=False) as file:
+            file.write("1,2 {}\n")
+
+        self.assertEqual(self.path.read_bytes(), first)
+        self.assertEqual(first[3], 0)  # no FNAME flag
+        self.assertEqual(first[4:8], b"\x00\x00\x00\x00")  # zero MTIME
+
+    def test_unchanged_content_is_not_replaced(self) -> None:
+        """Keep an artifact whose content hash matches the manifest."""
+        with open_gzip(self.path) as file:
+            file.write("1,2 {}\n")
+        os.utime(self.path, ns=(0, 0))
+
+        with open_gzip(self.path) as file:
+            file.write("1,2 {}\n")
+        self.assertEqual(self.path.stat().st_mtime_ns, 0)
+
+        with open_gzip(self.path) as file:
+            file.write("1,3 {}\n")
+        self.assertNotEqual(self.path.stat().st_mtime_ns, 0)
+
+        manifest = json.loads((self.path.parent / "manifest.json").read_text())
+        entry = manifest["artifacts"][self.path.name]
+        self.assertEqual(entry["size"], 7)
+        self.assertEqual(entry["compressed-size"], self.path.stat().st_size)
+        self.assertFalse(any(self.path.parent.glob("*.tmp")))
+
+    def test_failed_write_keeps_the_previous_artifact(self) -> None:
+        """Discard the output if the ``with`` block raises."""
+        with open_gzip(self.path) as file:
+            file.write("1,2 {}\n")
+
+        with self.assertRaises(RuntimeError), open_gzip(self.path) as file:
+            file.write("partial")
+            raise RuntimeError
+
+        with gzip.open(self.path, "rt") as file:
+            self.assertEqual(file.read(), "1,2 {}\n")
+        self.assertEqual(
+            sorted(path.name for path in self.path.parent.iterdir()),
+            ["dataset.txt.gz", "manifest.json", "manifest.json.lock"],
+        )
+
+    def test_read_modes_are_rejected(self) -> None:
+        """Reject modes other than writing."""
+        with self.assertRaises(ValueError):
+            open_gzip(self.path, "rt")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Tests for the dataset statistics accumulator."""
+
+from __future__ import annotations
+
+import io
+import unittest
+
+from scripts.utils.dataset_statistics import StatisticsAccumulator
+from scripts.utils.hyperedge_table import HyperedgeTable
+from scripts.utils.write import DatasetWriter
+
+
+class StatisticsAccumulatorTests(unittest.TestCase):
+    """Collect the datasheet statistics while writing a dataset."""
+
+    def setUp(self) -> None:
+        """Create labeled nodes and hyperedges."""
+        self.nodes = [1, 2, 3, 4, 5, 6]
+        self.node_labels = ["a", "b", "a", ["a", "c"], "b", "c"]
+        self.rows = [[1, 2], [2, 3, 4], [5], [1, 4], [2, 5]]
+        self.labels = ["x", "y", "x", "z", "x"]
+        self.expected = {
+            "num-nodes": 6,
+            "num-interactions": 5,
+            "node-degrees": {1: 1, 2: 3, 3: 1},
+            "edge-degrees": {1: 1, 2: 3, 3: 1},
+        }
+
+    def test_single_lines_are_recorded(self) -> None:
+        """Record nodes and edges written one at a time."""
+        statistics = StatisticsAccumulator(
+            node_label_key="kind", edge_label_key="group"
+        )
+        with DatasetWriter(io.StringIO(), statistics=statistics) as writer:
+            for node, label in zip(self.nodes, self.node_labels, strict=True):
+                writer.write_node(node, kind=label)
+            for row, label in zip(self.rows, self.labels, strict=True):
+                writer.write_edge(iter(row), group=label)
+
+        self.assertEqual(statistics.statistics(), self.expected)
+        self.assertEqual(dict(statistics.node_label_counts), {"a": 3, "b": 2, "c": 2})
+        self.assertEqual(dict(statistics.edge_label_counts), {"x": 3, "y": 1, "z": 1})
+        self.assertIn(5, statistics)
+        self.assertNotIn(6, statistics)
+
+    def test_batches_and_tables_are_recorded(self) -> None:
+        """Record batches of nodes, edge iterables and hyperedge tables alike."""
+        statistics = StatisticsAccumulator(edge_label_key="group")
+        with DatasetWriter(io.StringIO(), statistics=statistics) as writer:
+            writer.write_nodes(self.nodes[-1:])
+            writer.write_edges(self.rows[:2], ({"group": g} for g in self.labels[:2]))
+            writer.write_edges(
+                HyperedgeTable.from_rows(self.rows[2:], labels=self.labels[2:]),
+                label_key="group",
+            )
+
+        self.assertEqual(statistics.statistics(), self.expected)
+        self.assertEqual(dict(statistics.edge_label_counts), {"x": 3, "y": 1, "z": 1})
+
+    def test_tables_count_labels_like_single_edges(self) -> None:
+        """Count the labels of tables from the same attributes as single edges."""
+        labels = ["x", ("y", "z"), "x", None, "z"]
+        groups = [{"group": "u"}, {}, {"group": None}, {"kind": "v"}, {"group": "u"}]
+        for label_key, attributes, kwargs in (
+            ("group", None, {}),
+            ("group", groups, {"group": "w"}),
+            ("kind", groups, {}),
+            ("kind", groups, {"group": "w"}),
+            ("kind", None, {"group": ["w", "x"]}),
+            (None, None, {"group": "w"}),
+        ):
+            table = HyperedgeTable.from_rows(self.rows, labels=labels)
+            files, statistics = [], []
+            for write_table in (True, False):
+                files.append(io.StringIO())
+                statistics.append(StatisticsAccumulator(edge_label_key="group"))
+                with DatasetWriter(files[-1], statistics=statistics[-1]) as writer:
+                    if write_table:
+                        writer.write_edges(
+                            table, attributes, label_key=label_key, **kwargs
+                        )
+                        continue
+                    for i, row in enumerate(self.rows):
+                        merged = {**kwargs, **(attributes[i] if attributes else {})}
+                        if label_key is not None:
+                            merged = {**merged, label_key: labels[i]}
+                        writer.write_edge(row, **merged)
+
+            with self.subTest(label_key=label_key, attributes=attributes, **kwargs):
+                self.assertEqual(files[0].getvalue(), files[1].getvalue())
+                self.assertEqual(statistics[0].statistics(), statistics[1].statistics())
+                self.assertEqual(
+                    list(statistics[0].edge_label_counts.items()),
+                    list(statistics[1].edge_label_counts.items()),
+                )
+
+    def test_output_is_unchanged(self) -> None:
+        """Write the same lines with and without an accumulator."""
+        expected, actual = io.StringIO(), io.StringIO()
+        for file, statistics in [(expected, None), (actual, StatisticsAccumulator())]:
+            with DatasetWriter(file, statistics=statistics) as writer:
+                writer.write_nodes(self.nodes, kind="a")
+                writer.write_edges(iter(map(iter, self.rows)))
+
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for the mergeable integer histograms."""
+
+from __future__ import annotations
+
+import unittest
+import unittest.mock
+from collections import Counter
+
+import numpy as np
+
+from scripts.utils import histogram as histogram_module
+from scripts.utils.boxplot import compute_boxplot_stats_from_histogram
+from scripts.utils.histogram import Histogram
+
+
+class HistogramTests(unittest.TestCase):
+    """Count node degrees and edge sizes in shards and merge them."""
+
+    def setUp(self) -> None:
+        """Create random edges."""
+        rng = np.random.default_rng(0)
+        self.edges = [
+            tuple(rng.choice(50, size=rng.integers(1, 6), replace=False).tolist())
+            for _ in range(1_000)
+        ]
+        node_degrees = Counter(node for edge in self.edges for node in edge)
+        self.node_degree_histogram = dict(
+            sorted(Counter(node_degrees.values()).items())
+        )
+        self.edge_degree_histogram = dict(
+            sorted(Counter(len(edge) for edge in self.edges).items())
+        )
+
+    def _count(self, edges: list[tuple[int, ...]]) -> tuple[Histogram, Histogram]:
+        node_degrees, edge_degrees = Histogram(), Histogram()
+        for edge in edges:
+            node_degrees.update(edge)
+            edge_degrees.add(len(edge))
+        return node_degrees, edge_degrees
+
+    def test_counts_match_counters(self) -> None:
+        """Serialize to the same frontmatter histograms as counters."""
+        node_degrees, edge_degrees = self._count(self.edges)
+
+        self.assertEqual(
+            node_degrees.count_histogram().to_dict(), self.node_degree_histogram
+        )
+        self.assertEqual(edge_degrees.to_dict(), self.edge_degree_histogram)
+        self.assertEqual(edge_degrees.total, len(self.edges))
+        self.assertEqual(
+            compute_boxplot_stats_from_histogram(edge_degrees),
+            compute_boxplot_stats_from_histogram(self.edge_degree_histogram),
+        )
+
+    def test_merged_shards_match_a_single_pass(self) -> None:
+        """Merge partial histograms in any grouping and order."""
+        first, second, third = [self._count(self.edges[start::3]) for start in range(3)]
+
+        left = first[1].merge(second[1]).merge(third[1])
+        right = third[1].merge(first[1].merge(second[1]))
+        self.assertEqual(left.to_dict(), self.edge_degree_histogram)
+        self.assertEqual(right.to_dict(), self.edge_degree_histogram)
+
+        node_degrees = Histogram().merge(first[0], second[0], third[0])
+        self.assertEqual(
+            node_degrees.count_histogram().to_dict(), self.node_degree_histogram
+        )
+        self.assertEqual(first[1].total, len(self.edges[::3]))
+
+    def test_buffered_arrays_and_weighted_values(self) -> None:
+        """Fold buffered values, arrays and weighted values together."""
+        histogram = Histogram.from_dict({3: 2, 1: 1})
+        histogram.add(3, count=-2)
+        histogram.add(2, count=4)
+        histogram.update(np.array([[1, 5], [5, 5]]))
+        histogram.update([7, 7], counts=[1, 2])
+        with unittest.mock.patch.object(histogram_module, "_BUFFER_SIZE", 2):
+            histogram.update(iter([1, 9]))
+            histogram.add(9)
+
+        self.assertEqual(histogram.to_dict(), {1: 3, 2: 4, 5: 3, 7: 3, 9: 2})
+        self.assertEqual(len(histogram), 5)
+        with self.assertRaises(ValueError):
+            histogram.update([1, 2], counts=[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
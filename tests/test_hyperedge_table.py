@@ -0,0 +1,113 @@
+"""Tests for the array-backed hyperedge table."""
+
+from __future__ import annotations
+
+import io
+import unittest
+
+import numpy as np
+
+from scripts.utils.hyperedge_table import HyperedgeTable
+from scripts.utils.write import write_edge, write_edges
+
+
+class HyperedgeTableTests(unittest.TestCase):
+    """Exercise construction, views, filtering and statistics of tables."""
+
+    def setUp(self) -> None:
+        """Create a small labelled and timed table."""
+        self.table = HyperedgeTable.from_rows(
+            [[1, 2], [2, 3, 4], [5], [1, 4]],
+            labels=["x", "y", "x", "z"],
+            times=[10, 20, 30, 40],
+        )
+
+    def test_compact_storage(self) -> None:
+        """Store small tables with 32-bit offsets, indices and label codes."""
+        self.assertEqual(self.table.offsets.dtype, np.int32)
+        self.assertEqual(self.table.indices.dtype, np.int32)
+        self.assertEqual(self.table.label_codes.tolist(), [0, 1, 0, 2])
+        self.assertEqual(self.table.label_categories, ["x", "y", "z"])
+        self.assertEqual(self.table.times.dtype, np.int64)
+
+    def test_rows_are_views(self) -> None:
+        """Return rows as views into the flat index array."""
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(
+            [row.tolist() for row in self.table], [[1, 2], [2, 3, 4], [5], [1, 4]]
+        )
+        self.assertTrue(np.shares_memory(self.table[1], self.table.indices))
+        self.assertEqual(self.table[-1].tolist(), [1, 4])
+        with self.assertRaises(IndexError):
+            self.table[4]
+
+    def test_boolean_mask_filtering(self) -> None:
+        """Select rows together with their labels and times."""
+        filtered = self.table[self.table.sizes > 1]
+
+        self.assertEqual(
+            [row.tolist() for row in filtered], [[1, 2], [2, 3, 4], [1, 4]]
+        )
+        self.assertEqual(filtered.labels, ["x", "y", "z"])
+        self.assertEqual(filtered.times.tolist(), [10, 20, 40])
+
+    def test_label_counts_and_masks(self) -> None:
+        """Count and select labels on the categorical codes."""
+        self.assertEqual(self.table.label_counts(), {"x": 2, "y": 1, "z": 1})
+        self.assertEqual(
+            self.table.label_mask("x").tolist(), [True, False, True, False]
+        )
+        self.assertFalse(self.table.label_mask("missing").any())
+
+    def test_degree_histograms(self) -> None:
+        """Count node and edge degrees in the statistics frontmatter format."""
+        self.assertEqual(self.table.node_degree_histogram(), {1: 2, 2: 3})
+        self.assertEqual(self.table.edge_degree_histogram(), {1: 1, 2: 2, 3: 1})
+        self.assertEqual(self.table.participating_nodes().tolist(), [1, 2, 3, 4, 5])
+
+    def test_write_edges_matches_write_edge(self) -> None:
+        """Write tables in exactly the same format as individual edges."""
+        expected = io.StringIO()
+        for row, label in zip(
+            [[1, 2], [2, 3, 4], [5], [1, 4]], ["x", "y", "x", "z"], strict=True
+        ):
+            write_edge(expected, row, label=label)
+
+        actual = io.StringIO()
+        write_edges(actual, self.table, label_key="label")
+
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def test_deduplicate_reports_affected_rows(self) -> None:
+        """Drop repeated nodes per row and summarize the affected rows once."""
+        table = HyperedgeTable.from_rows(
+            [[3, 1, 3], [1, 2], [4, 4, 5, 4], [], [6, 6]], times=[1, 2, 3, 4, 5]
+        )
+
+        deduplicated, report = table.deduplicate()
+
+        self.assertEqual(
+            [row.tolist() for row in deduplicated], [[3, 1], [1, 2], [4, 5], [], [6]]
+        )
+        self.assertEqual(deduplicated.times.tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(report.num_edges, 3)
+        self.assertEqual(report.by_size, {2: 1, 3: 1, 4: 1})
+        self.assertEqual(report.samples, [(0, [3]), (2, [4]), (4, [6])])
+
+    def test_deduplicate_without_duplicates_is_a_no_op(self) -> None:
+        """Return the same table and an empty report if no row repeats a node."""
+        deduplicated, report = self.table.deduplicate()
+
+        self.assertIs(deduplicated, self.table)
+        self.assertFalse(report)
+
+    def test_inconsistent_columns_are_rejected(self) -> None:
+        """Reject offsets and columns that do not describe the same rows."""
+        with self.assertRaises(ValueError):
+            HyperedgeTable([0, 2, 3], [1, 2])
+        with self.assertRaises(ValueError):
+            HyperedgeTable([0, 2], [1, 2], times=[1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for the multi-network seek index."""
+
+from __future__ import annotations
+
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.utils.compression import open_gzip
+from scripts.utils.network_index import (
+    NetworkIndex,
+    index_path_for,
+    read_index,
+    read_network,
+)
+from scripts.utils.write import write_edge, write_network_metadata
+
+
+class NetworkIndexTests(unittest.TestCase):
+    """Write indexed multi-network files and read single networks back."""
+
+    def setUp(self) -> None:
+        """Create a temporary output directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "networks.txt.gz"
+
+    def tearDown(self) -> None:
+        """Remove the temporary files."""
+        self._tmp.cleanup()
+
+    def _write(self, networks_per_member: int, block_size: int) -> list[list[str]]:
+        """Write networks of varying size and return the expected lines of each."""
+        index = NetworkIndex(networks_per_member=networks_per_member)
+        expected: list[list[str]] = []
+        with open_gzip(self.path, block_size=block_size, manifest=False) as file:
+            file.write('{"name": "networks"}\n')
+            for network in range(25):
+                index.start_network(file, f"n{network}")
+                write_network_metadata(file, id=f"n{network}")
+                for i in range(network % 7):
+                    write_edge(file, [i, i + 1], network=network)
+                expected.append(
+                    [f'{{"id": "n{network}"}}\n']
+                    + [
+                        f'{i},{i + 1} {{"network": {network}}}\n'
+                        for i in range(network % 7)
+                    ]
+                )
+        index.write(index_path_for(self.path), file)
+        return expected
+
+    def test_networks_can_be_read_individually(self) -> None:
+        """Read each network from its member, for several group and block sizes."""
+        for networks_per_member, block_size in [(1, 1 << 20), (4, 1 << 20), (3, 64)]:
+            with self.subTest(networks_per_member=networks_per_member):
+                expected = self._write(networks_per_member, block_size)
+                index = read_index(index_path_for(self.path))
+
+                self.assertEqual(len(index), 25)
+                for network, lines in enumerate(expected):
+                    self.assertEqual(
+                        read_network(self.path, f"n{network}", index), lines
+                    )
+                with gzip.open(self.path, "rt") as file:
+                    self.assertEqual(
+                        file.readlines()[1:],
+                        [line for lines in expected for line in lines],
+                    )
+
+    def test_members_start_at_groups(self) -> None:
+        """Start one gzip member per group of networks."""
+        self._write(networks_per_member=5, block_size=1 << 20)
+        offsets = [
+            entry["offset"] for entry in read_index(index_path_for(self.path)).values()
+        ]
+
+        self.assertEqual(len(set(offsets)), 5)
+        self.assertEqual(offsets[:6], [offsets[0]] * 5 + [offsets[5]])
+        self.assertGreater(offsets[0], 0)
+        data = self.path.read_bytes()
+        for offset in set(offsets):
+            self.assertEqual(data[offset : offset + 3], b"\x1f\x8b\x08")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for the partitioned dataset writing utilities."""
+
+from __future__ import annotations
+
+import io
+import tempfile
+import unittest
+import unittest.mock
+
+from scripts.utils.partition import DatasetPartitions
+from scripts.utils.write import write_edge, write_node
+
+
+class DatasetPartitionTests(unittest.TestCase):
+    """Compare partitions with datasets written from filtered edges."""
+
+    def setUp(self) -> None:
+        """Create labeled hyperedges."""
+        self.rows = [[1, 2], [2, 3, 4], [5], [1, 4], [2, 5]]
+        self.labels = ["x", "y", "x", "z", "x"]
+
+    def test_partitions_match_filtered_datasets(self) -> None:
+        """Write the nodes and then the edges of each label, in first-seen order."""
+        with DatasetPartitions(chunk_size=8) as partitions:
+            for row, label in zip(self.rows, self.labels, strict=True):
+                partitions[label].write_edge(row, weight=1)
+
+            self.assertEqual(list(partitions), ["x", "y", "z"])
+            self.assertEqual(partitions.edge_counts(), {"x": 3, "y": 1, "z": 1})
+
+            for label, partition in partitions.items():
+                rows = [
+                    row
+                    for row, other in zip(self.rows, self.labels, strict=True)
+                    if other == label
+                ]
+                nodes = sorted({node for row in rows for node in row})
+                expected = io.StringIO()
+                for node in nodes:
+                    write_node(expected, node, label=label)
+                for row in rows:
+                    write_edge(expected, row, weight=1)
+
+                actual = io.StringIO()
+                partition.write_to(actual, nodes, ({"label": label} for _ in nodes))
+                self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def test_statistics_are_collected_per_partition(self) -> None:
+        """Count node degrees and edge sizes of the edges in each partition."""
+        with DatasetPartitions() as partitions:
+            for row, label in zip(self.rows, self.labels, strict=True):
+                partitions[label].write_edge(row)
+
+            partition = partitions["x"]
+            self.assertEqual(list(partition.participating_nodes), [1, 2, 5])
+            self.assertIn(5, partition)
+            self.assertNotIn(3, partition)
+            self.assertEqual(partition.statistics.node_degree_histogram(), {1: 1, 2: 2})
+            self.assertEqual(partition.statistics.edge_degree_histogram(), {1: 1, 2: 2})
+
+    def test_partitions_share_one_spool_file(self) -> None:
+        """Keep one temporary file open, however many labels there are."""
+        with (
+            unittest.mock.patch.object(
+                tempfile, "TemporaryFile", wraps=tempfile.TemporaryFile
+            ) as temporary_file,
+            DatasetPartitions(chunk_size=1) as partitions,
+        ):
+            for label in range(1_000):
+                partitions[label].write_edge([label, label + 1])
+            partitions[0].write_edge([0, 2])
+
+            self.assertEqual(temporary_file.call_count, 1)
+            actual = io.StringIO()
+            partitions[0].write_to(actual)
+            expected = io.StringIO()
+            write_edge(expected, [0, 1])
+            write_edge(expected, [0, 2])
+            self.assertEqual(actual.getvalue(), expected.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for the mergeable quantile sketches."""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from scripts.utils.boxplot import (
+    approximate_boxplot_stats,
+    compute_boxplot_stats,
+    compute_boxplot_stats_from_sketch,
+)
+from scripts.utils.quantile_sketch import QuantileSketch
+
+
+class QuantileSketchTests(unittest.TestCase):
+    """Estimate box-plot statistics of skewed degrees within the rank error."""
+
+    def setUp(self) -> None:
+        """Create heavy-tailed degrees."""
+        rng = np.random.default_rng(0)
+        self.values = rng.zipf(1.8, size=200_000) + rng.random(200_000)
+        self.sorted_values = np.sort(self.values)
+
+    def assertWithinRankError(self, sketch: QuantileSketch, ranks: np.ndarray) -> None:
+        """Check that the value at each rank has a true rank near it."""
+        tolerance = sketch.rank_error * len(self.values)
+        for rank, value in zip(ranks, sketch.values_at_ranks(ranks), strict=True):
+            lowest = np.searchsorted(self.sorted_values, value, side="left")
+            highest = np.searchsorted(self.sorted_values, value, side="right") - 1
+            self.assertLessEqual(max(lowest - rank, rank - highest, 0), tolerance)
+
+    def test_ranks_within_error_bound(self) -> None:
+        """Locate ranks approximately in little memory, with exact extremes."""
+        sketch = QuantileSketch(rank_error=0.01)
+        sketch.update(self.values[:100_000])
+        for value in self.values[100_000:].tolist():
+            sketch.add(value)
+
+        self.assertEqual(sketch.total, len(self.values))
+        self.assertLess(len(sketch), 5 * sketch.k)
+        self.assertLessEqual(sketch.rank_error, 0.01)
+        self.assertWithinRankError(sketch, np.linspace(0, len(self.values) - 1, 101))
+
+        exact = compute_boxplot_stats(self.values)
+        approximate = compute_boxplot_stats_from_sketch(sketch)
+        self.assertEqual(approximate.keys(), exact.keys())
+        self.assertEqual(approximate["min"], exact["min"])
+        self.assertEqual(approximate["max"], exact["max"])
+
+    def test_merged_shards(self) -> None:
+        """Merge sketches of shards in any grouping within the error bound."""
+        shards = [QuantileSketch(rank_error=0.02, seed=seed) for seed in range(4)]
+        for index, shard in enumerate(shards):
+            shard.update(self.values[index::4])
+
+        left = shards[0].merge(shards[1]).merge(shards[2].merge(shards[3]))
+        right = QuantileSketch(rank_error=0.02).merge(*reversed(shards))
+        ranks = np.linspace(0, len(self.values) - 1, 51)
+        for merged in (left, right):
+            self.assertEqual(merged.total, len(self.values))
+            self.assertEqual(merged.min, compute_boxplot_stats(self.values)["min"])
+            self.assertWithinRankError(merged, ranks)
+        self.assertEqual(shards[0].total, len(self.values[::4]))
+
+    def test_reproducible_frontmatter(self) -> None:
+        """Record identical approximate statistics with their error bound."""
+        stats = []
+        for _ in range(2):
+            sketch = QuantileSketch(rank_error=0.05)
+            sketch.update(self.values.astype(np.int64).tolist())
+            stats.append(approximate_boxplot_stats(sketch))
+
+        self.assertEqual(stats[0], stats[1])
+        self.assertIs(stats[0]["approximate"], True)
+        self.assertLessEqual(stats[0]["rank-error"], 0.05)
+        self.assertIsInstance(stats[0]["min"], int)
+
+    def test_large_integers_are_rounded(self) -> None:
+        """Round integers beyond 2**53 to floats, as documented."""
+        sketch = QuantileSketch()
+        sketch.update([1, 2**53 + 1])
+        self.assertEqual(sketch.max, 2**53)
+        self.assertIsInstance(sketch.max, int)
+
+    def test_small_and_empty_sketches(self) -> None:
+        """Summarize few values exactly, and reject no values and invalid bounds."""
+        sketch = QuantileSketch()
+        sketch.update([1, 2, 3, 4, 5])
+        self.assertEqual(
+            compute_boxplot_stats_from_sketch(sketch),
+            compute_boxplot_stats(range(1, 6)),
+        )
+        with self.assertRaises(ValueError):
+            sketch.values_at_ranks([5])
+        with self.assertRaises(ValueError):
+            compute_boxplot_stats_from_sketch(QuantileSketch())
+        with self.assertRaises(ValueError):
+            QuantileSketch(rank_error=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
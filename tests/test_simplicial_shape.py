@@ -0,0 +1,58 @@
+"""Tests for the simplicial-complex shape calculations."""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from scripts.utils.simplicial_shape import (
+    _maximal_facets,
+    compute_simplicial_closure_shape,
+)
+
+
+def _maximal_facets_pairwise(facets: list[frozenset[int]]) -> list[frozenset[int]]:
+    """Find the maximal facets by comparing each facet with all larger ones."""
+    maximal: list[frozenset[int]] = []
+    for facet in sorted(
+        set(facets), key=lambda facet: (len(facet), tuple(sorted(facet))), reverse=True
+    ):
+        if facet and not any(facet <= existing for existing in maximal):
+            maximal.append(facet)
+    return maximal
+
+
+class SimplicialShapeTests(unittest.TestCase):
+    """Find maximal facets and count the simplices of their closure."""
+
+    def test_maximal_facets_match_pairwise_comparison(self) -> None:
+        """Find the same maximal facets, in the same order, as pairwise checks."""
+        rng = np.random.default_rng(0)
+        for num_vertices in (6, 30, 200):
+            facets = [
+                frozenset(
+                    rng.choice(
+                        num_vertices, size=rng.integers(0, 7), replace=False
+                    ).tolist()
+                )
+                for _ in range(2_000)
+            ]
+            with self.subTest(num_vertices=num_vertices):
+                self.assertEqual(
+                    _maximal_facets(facets), _maximal_facets_pairwise(facets)
+                )
+
+    def test_closure_shape(self) -> None:
+        """Count the simplices of a tetrahedron glued to a triangle along an edge."""
+        shape = compute_simplicial_closure_shape(
+            [[1, 2, 3, 4], [1, 2], [3, 4, 5], [4, 5], [2, 3, 4], []], num_vertices=6
+        )
+        self.assertEqual(shape.active_vertices, 5)
+        self.assertEqual(shape.maximal_simplices, 2)
+        self.assertEqual(shape.shape, ["6", "8", "5", "1"])
+        self.assertEqual(shape.total_simplices, "20")
+
+
+if __name__ == "__main__":
+    unittest.main()
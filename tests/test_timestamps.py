@@ -0,0 +1,66 @@
+"""Tests for the bulk timestamp conversion utilities."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import UTC, date, datetime, timedelta
+
+import numpy as np
+
+from scripts.utils.timestamps import format_dates, format_timestamps
+
+
+class TimestampTests(unittest.TestCase):
+    """Compare the vectorized conversion with `datetime` arithmetic."""
+
+    def setUp(self) -> None:
+        """Create .NET millisecond and Unix second timestamps with repetitions."""
+        rng = np.random.default_rng(0)
+        self.dotnet_ms = [
+            *rng.integers(0, 64_000_000_000_000, size=1_000).tolist(),
+            62_135_596_800_000,
+            63_400_000_000_123,
+            63_400_000_000_123,
+            0,
+        ]
+        self.unix_s = [*rng.integers(-(10**9), 2 * 10**9, size=1_000).tolist(), 0, 0]
+
+    def test_dotnet_milliseconds_match_isoformat(self) -> None:
+        """Format .NET millisecond timestamps exactly like `datetime.isoformat`."""
+        expected = [
+            (datetime(1, 1, 1, tzinfo=UTC) + timedelta(milliseconds=ms)).isoformat()
+            for ms in self.dotnet_ms
+        ]
+
+        actual = format_timestamps(self.dotnet_ms, epoch="dotnet", unit="ms")
+
+        self.assertEqual(actual, expected)
+        self.assertIs(actual[-2], actual[-3])
+
+    def test_unix_seconds_match_isoformat(self) -> None:
+        """Format Unix second timestamps exactly like `datetime.isoformat`."""
+        expected = [
+            datetime.fromtimestamp(seconds, tz=UTC).isoformat()
+            for seconds in self.unix_s
+        ]
+
+        self.assertEqual(format_timestamps(np.asarray(self.unix_s)), expected)
+
+    def test_dates_match_date_arithmetic(self) -> None:
+        """Format the day of each .NET millisecond timestamp like `str(date)`."""
+        expected = [
+            str(date(1, 1, 1) + timedelta(milliseconds=ms)) for ms in self.dotnet_ms
+        ]
+
+        self.assertEqual(
+            format_dates(self.dotnet_ms, epoch="dotnet", unit="ms"), expected
+        )
+
+    def test_unsupported_epoch_is_rejected(self) -> None:
+        """Reject epochs other than Unix and .NET."""
+        with self.assertRaises(ValueError):
+            format_timestamps([0], epoch="excel")  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Tests for the dataset writing utilities."""
+
+from __future__ import annotations
+
+import io
+import unittest
+from datetime import UTC, datetime
+
+import numpy as np
+
+from scripts.utils.hyperedge_table import HyperedgeTable
+from scripts.utils.write import DatasetWriter, write_edge, write_node
+
+
+class _CountingFile(io.StringIO):
+    """String buffer that counts calls to ``write``."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.num_writes = 0
+
+    def write(self, s: str) -> int:
+        self.num_writes += 1
+        return super().write(s)
+
+
+class DatasetWriterTests(unittest.TestCase):
+    """Compare the buffered writer with the line-by-line functions."""
+
+    def setUp(self) -> None:
+        """Create edges with per-edge and shared attributes."""
+        self.rows = [[1, 2], [2, 3, 4], [5], [1, 4]]
+        self.labels = ["x", "y", "x", "z"]
+        self.time = datetime(2020, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+    def test_single_lines_match_write_functions(self) -> None:
+        """Write the same bytes as `write_node` and `write_edge`."""
+        expected = io.StringIO()
+        write_node(expected, 1, name="a", time=self.time)
+        write_edge(expected, [1, 2], weight=0.5, time=self.time)
+
+        actual = io.StringIO()
+        with DatasetWriter(actual) as writer:
+            writer.write_node(1, name="a", time=self.time)
+            writer.write_edge([1, 2], weight=0.5, time=self.time)
+
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def test_batches_match_write_functions(self) -> None:
+        """Write batches from iterables, arrays and tables like single lines."""
+        expected = io.StringIO()
+        for node in [1, 2, 3]:
+            write_node(expected, node, kind="a")
+        for row, label in zip(self.rows, self.labels, strict=True):
+            write_edge(expected, row, time=self.time, label=label)
+        for row, label in zip(self.rows, self.labels, strict=True):
+            write_edge(expected, row, time=self.time, label=label)
+
+        actual = io.StringIO()
+        with DatasetWriter(actual) as writer:
+            writer.write_nodes(np.array([1, 2, 3]), kind="a")
+            writer.write_edges(
+                self.rows, ({"label": label} for label in self.labels), time=self.time
+            )
+            writer.write_edges(
+                HyperedgeTable.from_rows(self.rows, labels=self.labels),
+                label_key="label",
+                time=self.time,
+            )
+
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def test_output_is_flushed_in_chunks(self) -> None:
+        """Write to the file once per filled chunk and once when closing."""
+        file = _CountingFile()
+        with DatasetWriter(file, chunk_size=50) as writer:
+            writer.write_edges(self.rows * 10)
+            num_writes = file.num_writes
+
+        self.assertGreater(num_writes, 1)
+        self.assertLess(num_writes, 40)
+        self.assertEqual(file.getvalue().count("\n"), 40)
+
+    def test_repeated_payloads_are_served_from_the_cache(self) -> None:
+        """Encode each distinct payload once and count the cache hits."""
+        actual = io.StringIO()
+        with DatasetWriter(actual) as writer:
+            for row, label in zip(self.rows * 5, self.labels * 5, strict=True):
+                writer.write_edge(row, label=label)
+
+        expected = io.StringIO()
+        for row, label in zip(self.rows * 5, self.labels * 5, strict=True):
+            write_edge(expected, row, label=label)
+
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+        info = writer.cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (17, 3, 3))
+        self.assertAlmostEqual(info.hit_rate, 0.85)
+
+    def test_payload_cache_distinguishes_types_and_is_bounded(self) -> None:
+        """Keep equal values of different types apart and evict old payloads."""
+        actual = io.StringIO()
+        with DatasetWriter(actual, payload_cache_size=2) as writer:
+            for value in [1, True, 1, "1", None, -0.0, 0.0]:
+                writer.write_node(0, value=value)
+
+        self.assertEqual(
+            actual.getvalue().splitlines(),
+            [
+                f'0 {{"value": {value}}}'
+                for value in ["1", "true", "1", '"1"', "null", "-0.0", "0.0"]
+            ],
+        )
+        info = writer.cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (1, 4, 2))
+
+    def test_labels_require_a_table(self) -> None:
+        """Reject a label key for edges that are not a table."""
+        with self.assertRaises(ValueError):
+            DatasetWriter(io.StringIO()).write_edges(self.rows, label_key="label")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Tests for the frontmatter utilities."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+from scripts.utils.write import update_frontmatter_many, write_markdown
+from scripts.utils.yaml import Dumper, dump_frontmatter, patch_dumper, read_frontmatter
+
+
+class FrontmatterTests(unittest.TestCase):
+    """Load frontmatter with libyaml and dump it with the pure-Python dumper."""
+
+    def setUp(self) -> None:
+        """Create frontmatter with nested sequences, long lines and multiline text."""
+        patch_dumper()
+        self.frontmatter = {
+            "title": "Dataset",
+            "tags": ["domain: social", "source: benson"],
+            "citation": ["@article{key,\n  title = {Title},\n}"],
+            "attachments": {
+                "revision-1": {
+                    "ahorn": "dataset.txt.gz",
+                    "changelog": ["Dropped hyperedges with only a single node. " * 3],
+                },
+            },
+            "shape": {"2013-12-02 11:00:00": [281, 821, [150, 8]], "empty": []},
+            "statistics": {"node-degrees": {1: 10, 2: 4}, "edge-degrees": {}},
+            "description": "x " * 60,
+        }
+
+    def test_dump_matches_dumper(self) -> None:
+        """Indent sequences in mappings and wrap long lines like ``Dumper``."""
+        expected = yaml.dump(self.frontmatter, sort_keys=False, Dumper=Dumper)
+        self.assertEqual(dump_frontmatter(self.frontmatter), expected)
+        self.assertIn("tags:\n  - 'domain: social'\n", expected)
+        self.assertIn("  - |-\n    @article{key,\n", expected)
+
+    def test_keep_chomped_scalars_have_no_document_end(self) -> None:
+        """Write no end-of-document marker after multiline text with trailing lines."""
+        frontmatter = {"a": "x\n\n", "b": 1}
+        self.assertEqual(dump_frontmatter(frontmatter), "a: |+\n  x\n\nb: 1\n")
+        markdown = f"---\n{dump_frontmatter(frontmatter)}---\nbody\n"
+        self.assertEqual(read_frontmatter(markdown), (frontmatter, "body\n"))
+
+    def test_aliases_match_dumper(self) -> None:
+        """Dump shared objects with anchors as ``Dumper`` does."""
+        shared = [1, 2]
+        frontmatter = {"first": shared, "second": {"third": shared}}
+        expected = yaml.dump(frontmatter, sort_keys=False, Dumper=Dumper)
+        self.assertEqual(dump_frontmatter(frontmatter), expected)
+
+    def test_round_trip(self) -> None:
+        """Read back the dumped frontmatter and body."""
+        markdown = f"---\n{dump_frontmatter(self.frontmatter)}---\nbody\n"
+        self.assertEqual(read_frontmatter(markdown), (self.frontmatter, "body\n"))
+
+    def test_batched_updates(self) -> None:
+        """Apply several updates per file in order, merging the attachments."""
+        with tempfile.TemporaryDirectory() as directory:
+            first, second = Path(directory) / "a.mdx", Path(directory) / "b.mdx"
+            for path in (first, second):
+                write_markdown(path, {"title": path.stem}, "body\n")
+
+            update_frontmatter_many(
+                [
+                    (first, {"attachments": {"revision-1": {"ahorn": "a.txt"}}}),
+                    (str(second), {"statistics": {"num-nodes": 1}}),
+                    (first, {"attachments": {"revision-2": {"ahorn": "a.txt.gz"}}}),
+                    (first, {"statistics": {"num-nodes": 2}}),
+                ]
+            )
+
+            self.assertEqual(
+                read_frontmatter(first.read_text()),
+                (
+                    {
+                        "title": "a",
+                        "attachments": {
+                            "revision-1": {"ahorn": "a.txt"},
+                            "revision-2": {"ahorn": "a.txt.gz"},
+                        },
+                        "statistics": {"num-nodes": 2},
+                    },
+                    "body\n",
+                ),
+            )
+            self.assertEqual(
+                read_frontmatter(second.read_text())[0],
+                {"title": "b", "statistics": {"num-nodes": 1}},
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()